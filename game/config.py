@@ -4,6 +4,24 @@ SCREEN_HEIGHT = 720
 SCREEN_TITLE = "System Override"
 TARGET_FPS = 60
 
+# Gameplay runs in fixed ticks, independent of the render rate. The
+# per-tick constants below (speeds, gravity, jump hold frames) are tuned
+# for 60 ticks per second.
+SIMULATION_RATE = 60
+# Most ticks run in one frame before the simulation drops time (spiral of death)
+MAX_SIMULATION_STEPS = 5
+# Player physics sub-steps per tick, so fast falls do not pass through thin
+# platforms; the path through open air stays that of a single step
+PHYSICS_SUBSTEPS = 2
+# Cap on drawing; gameplay speed does not depend on it
+RENDER_FPS = TARGET_FPS
+# Frame rate while paused; the level behind the menu is a frozen snapshot
+PAUSED_RENDER_FPS = 15
+# Enemies and moving platforms further than this outside the view sleep
+ACTIVITY_MARGIN = 256
+# Draw walls, hazards and background tiles from cached offscreen tiles
+STATIC_GEOMETRY_CACHE = False
+
 GRAVITY = 1.0
 PLAYER_MOVE_SPEED = 6
 PLAYER_JUMP_SPEED = 18
@@ -18,7 +36,16 @@ CAMERA_PAN_SPEED = 0.1
 CAMERA_ZOOM = 1.0
 
 DATA_FILE_PATH = "data/game_data.json"
+# Profiler session dumps (F4 in game, with the F3 overlay on)
+PROFILE_DIR = "data/profiles"
+# Level-select thumbnails, made on first view
+THUMBNAIL_DIR = "data/thumbnails"
+# Compiled TMX levels (see game.levels.level_cache)
+LEVEL_CACHE_DIR = "data/level_cache"
 ASSETS_PATH = "assets"
+# Threads decoding images and sounds in the background at startup
+ASSET_WORKERS = 2
+MENU_BACKGROUND = "assets/backgrounds/menu_background.jpg"
 SOUND_PATH = "assets/audio"
 SFX_COIN = "assets/audio/coin.wav"
 SFX_JUMP = "assets/audio/jump.wav"
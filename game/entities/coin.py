@@ -1,8 +1,13 @@
 import arcade
 
+from game.systems.textures import SHAPE_SOFT_CIRCLE, texture_registry
+
+
+COIN_TEXTURE = (SHAPE_SOFT_CIRCLE, 18, arcade.color.GOLD, 255, 0)
+
 
 class Coin(arcade.Sprite):
     def __init__(self):
         super().__init__()
-        self.texture = arcade.make_soft_circle_texture(18, arcade.color.GOLD, 255, 0)
+        self.texture = texture_registry.get(*COIN_TEXTURE)
         self.value = 10
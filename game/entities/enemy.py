@@ -3,16 +3,39 @@ import random
 
 import arcade
 
+from game.systems.motion import ping_pong
+from game.systems.textures import SHAPE_SOFT_SQUARE, texture_registry
+
+
+ENEMY_SIZE = 28
+ENEMY_COLORS = (
+    arcade.color.RED,
+    arcade.color.ORANGE_RED,
+    arcade.color.PURPLE,
+    arcade.color.AIR_FORCE_BLUE,
+)
+ENEMY_TEXTURES = tuple((SHAPE_SOFT_SQUARE, ENEMY_SIZE, color, 255, 0) for color in ENEMY_COLORS)
+
 
 class Enemy(arcade.Sprite):
+    # Whether the enemy may be frozen while far from the view (see game.systems.activity)
+    can_sleep = True
+
     def __init__(self, color=arcade.color.RED):
         super().__init__()
-        self.texture = arcade.make_soft_square_texture(28, color, 255, 0)
+        self.texture = texture_registry.soft_square(ENEMY_SIZE, color)
         self.damage = 1
 
     def update_ai(self, delta_time: float):
         pass
 
+    def reach(self):
+        """(left, right, bottom, top) the enemy stays inside while asleep."""
+        return (self.left, self.right, self.bottom, self.top)
+
+    def advance_asleep(self, ticks: int, delta_time: float):
+        """Catch up on ``ticks`` skipped updates when woken; default stays put."""
+
     def update(self, delta_time: float = 1 / 60):
         self.update_ai(delta_time)
         super().update()
@@ -26,8 +49,29 @@ class PatrolEnemy(Enemy):
         self.change_x = speed
 
     def update_ai(self, delta_time: float):
-        if self.center_x <= self.left_bound or self.center_x >= self.right_bound:
-            self.change_x *= -1
+        # Reflect any overshoot back inside the bounds, as ping_pong does, so
+        # advance_asleep lands exactly where staying awake would have
+        if self.center_x > self.right_bound:
+            self.center_x = 2 * self.right_bound - self.center_x
+            self.change_x = -abs(self.change_x)
+        elif self.center_x < self.left_bound:
+            self.center_x = 2 * self.left_bound - self.center_x
+            self.change_x = abs(self.change_x)
+
+    def reach(self):
+        half_width = self.width / 2
+        return (
+            min(self.left, self.left_bound - half_width),
+            max(self.right, self.right_bound + half_width),
+            self.bottom,
+            self.top,
+        )
+
+    def advance_asleep(self, ticks: int, delta_time: float):
+        # Awake, change_x is applied twice a tick: by update() and by EnemyPhysics
+        self.center_x, self.change_x = ping_pong(
+            self.center_x, self.change_x, self.left_bound, self.right_bound, 2 * ticks
+        )
 
 
 class JumpingEnemy(Enemy):
@@ -51,6 +95,9 @@ class JumpingEnemy(Enemy):
 
 
 class FlyingEnemy(Enemy):
+    # Flies on forever, so it has no bounded region to sleep in
+    can_sleep = False
+
     def __init__(self, amplitude: float = 40.0, speed: float = 2.5):
         super().__init__(arcade.color.AIR_FORCE_BLUE)
         self.amplitude = amplitude
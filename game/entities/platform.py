@@ -2,5 +2,38 @@ import arcade
 
 
 class Platform(arcade.SpriteSolidColor):
+    # How far a body resting on the platform is carried this tick
+    carry_x = 0.0
+    carry_y = 0.0
+
     def __init__(self, width: int = 128, height: int = 24, color=arcade.color.GRAY):
         super().__init__(width, height, color)
+
+
+class MovingPlatform(Platform):
+    """A platform whose position is a function of the simulation tick.
+
+    ``path`` is any object with ``position(tick)`` and ``bounds()`` (see
+    game.systems.motion). The platform has no velocity of its own, so the
+    physics engine treats it as a wall and never moves it.
+    """
+
+    def __init__(self, path, width: int = 128, height: int = 24, color=arcade.color.GRAY):
+        super().__init__(width, height, color)
+        self.path = path
+        self.position = path.position(0)
+
+    def follow(self, tick: int):
+        """Go to the path's position at ``tick``, carrying riders by the last step."""
+        x, y = self.path.position(tick)
+        last_x, last_y = self.path.position(tick - 1)
+        self.position = (x, y)
+        self.carry_x = x - last_x
+        self.carry_y = y - last_y
+
+    def reach(self):
+        """Rectangle the platform can cover anywhere along its path."""
+        left, right, bottom, top = self.path.bounds()
+        half_width = self.width / 2
+        half_height = self.height / 2
+        return (left - half_width, right + half_width, bottom - half_height, top + half_height)
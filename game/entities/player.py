@@ -1,6 +1,19 @@
 import arcade
 from pathlib import Path
 import enum
+import threading
+from typing import Dict, List, Optional
+
+from game.systems.assets import asset_manager
+from game.systems.textures import SHAPE_SOFT_SQUARE, texture_registry
+
+
+# Shown when the animation frames are missing
+PLAYER_FALLBACK_TEXTURE = (SHAPE_SOFT_SQUARE, 32, arcade.color.BLUE, 255, 0)
+
+ANIMATION_PATH = "assets/player/anim"
+ANIMATION_CLIPS = ("idle", "walking", "jump", "fall")
+MAX_CLIP_FRAMES = 10
 
 
 class FaceDirection(enum.Enum):
@@ -9,6 +22,57 @@ class FaceDirection(enum.Enum):
     RIGHT = 1
 
 
+def animation_frame_paths(root: str = ANIMATION_PATH) -> Dict[str, List[str]]:
+    """Frame files of every clip, in order; a clip without frames is empty."""
+    paths = {}
+    for name in ANIMATION_CLIPS:
+        clip_path = Path(root) / name
+        paths[name] = [
+            str(clip_path / f"{i}.png")
+            for i in range(MAX_CLIP_FRAMES)
+            if (clip_path / f"{i}.png").exists()
+        ]
+    return paths
+
+
+class PlayerAnimationBank:
+    """Every player clip loaded once, with a mirrored copy for facing left."""
+
+    def __init__(self, root: str = ANIMATION_PATH):
+        self.frames: Dict[str, Dict[FaceDirection, List[arcade.Texture]]] = {}
+        for name, paths in animation_frame_paths(root).items():
+            # Decoded in the background since startup; waits only if still in flight
+            right = [texture for texture in map(asset_manager.wait, paths) if texture is not None]
+            left = [texture.flip_horizontally() for texture in right]
+            self.frames[name] = {FaceDirection.RIGHT: right, FaceDirection.LEFT: left}
+
+    def clip(
+        self, name: str, direction: FaceDirection = FaceDirection.RIGHT
+    ) -> List[arcade.Texture]:
+        return self.frames[name][direction]
+
+    def textures(self) -> List[arcade.Texture]:
+        return [
+            texture
+            for table in self.frames.values()
+            for frames in table.values()
+            for texture in frames
+        ]
+
+
+_animation_bank: Optional[PlayerAnimationBank] = None
+_animation_lock = threading.Lock()
+
+
+def player_animations() -> PlayerAnimationBank:
+    """The process-wide animation bank, loaded on first use."""
+    global _animation_bank
+    with _animation_lock:
+        if _animation_bank is None:
+            _animation_bank = PlayerAnimationBank()
+        return _animation_bank
+
+
 class Player(arcade.Sprite):
     def __init__(self, x: float = 100, y: float = 150, scale: float = 1.5):
         super().__init__()
@@ -17,43 +81,12 @@ class Player(arcade.Sprite):
         self.speed = 300
         self.health = 100
 
-        # Load animations
-        self.idle_textures = []
-        self.walking_textures = []
-        self.jump_textures = []
-        self.fall_textures = []
-
-        # Load idle animation
-        idle_path = Path("assets/player/anim/idle")
-        if idle_path.exists():
-            for i in range(10):
-                frame_path = idle_path / f"{i}.png"
-                if frame_path.exists():
-                    self.idle_textures.append(arcade.load_texture(str(frame_path)))
-
-        # Load walking animation
-        walking_path = Path("assets/player/anim/walking")
-        if walking_path.exists():
-            for i in range(10):
-                frame_path = walking_path / f"{i}.png"
-                if frame_path.exists():
-                    self.walking_textures.append(arcade.load_texture(str(frame_path)))
-
-        # Load jump animation
-        jump_path = Path("assets/player/anim/jump")
-        if jump_path.exists():
-            for i in range(10):
-                frame_path = jump_path / f"{i}.png"
-                if frame_path.exists():
-                    self.jump_textures.append(arcade.load_texture(str(frame_path)))
-
-        # Load fall animation
-        fall_path = Path("assets/player/anim/fall")
-        if fall_path.exists():
-            for i in range(10):
-                frame_path = fall_path / f"{i}.png"
-                if frame_path.exists():
-                    self.fall_textures.append(arcade.load_texture(str(frame_path)))
+        # Frames are shared by every Player; see PlayerAnimationBank
+        self.animations = player_animations()
+        self.idle_textures = self.animations.clip("idle")
+        self.walking_textures = self.animations.clip("walking")
+        self.jump_textures = self.animations.clip("jump")
+        self.fall_textures = self.animations.clip("fall")
 
         # Set default texture
         if self.idle_textures:
@@ -61,9 +94,7 @@ class Player(arcade.Sprite):
         elif self.walking_textures:
             self.texture = self.walking_textures[0]
         else:
-            self.texture = arcade.make_soft_square_texture(
-                32, arcade.color.BLUE, 255, 0
-            )
+            self.texture = texture_registry.get(*PLAYER_FALLBACK_TEXTURE)
 
         self.current_frame = 0
         self.frame_counter = 0.0
@@ -83,30 +114,27 @@ class Player(arcade.Sprite):
         self.frame_counter += delta_time
 
         # Determine which animation to use
-        current_textures = None
-        
+        clip = None
+
         # Priority: jump > fall > walking > idle
         if self.is_jumping and self.jump_textures:
-            current_textures = self.jump_textures
+            clip = "jump"
         elif self.is_falling and self.fall_textures:
-            current_textures = self.fall_textures
+            clip = "fall"
         elif self.is_walking and self.walking_textures:
-            current_textures = self.walking_textures
+            clip = "walking"
         elif self.idle_textures:
-            current_textures = self.idle_textures
+            clip = "idle"
         elif self.walking_textures:
-            current_textures = self.walking_textures
-        
+            clip = "walking"
+
         # Update frame
-        if current_textures and self.frame_counter >= self.frame_duration:
+        if clip and self.frame_counter >= self.frame_duration:
             self.frame_counter = 0.0
+            # Mirrored frames are precomputed, so facing left allocates nothing
+            current_textures = self.animations.clip(clip, self.face_direction)
             self.current_frame = (self.current_frame + 1) % len(current_textures)
-            
-            # Apply texture with correct facing direction
-            if self.face_direction == FaceDirection.RIGHT:
-                self.texture = current_textures[self.current_frame]
-            else:
-                self.texture = current_textures[self.current_frame].flip_horizontally()
+            self.texture = current_textures[self.current_frame]
 
     def update(self, delta_time: float = 1 / 60, keys_pressed: set | None = None):
         if not keys_pressed:
@@ -1,10 +1,16 @@
 import arcade
 
+from game.systems.textures import SHAPE_SOFT_SQUARE, texture_registry
+
+
+UI_BUTTON_SIZE = 160
+UI_BUTTON_TEXTURE = (SHAPE_SOFT_SQUARE, UI_BUTTON_SIZE, arcade.color.GREEN, 255, 0)
+
 
 class UIButton(arcade.Sprite):
     def __init__(self, label: str, color=arcade.color.GREEN):
         super().__init__()
-        self.texture = arcade.make_soft_square_texture(160, color, 255, 0)
+        self.texture = texture_registry.soft_square(UI_BUTTON_SIZE, color)
         self.label = label
         self._label_text = None
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
@@ -9,7 +10,10 @@ from game.config import GRAVITY
 from game.entities.coin import Coin
 from game.entities.enemy import JumpingEnemy, PatrolEnemy
 from game.entities.hazard import Hazard
-from game.entities.platform import Platform
+from game.entities.platform import MovingPlatform, Platform
+from game.systems.enemy_physics import EnemyPhysics
+from game.systems.motion import PingPongPath, WaypointPath
+from game.systems.spatial import SpatialHash
 
 
 @dataclass
@@ -19,6 +23,7 @@ class PlatformSpec:
     width: int
     height: int
     color: arcade.Color
+    visible: bool = True
 
 
 @dataclass
@@ -29,6 +34,22 @@ class MovingPlatformSpec(PlatformSpec):
     boundary_right: Optional[float] = None
     boundary_bottom: Optional[float] = None
     boundary_top: Optional[float] = None
+    # Follow these points at hypot(change_x, change_y) per tick instead of
+    # bouncing between the boundaries
+    waypoints: List[Tuple[float, float]] = field(default_factory=list)
+    loop: bool = False
+
+
+def platform_path(spec: MovingPlatformSpec):
+    """The path a moving platform built from ``spec`` follows."""
+    if spec.waypoints:
+        return WaypointPath(spec.waypoints, math.hypot(spec.change_x, spec.change_y), spec.loop)
+    x_limits = y_limits = None
+    if spec.boundary_left is not None and spec.boundary_right is not None:
+        x_limits = (spec.boundary_left + spec.width / 2, spec.boundary_right - spec.width / 2)
+    if spec.boundary_bottom is not None and spec.boundary_top is not None:
+        y_limits = (spec.boundary_bottom + spec.height / 2, spec.boundary_top - spec.height / 2)
+    return PingPongPath((spec.x, spec.y), (spec.change_x, spec.change_y), x_limits, y_limits)
 
 
 @dataclass
@@ -72,6 +93,16 @@ class LevelSpec:
     visual_layers: dict = field(default_factory=dict)  # Tile layers for visuals
 
 
+@dataclass
+class LevelInfo:
+    """Lightweight description of a level that does not hold its geometry."""
+
+    level_id: int
+    source: str
+    time_limit: Optional[float] = None
+    requires_all_coins: bool = False
+
+
 class LevelBuilder:
     def __init__(self, view):
         self.view = view
@@ -90,6 +121,7 @@ class LevelBuilder:
             platform.center_y = platform_spec.y
             platform.color = platform_spec.color
             platform.alpha = 255
+            platform.visible = platform_spec.visible
             
             # Зеленые платформы - это финишные платформы
             if platform_spec.color in (arcade.color.LIME_GREEN, arcade.color.GREEN, arcade.color.DARK_GREEN):
@@ -98,26 +130,15 @@ class LevelBuilder:
             self.view.platform_list.append(platform)
 
         for moving_spec in spec.moving_platforms:
-            platform = Platform(
+            platform = MovingPlatform(
+                platform_path(moving_spec),
                 moving_spec.width,
                 moving_spec.height,
                 color=moving_spec.color,
             )
-            platform.center_x = moving_spec.x
-            platform.center_y = moving_spec.y
-            platform.change_x = moving_spec.change_x
-            platform.change_y = moving_spec.change_y
-            platform.boundary_left = moving_spec.boundary_left
-            platform.boundary_right = moving_spec.boundary_right
-            platform.boundary_bottom = moving_spec.boundary_bottom
-            platform.boundary_top = moving_spec.boundary_top
             platform.color = moving_spec.color
             platform.alpha = 255
             self.view.moving_platform_list.append(platform)
-            self.view._moving_platform_last_pos[platform] = (
-                platform.center_x,
-                platform.center_y,
-            )
 
         for coin_spec in spec.coins:
             coin = Coin()
@@ -138,23 +159,34 @@ class LevelBuilder:
             hazard.alpha = 255
             self.view.hazard_list.append(hazard)
 
-        self.view.enemy_physics_engines.clear()
         for enemy_spec in spec.enemies:
             enemy = self._build_enemy(enemy_spec)
             if enemy is None:
                 continue
             self.view.enemy_list.append(enemy)
-            self.view.enemy_physics_engines.append(
-                arcade.PhysicsEnginePlatformer(
-                    enemy,
-                    platforms=self.view.moving_platform_list,
-                    walls=self.view.platform_list,
-                    gravity_constant=spec.gravity_constant,
-                )
-            )
+
+        self._build_spatial_index()
+
+        # All enemies share one physics pass over the spatial indexes
+        self.view.enemy_physics = EnemyPhysics(
+            self.view.enemy_list,
+            obstacles=(self.view.platform_index, self.view.moving_platform_index),
+            gravity_constant=spec.gravity_constant,
+        )
 
         self.view.level_end_x = spec.end_x
-        self.view.hud.lives = self.view.lives
+
+    def _build_spatial_index(self):
+        """Index every collidable list once; moving ones are re-bucketed per frame."""
+        view = self.view
+        view.platform_index = SpatialHash.from_sprites(view.platform_list)
+        view.moving_platform_index = SpatialHash.from_sprites(view.moving_platform_list)
+        view.coin_index = SpatialHash.from_sprites(view.coin_list)
+        view.hazard_index = SpatialHash.from_sprites(view.hazard_list)
+        view.enemy_index = SpatialHash.from_sprites(view.enemy_list)
+        view.finish_index = SpatialHash.from_sprites(
+            getattr(view, "finish_platform_list", ())
+        )
 
     def _build_enemy(self, enemy_spec: EnemySpec):
         if enemy_spec.kind == "patrol":
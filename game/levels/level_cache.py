@@ -0,0 +1,602 @@
+"""
+Precompiled binary cache for TMX levels.
+
+TMXLevelLoader parses XML, walks every object's custom properties and
+builds the tile sprite lists through arcade.load_tilemap. The compiled
+form stores the finished LevelSpec as flat numeric arrays (object geometry,
+colours, tile GIDs) in a small versioned file under LEVEL_CACHE_DIR, keyed
+by a SHA-256 of the source and the tilesets and images it uses. Loading it
+is a handful of struct/array reads.
+
+Usage:
+    python -m game.levels.level_cache              # compile levels/tmx/*.tmx
+    python -m game.levels.level_cache --bench 20   # compare both load paths
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import io
+import math
+import re
+import struct
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Optional
+from xml.etree import ElementTree as ET
+
+import arcade
+
+from game.config import LEVEL_CACHE_DIR
+from game.levels.base import (
+    CoinSpec,
+    EnemySpec,
+    HazardSpec,
+    LevelSpec,
+    MovingPlatformSpec,
+    PlatformSpec,
+)
+from game.levels.tmx_loader import VISUAL_LAYER_NAMES, TMXLevelLoader
+from game.systems.tile_chunks import ChunkedLayer
+
+
+CACHE_MAGIC = b"LVLC"
+CACHE_VERSION = 2
+CACHE_SUFFIX = ".lvlc"
+
+# Enemy params are stored positionally; the order here is the file format.
+ENEMY_PARAM_KEYS = {
+    "patrol": ("left_bound", "right_bound", "speed"),
+    "jumping": ("interval_min", "interval_max", "jump_strength"),
+    "flying": ("amplitude", "speed"),
+}
+
+_GID_FLAGS = 0xE0000000
+_FLIPPED_HORIZONTALLY = 0x80000000
+_FLIPPED_VERTICALLY = 0x40000000
+_FLIPPED_DIAGONALLY = 0x20000000
+
+_SWAP_BYTES = sys.byteorder != "little"
+
+
+class CacheFormatError(ValueError):
+    """Raised when a compiled level file is truncated or malformed."""
+
+
+def cache_path_for(tmx_path: str, cache_dir: Optional[str] = None) -> Path:
+    """Return where the compiled form of ``tmx_path`` lives.
+
+    The name carries a digest of the source's full path, so two maps with
+    the same file name in different folders do not share a cache file.
+    """
+    source = Path(tmx_path).resolve()
+    tag = hashlib.sha1(str(source).encode("utf-8")).hexdigest()[:12]
+    return Path(cache_dir or LEVEL_CACHE_DIR) / f"{source.stem}-{tag}{CACHE_SUFFIX}"
+
+
+def _tileset_files(tmx_path: Path, data: bytes) -> list[Path]:
+    """External .tsx files and tileset images ``tmx_path`` refers to.
+
+    Tiled writes tilesets before any layer, so parsing stops at the first
+    layer or object group.
+    """
+    files = []
+    for _, elem in ET.iterparse(io.BytesIO(data), events=("start",)):
+        if elem.tag in ("layer", "objectgroup", "imagelayer", "group"):
+            break
+        if elem.tag != "tileset":
+            continue
+        source = elem.get("source")
+        if source is None:
+            continue
+        tsx = tmx_path.parent / source
+        files.append(tsx)
+        try:
+            tsx_root = ET.parse(tsx).getroot()
+        except (ET.ParseError, OSError):
+            continue
+        for image in tsx_root.iter("image"):
+            if image.get("source"):
+                files.append(tsx.parent / image.get("source"))
+    return files
+
+
+def source_hash(tmx_path: str) -> bytes:
+    """Digest of the .tmx plus the .tsx files and images it uses.
+
+    Tilesets are hashed by content and images by size and modification
+    time, so editing any of them makes the cache stale.
+    """
+    path = Path(tmx_path)
+    data = path.read_bytes()
+    digest = hashlib.sha256(data)
+    try:
+        files = _tileset_files(path, data)
+    except ET.ParseError:
+        files = []
+    # Embedded tilesets name their images in the .tmx itself
+    for image in re.findall(rb'<image[^>]*\ssource="([^"]+)"', data):
+        files.append(path.parent / image.decode("utf-8"))
+    for file in files:
+        digest.update(str(file).encode("utf-8"))
+        try:
+            if file.suffix == ".tsx":
+                digest.update(file.read_bytes())
+            else:
+                stat = file.stat()
+                digest.update(struct.pack("<qd", stat.st_size, stat.st_mtime))
+        except OSError:
+            digest.update(b"missing")
+    return digest.digest()
+
+
+class _Writer:
+    def __init__(self):
+        self.parts = []
+
+    def pack(self, fmt: str, *values):
+        self.parts.append(struct.pack("<" + fmt, *values))
+
+    def string(self, value: str):
+        data = value.encode("utf-8")
+        self.pack("I", len(data))
+        self.parts.append(data)
+
+    def numbers(self, typecode: str, values):
+        data = array(typecode, values)
+        if _SWAP_BYTES:
+            data.byteswap()
+        self.pack("I", len(data))
+        self.parts.append(data.tobytes())
+
+    def getvalue(self) -> bytes:
+        return b"".join(self.parts)
+
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def unpack(self, fmt: str):
+        fmt = "<" + fmt
+        size = struct.calcsize(fmt)
+        if self.offset + size > len(self.data):
+            raise CacheFormatError("unexpected end of file")
+        values = struct.unpack_from(fmt, self.data, self.offset)
+        self.offset += size
+        return values
+
+    def string(self) -> str:
+        (length,) = self.unpack("I")
+        return bytes(self._take(length)).decode("utf-8")
+
+    def numbers(self, typecode: str) -> array:
+        (count,) = self.unpack("I")
+        values = array(typecode)
+        values.frombytes(self._take(count * values.itemsize))
+        if _SWAP_BYTES:
+            values.byteswap()
+        return values
+
+    def _take(self, size: int):
+        if self.offset + size > len(self.data):
+            raise CacheFormatError("unexpected end of file")
+        chunk = self.data[self.offset : self.offset + size]
+        self.offset += size
+        return chunk
+
+
+def _optional(value: Optional[float]) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _from_optional(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+def _write_colors(writer: _Writer, colors):
+    channels = max((len(color) for color in colors), default=3)
+    writer.pack("B", channels)
+    flat = []
+    for color in colors:
+        padded = list(color) + [255] * (channels - len(color))
+        flat.extend(int(c) for c in padded[:channels])
+    writer.numbers("B", flat)
+
+
+def _read_colors(reader: _Reader):
+    (channels,) = reader.unpack("B")
+    flat = reader.numbers("B")
+    return [tuple(flat[i : i + channels]) for i in range(0, len(flat), channels)]
+
+
+def encode_level(
+    spec: LevelSpec,
+    source_digest: bytes,
+    tilesets: list[dict] = (),
+    tile_layers: list[dict] = (),
+) -> bytes:
+    """Serialize a LevelSpec plus its raw tile data into the cache format."""
+    writer = _Writer()
+    writer.parts.append(CACHE_MAGIC)
+    writer.pack("H", CACHE_VERSION)
+    writer.parts.append(source_digest)
+
+    writer.pack(
+        "iddddd?",
+        spec.level_id,
+        spec.spawn_point[0],
+        spec.spawn_point[1],
+        spec.end_x,
+        spec.gravity_constant,
+        _optional(spec.time_limit),
+        spec.requires_all_coins,
+    )
+
+    geometry = []
+    for platform in spec.platforms:
+        geometry.extend((platform.x, platform.y, platform.width, platform.height))
+    writer.numbers("d", geometry)
+    _write_colors(writer, [platform.color for platform in spec.platforms])
+    writer.numbers("B", [platform.visible for platform in spec.platforms])
+
+    geometry = []
+    for platform in spec.moving_platforms:
+        geometry.extend(
+            (
+                platform.x,
+                platform.y,
+                platform.width,
+                platform.height,
+                platform.change_x,
+                platform.change_y,
+                _optional(platform.boundary_left),
+                _optional(platform.boundary_right),
+                _optional(platform.boundary_bottom),
+                _optional(platform.boundary_top),
+            )
+        )
+    writer.numbers("d", geometry)
+    _write_colors(writer, [platform.color for platform in spec.moving_platforms])
+
+    geometry = []
+    for coin in spec.coins:
+        geometry.extend((coin.x, coin.y))
+    writer.numbers("d", geometry)
+
+    geometry = []
+    for hazard in spec.hazards:
+        geometry.extend((hazard.x, hazard.y, hazard.width, hazard.height, hazard.damage))
+    writer.numbers("d", geometry)
+    _write_colors(writer, [hazard.color for hazard in spec.hazards])
+
+    writer.pack("I", len(spec.enemies))
+    for enemy in spec.enemies:
+        keys = ENEMY_PARAM_KEYS.get(enemy.kind, ())
+        writer.string(enemy.kind)
+        writer.numbers(
+            "d",
+            (enemy.x, enemy.y, *(_optional(enemy.params.get(key)) for key in keys)),
+        )
+
+    writer.pack("I", len(tilesets))
+    for tileset in tilesets:
+        writer.pack(
+            "IIIIII",
+            tileset["firstgid"],
+            tileset["tile_width"],
+            tileset["tile_height"],
+            tileset["columns"],
+            tileset["spacing"],
+            tileset["margin"],
+        )
+        writer.string(tileset["image"])
+
+    writer.pack("I", len(tile_layers))
+    for layer in tile_layers:
+        writer.string(layer["name"])
+        writer.pack("IIf?", layer["width"], layer["height"], layer["opacity"], layer["visible"])
+        writer.numbers("I", layer["gids"])
+
+    return writer.getvalue()
+
+
+def decode_level(data: bytes, expected_digest: Optional[bytes] = None):
+    """
+    Decode a compiled level.
+
+    Returns:
+        (LevelSpec, tilesets, tile_layers), or None when the file was
+        written by another format version or for different source bytes
+    """
+    reader = _Reader(data)
+    if bytes(reader._take(len(CACHE_MAGIC))) != CACHE_MAGIC:
+        raise CacheFormatError("not a compiled level")
+    (version,) = reader.unpack("H")
+    digest = bytes(reader._take(32))
+    if version != CACHE_VERSION:
+        return None
+    if expected_digest is not None and digest != expected_digest:
+        return None
+
+    (
+        level_id,
+        spawn_x,
+        spawn_y,
+        end_x,
+        gravity,
+        time_limit,
+        requires_all_coins,
+    ) = reader.unpack("iddddd?")
+
+    geometry = reader.numbers("d")
+    colors = _read_colors(reader)
+    visible = reader.numbers("B")
+    platforms = [
+        PlatformSpec(
+            x=geometry[i * 4],
+            y=geometry[i * 4 + 1],
+            width=int(geometry[i * 4 + 2]),
+            height=int(geometry[i * 4 + 3]),
+            color=colors[i],
+            visible=bool(visible[i]),
+        )
+        for i in range(len(colors))
+    ]
+
+    geometry = reader.numbers("d")
+    colors = _read_colors(reader)
+    moving_platforms = []
+    for i in range(len(colors)):
+        values = geometry[i * 10 : i * 10 + 10]
+        moving_platforms.append(
+            MovingPlatformSpec(
+                x=values[0],
+                y=values[1],
+                width=int(values[2]),
+                height=int(values[3]),
+                color=colors[i],
+                change_x=values[4],
+                change_y=values[5],
+                boundary_left=_from_optional(values[6]),
+                boundary_right=_from_optional(values[7]),
+                boundary_bottom=_from_optional(values[8]),
+                boundary_top=_from_optional(values[9]),
+            )
+        )
+
+    geometry = reader.numbers("d")
+    coins = [CoinSpec(x=geometry[i], y=geometry[i + 1]) for i in range(0, len(geometry), 2)]
+
+    geometry = reader.numbers("d")
+    colors = _read_colors(reader)
+    hazards = [
+        HazardSpec(
+            x=geometry[i * 5],
+            y=geometry[i * 5 + 1],
+            width=int(geometry[i * 5 + 2]),
+            height=int(geometry[i * 5 + 3]),
+            damage=int(geometry[i * 5 + 4]),
+            color=colors[i],
+        )
+        for i in range(len(colors))
+    ]
+
+    enemies = []
+    (enemy_count,) = reader.unpack("I")
+    for _ in range(enemy_count):
+        kind = reader.string()
+        values = reader.numbers("d")
+        params = {}
+        for key, value in zip(ENEMY_PARAM_KEYS.get(kind, ()), values[2:]):
+            if not math.isnan(value):
+                params[key] = value
+        enemies.append(EnemySpec(kind=kind, x=values[0], y=values[1], params=params))
+
+    tilesets = []
+    (tileset_count,) = reader.unpack("I")
+    for _ in range(tileset_count):
+        firstgid, tile_width, tile_height, columns, spacing, margin = reader.unpack("IIIIII")
+        tilesets.append(
+            {
+                "firstgid": firstgid,
+                "image": reader.string(),
+                "tile_width": tile_width,
+                "tile_height": tile_height,
+                "columns": columns,
+                "spacing": spacing,
+                "margin": margin,
+            }
+        )
+
+    tile_layers = []
+    (layer_count,) = reader.unpack("I")
+    for _ in range(layer_count):
+        name = reader.string()
+        width, height, opacity, visible = reader.unpack("IIf?")
+        tile_layers.append(
+            {
+                "name": name,
+                "width": width,
+                "height": height,
+                "opacity": opacity,
+                "visible": visible,
+                "gids": reader.numbers("I"),
+            }
+        )
+
+    spec = LevelSpec(
+        level_id=level_id,
+        spawn_point=(spawn_x, spawn_y),
+        platforms=platforms,
+        moving_platforms=moving_platforms,
+        coins=coins,
+        hazards=hazards,
+        enemies=enemies,
+        end_x=end_x,
+        physics="platformer",
+        gravity_constant=gravity,
+        requires_all_coins=requires_all_coins,
+        time_limit=_from_optional(time_limit),
+    )
+    return spec, tilesets, tile_layers
+
+
+def build_tile_layers(tilesets: list[dict], tile_layers: list[dict]) -> dict:
+    """
+    Rebuild chunked visual layers from cached GIDs.
+
+    Tiles are placed the same way arcade.load_tilemap places them: column
+    and row from the flat GID index, rows counted from the top of the map.
+    """
+    visual_layers = {}
+    ordered = sorted(tilesets, key=lambda tileset: tileset["firstgid"], reverse=True)
+
+    for layer in tile_layers:
+        if layer["name"] not in VISUAL_LAYER_NAMES:
+            continue
+        sprites = []
+        width = layer["width"]
+        height = layer["height"]
+
+        for index, raw_gid in enumerate(layer["gids"]):
+            if raw_gid == 0:
+                continue
+            gid = raw_gid & ~_GID_FLAGS
+            tileset = next((t for t in ordered if t["firstgid"] <= gid), None)
+            if tileset is None:
+                continue
+            tile_id = gid - tileset["firstgid"]
+            tile_width = tileset["tile_width"]
+            tile_height = tileset["tile_height"]
+            texture = arcade.texture.default_texture_cache.load_or_get_texture(
+                tileset["image"],
+                x=tileset["margin"] + (tile_id % tileset["columns"]) * (tile_width + tileset["spacing"]),
+                y=tileset["margin"] + (tile_id // tileset["columns"]) * (tile_height + tileset["spacing"]),
+                width=tile_width,
+                height=tile_height,
+            )
+            if raw_gid & _FLIPPED_DIAGONALLY:
+                texture = texture.flip_diagonally()
+            if raw_gid & _FLIPPED_HORIZONTALLY:
+                texture = texture.flip_horizontally()
+            if raw_gid & _FLIPPED_VERTICALLY:
+                texture = texture.flip_vertically()
+
+            sprite = arcade.Sprite(texture)
+            column = index % width
+            row = index // width
+            sprite.center_x = column * tile_width + sprite.width / 2
+            sprite.center_y = (height - row - 1) * tile_height + sprite.height / 2
+            sprite.alpha = int(layer["opacity"] * 255)
+            sprites.append(sprite)
+
+        visual_layers[layer["name"]] = ChunkedLayer(sprites, visible=layer["visible"])
+    return visual_layers
+
+
+def compile_level(tmx_path: str) -> Optional[LevelSpec]:
+    """Parse ``tmx_path`` the slow way and write its compiled form to the cache."""
+    loader = TMXLevelLoader(tmx_path)
+    spec = loader.load()
+    if spec is None:
+        return None
+
+    data = encode_level(
+        spec,
+        source_hash(tmx_path),
+        loader.tileset_data(),
+        loader.tile_layer_data(),
+    )
+    cache_path = cache_path_for(tmx_path)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(data)
+        # Compiles of an edited, moved or copied map would otherwise pile up
+        stem = Path(tmx_path).stem
+        for old in cache_path.parent.glob(f"{stem}-*{CACHE_SUFFIX}"):
+            if old != cache_path and old.stem.rsplit("-", 1)[0] == stem:
+                old.unlink()
+    except OSError as e:
+        print(f"Could not write level cache for {Path(tmx_path).name}: {e}")
+    return spec
+
+
+def load_compiled_level(tmx_path: str) -> Optional[LevelSpec]:
+    """Load a level from its compiled form, or None if it is missing or stale."""
+    cache_path = cache_path_for(tmx_path)
+    if not cache_path.exists():
+        return None
+    try:
+        decoded = decode_level(cache_path.read_bytes(), source_hash(tmx_path))
+    except (CacheFormatError, OSError) as e:
+        print(f"Ignoring broken level cache {cache_path.name}: {e}")
+        return None
+    if decoded is None:
+        return None
+
+    spec, tilesets, tile_layers = decoded
+    spec.visual_layers = build_tile_layers(tilesets, tile_layers)
+    return spec
+
+
+def load_level(tmx_path: str) -> Optional[LevelSpec]:
+    """Load a TMX level through its cache, compiling it on first use."""
+    spec = load_compiled_level(tmx_path)
+    if spec is not None:
+        return spec
+    return compile_level(tmx_path)
+
+
+def benchmark(tmx_paths: list[str], iterations: int = 10):
+    """Print average load time of the TMX path versus the compiled path."""
+    print(f"{'level':<32}{'tmx ms':>10}{'cache ms':>10}{'speedup':>10}")
+    for tmx_path in tmx_paths:
+        compile_level(tmx_path)
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            TMXLevelLoader(tmx_path).load()
+        tmx_ms = (time.perf_counter() - start) * 1000 / iterations
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            load_compiled_level(tmx_path)
+        cache_ms = (time.perf_counter() - start) * 1000 / iterations
+
+        speedup = tmx_ms / cache_ms if cache_ms else float("inf")
+        print(f"{Path(tmx_path).name:<32}{tmx_ms:>10.2f}{cache_ms:>10.2f}{speedup:>9.1f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile TMX levels into binary caches.")
+    parser.add_argument("paths", nargs="*", help="TMX files (default: levels/tmx/*.tmx)")
+    parser.add_argument(
+        "--bench",
+        type=int,
+        metavar="N",
+        help="benchmark TMX vs cached loading over N iterations",
+    )
+    args = parser.parse_args(argv)
+
+    paths = args.paths or [str(path) for path in sorted(Path("levels/tmx").glob("*.tmx"))]
+    if args.bench:
+        benchmark(paths, args.bench)
+        return 0
+
+    failed = 0
+    for tmx_path in paths:
+        spec = compile_level(tmx_path)
+        if spec is None:
+            failed += 1
+            continue
+        print(f"Compiled level {spec.level_id}: {tmx_path} -> {cache_path_for(tmx_path)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""
+Cached registry of every playable level.
+
+Python levels are built once and kept. TMX levels are indexed from their
+header properties only (see tmx_index) and fully loaded the first time
+they are played; both are cached per file and refreshed only when the
+file's modification time changes. Full loads go through the compiled
+level cache (see level_cache).
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from game.levels.base import LevelInfo, LevelSpec
+from game.levels.level1 import build_level as build_level_one
+from game.levels.level2 import build_level as build_level_two
+from game.levels.level3 import build_level as build_level_three
+from game.levels.level_cache import load_level
+from game.levels.tmx_index import read_tmx_header
+
+
+TMX_FOLDER = "levels/tmx"
+
+PYTHON_LEVELS: Dict[int, Callable[[], LevelSpec]] = {
+    1: build_level_one,
+    2: build_level_two,
+    3: build_level_three,
+}
+
+
+@dataclass
+class _TMXEntry:
+    mtime: float
+    info: Optional[LevelInfo]
+    spec: Optional[LevelSpec] = None
+
+
+class LevelRegistry:
+    """Caches LevelSpecs and answers id/metadata queries without rebuilding.
+
+    Safe to share with the level prefetch thread: public methods hold a lock.
+    """
+
+    def __init__(
+        self,
+        tmx_folder: str = TMX_FOLDER,
+        python_levels: Optional[Dict[int, Callable[[], LevelSpec]]] = None,
+    ):
+        self.tmx_folder = Path(tmx_folder)
+        self.python_levels = dict(PYTHON_LEVELS if python_levels is None else python_levels)
+        self._python_specs: Dict[int, LevelSpec] = {}
+        self._tmx_entries: Dict[Path, _TMXEntry] = {}
+        self._tmx_by_id: Dict[int, Path] = {}
+        self._scanned = False
+        self._lock = threading.RLock()
+
+    def level_ids(self) -> List[int]:
+        """Return every known level id in ascending order."""
+        with self._lock:
+            self._scan_tmx_folder()
+            return sorted(set(self.python_levels) | set(self._tmx_by_id))
+
+    def max_level_id(self) -> int:
+        ids = self.level_ids()
+        return ids[-1] if ids else 0
+
+    def info(self, level_id: int) -> Optional[LevelInfo]:
+        """Return metadata for a level, or None if it does not exist."""
+        with self._lock:
+            self._scan_tmx_folder()
+            path = self._tmx_by_id.get(level_id)
+            if path is not None:
+                return self._tmx_entries[path].info
+            if level_id in self.python_levels:
+                spec = self._python_spec(level_id)
+                return LevelInfo(
+                    level_id=level_id,
+                    source="python",
+                    time_limit=spec.time_limit,
+                    requires_all_coins=spec.requires_all_coins,
+                )
+            return None
+
+    def get(self, level_id: int) -> Optional[LevelSpec]:
+        """Return the LevelSpec for ``level_id``, loading it only if needed.
+
+        The full TMX load runs outside the lock so id/metadata queries from
+        the UI thread never wait on a level being prefetched.
+        """
+        with self._lock:
+            path = self._tmx_by_id.get(level_id)
+            if not self._scanned or (path is not None and self._is_stale(path)):
+                self._scan_tmx_folder()
+                path = self._tmx_by_id.get(level_id)
+            if path is None:
+                if level_id in self.python_levels:
+                    return self._python_spec(level_id)
+                return None
+            entry = self._tmx_entries[path]
+            if entry.spec is not None:
+                return entry.spec
+
+        spec = self._load_tmx_spec(path)
+        with self._lock:
+            entry.spec = spec
+        return spec
+
+    def load(self, level_id: int) -> Optional[LevelSpec]:
+        """Build the LevelSpec for ``level_id`` without caching it.
+
+        For callers that only glance at a level, such as thumbnails, so
+        browsing the list does not keep every level in memory. A spec that
+        is already cached is returned as is.
+        """
+        with self._lock:
+            path = self._tmx_by_id.get(level_id)
+            if not self._scanned or (path is not None and self._is_stale(path)):
+                self._scan_tmx_folder()
+                path = self._tmx_by_id.get(level_id)
+            if path is None:
+                builder = self.python_levels.get(level_id)
+                if builder is None:
+                    return None
+                return self._python_specs.get(level_id) or builder()
+            spec = self._tmx_entries[path].spec
+        return spec if spec is not None else self._load_tmx_spec(path)
+
+    def specs(self) -> Dict[int, LevelSpec]:
+        """Return all specs keyed by level id (builds anything not cached yet)."""
+        levels = {}
+        for level_id in self.level_ids():
+            spec = self.get(level_id)
+            if spec is not None:
+                levels[level_id] = spec
+        return levels
+
+    def invalidate(self, level_id: Optional[int] = None):
+        """Drop cached data for one level, or for every level when id is None."""
+        with self._lock:
+            if level_id is None:
+                self._python_specs.clear()
+                self._tmx_entries.clear()
+                self._tmx_by_id.clear()
+                self._scanned = False
+                return
+            self._python_specs.pop(level_id, None)
+            path = self._tmx_by_id.pop(level_id, None)
+            if path is not None:
+                self._tmx_entries.pop(path, None)
+
+    def _python_spec(self, level_id: int) -> LevelSpec:
+        spec = self._python_specs.get(level_id)
+        if spec is None:
+            spec = self.python_levels[level_id]()
+            self._python_specs[level_id] = spec
+        return spec
+
+    def _load_tmx_spec(self, path: Path) -> Optional[LevelSpec]:
+        try:
+            spec = load_level(str(path))
+        except Exception as e:
+            print(f"Failed to load TMX level {path.name}: {e}")
+            return None
+        if spec:
+            print(f"Loaded TMX level {spec.level_id} from {path.name}")
+        return spec
+
+    def _is_stale(self, path: Path) -> bool:
+        entry = self._tmx_entries.get(path)
+        try:
+            return entry is None or path.stat().st_mtime != entry.mtime
+        except OSError:
+            return True
+
+    def _scan_tmx_folder(self):
+        """Pick up new, changed and deleted TMX files (one stat per file).
+
+        Changed files are re-indexed from their header only.
+        """
+        seen = set()
+        if self.tmx_folder.exists():
+            for tmx_file in sorted(self.tmx_folder.glob("*.tmx")):
+                seen.add(tmx_file)
+                if self._is_stale(tmx_file):
+                    self._load_tmx_entry(tmx_file)
+
+        for path in list(self._tmx_entries):
+            if path not in seen:
+                del self._tmx_entries[path]
+
+        self._tmx_by_id = {}
+        for path, entry in self._tmx_entries.items():
+            if entry.info is not None:
+                self._tmx_by_id[entry.info.level_id] = path
+        self._scanned = True
+
+    def _load_tmx_entry(self, tmx_file: Path):
+        mtime = tmx_file.stat().st_mtime
+        info = read_tmx_header(str(tmx_file))
+        self._tmx_entries[tmx_file] = _TMXEntry(mtime=mtime, info=info)
+
+
+level_registry = LevelRegistry()
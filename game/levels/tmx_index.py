@@ -0,0 +1,111 @@
+"""
+Fast header index for Tiled .tmx files.
+
+Reads only the map-level <properties> block with an incremental XML parser
+and stops there, so listing hundreds of levels never touches tile data or
+object layers. The full map is loaded later by TMXLevelLoader, only for the
+level that is actually played.
+"""
+
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, Optional
+
+from game.levels.base import LevelInfo
+
+# Children of <map> that Tiled writes after the map's <properties>
+_CONTENT_TAGS = {"tileset", "layer", "objectgroup", "imagelayer", "group"}
+
+
+def _convert(value: str, prop_type: str):
+    if prop_type == "int":
+        return int(value)
+    if prop_type == "float":
+        return float(value)
+    if prop_type == "bool":
+        return value.strip().lower() == "true"
+    return value
+
+
+def read_tmx_properties(tmx_path: str) -> Dict[str, object]:
+    """
+    Return the map-level properties of a .tmx file.
+
+    Parsing stops at the end of the map's <properties> element, or at the
+    first tileset or layer when the map has no properties. Other children
+    that come first (Tiled's <editorsettings>) are skipped.
+    """
+    properties: Dict[str, object] = {}
+    depth = 0
+    in_map_properties = False
+
+    for event, elem in ET.iterparse(tmx_path, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 1 and elem.tag != "map":
+                break
+            if depth == 2:
+                if elem.tag in _CONTENT_TAGS:
+                    break
+                in_map_properties = elem.tag == "properties"
+            continue
+
+        depth -= 1
+        if in_map_properties and depth == 2 and elem.tag == "property":
+            name = elem.get("name")
+            value = elem.get("value")
+            if value is None:
+                value = elem.text or ""
+            try:
+                properties[name] = _convert(value, elem.get("type", "string"))
+            except ValueError:
+                properties[name] = value
+        elif in_map_properties and depth == 1:
+            break
+
+    return properties
+
+
+def read_tmx_header(tmx_path: str) -> Optional[LevelInfo]:
+    """
+    Read level_id, time_limit and requires_all_coins from a .tmx file.
+
+    Returns:
+        LevelInfo for the file, or None if it could not be parsed or has
+        no usable level_id
+    """
+    try:
+        properties = read_tmx_properties(tmx_path)
+    except (ET.ParseError, OSError) as e:
+        print(f"Failed to index TMX level {Path(tmx_path).name}: {e}")
+        return None
+
+    # Guessing an id would let this file replace another level in the registry
+    name = Path(tmx_path).name
+    try:
+        level_id = int(properties["level_id"])
+    except KeyError:
+        print(f"Not indexing TMX level {name}: no level_id property")
+        return None
+    except (TypeError, ValueError):
+        print(f"Not indexing TMX level {name}: bad level_id {properties['level_id']!r}")
+        return None
+
+    time_limit = properties.get("time_limit")
+    try:
+        time_limit = float(time_limit) if time_limit is not None else None
+    except (TypeError, ValueError):
+        time_limit = None
+
+    requires_all_coins = properties.get("requires_all_coins", False)
+    if isinstance(requires_all_coins, str):
+        requires_all_coins = requires_all_coins.strip().lower() == "true"
+
+    return LevelInfo(
+        level_id=level_id,
+        source=str(tmx_path),
+        time_limit=time_limit,
+        requires_all_coins=bool(requires_all_coins),
+    )
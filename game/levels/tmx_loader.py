@@ -22,6 +22,65 @@ from game.levels.base import (
     MovingPlatformSpec,
     PlatformSpec,
 )
+from game.systems.tile_chunks import ChunkedLayer
+
+
+# Tile layers kept for rendering (Collision is kept for debug drawing)
+VISUAL_LAYER_NAMES = (
+    "Background",
+    "Ground",
+    "Decorations",
+    "Foreground",
+    "Collision",
+)
+
+COLLISION_LAYER_NAME = "Collision"
+
+
+def merge_solid_tiles(gids, width: int, height: int) -> list[tuple[int, int, int, int]]:
+    """
+    Merge the non-empty cells of a tile grid into few axis-aligned rectangles.
+
+    Greedy meshing: from each unclaimed solid cell (rows top to bottom),
+    grow right as far as the row stays solid, then grow down while every
+    cell of the next row span is solid too.
+
+    Args:
+        gids: Flat row-major GIDs, row 0 at the top of the map
+        width: Grid width in tiles
+        height: Grid height in tiles
+
+    Returns:
+        List of (column, row, width, height) rectangles in tiles
+    """
+    claimed = [False] * (width * height)
+    rects = []
+
+    def free(column, row):
+        index = row * width + column
+        return gids[index] != 0 and not claimed[index]
+
+    for row in range(height):
+        for column in range(width):
+            if not free(column, row):
+                continue
+
+            run = 1
+            while column + run < width and free(column + run, row):
+                run += 1
+
+            rows = 1
+            while row + rows < height and all(
+                free(column + offset, row + rows) for offset in range(run)
+            ):
+                rows += 1
+
+            for r in range(row, row + rows):
+                start = r * width + column
+                claimed[start : start + run] = [True] * run
+            rects.append((column, row, run, rows))
+
+    return rects
 
 
 class TMXLevelLoader:
@@ -54,8 +113,9 @@ class TMXLevelLoader:
             return None
 
         try:
-            # Load the tile map
-            self.tile_map = arcade.load_tilemap(self.tmx_path)
+            # Load the tile map (lazy sprite lists: no GL calls, so this
+            # also works from the level prefetch thread)
+            self.tile_map = arcade.load_tilemap(self.tmx_path, lazy=True)
 
             # Extract level properties
             level_id = self._get_property("level_id", 1, int)
@@ -66,8 +126,9 @@ class TMXLevelLoader:
             # Extract spawn point
             spawn_point = self._extract_spawn_point()
 
-            # Extract game objects from OBJECT layers
-            platforms = self._extract_platforms()
+            # Extract game objects from OBJECT layers, plus solid colliders
+            # merged from the Collision TILE layer
+            platforms = self._extract_platforms() + self._extract_collision_platforms()
             moving_platforms = self._extract_moving_platforms()
             coins = self._extract_coins()
             hazards = self._extract_hazards()
@@ -105,24 +166,100 @@ class TMXLevelLoader:
             return None
 
     def _extract_visual_layers(self):
-        """Extract visual tile layers for rendering."""
+        """Extract visual tile layers, split into chunks for culled drawing."""
         if not self.tile_map or not hasattr(self.tile_map, 'sprite_lists'):
             return
 
-        # Common visual layer names
-        visual_layer_names = [
-            "Background",
-            "Ground", 
-            "Decorations",
-            "Foreground",
-            "Collision"  # Visual collision layer (for debugging)
-        ]
-
-        for layer_name in visual_layer_names:
+        for layer_name in VISUAL_LAYER_NAMES:
             if layer_name in self.tile_map.sprite_lists:
-                self.visual_layers[layer_name] = self.tile_map.sprite_lists[layer_name]
+                sprite_list = self.tile_map.sprite_lists[layer_name]
+                self.visual_layers[layer_name] = ChunkedLayer(
+                    sprite_list, visible=sprite_list.visible
+                )
                 print(f"Loaded visual layer: {layer_name}")
 
+    def tile_layer_data(self) -> list[dict]:
+        """
+        Return raw tile GIDs of every top-level tile layer.
+
+        Each entry has name, width, height, opacity, visible and a flat
+        row-major ``gids`` list (flip flags included), as stored in the map.
+        """
+        layers = []
+        if not self.tile_map:
+            return layers
+
+        for layer in self.tile_map.tiled_map.layers:
+            data = getattr(layer, "data", None)
+            if not data:
+                continue
+            layers.append(
+                {
+                    "name": layer.name,
+                    "width": len(data[0]),
+                    "height": len(data),
+                    "opacity": float(layer.opacity if layer.opacity is not None else 1.0),
+                    "visible": bool(layer.visible),
+                    "gids": [gid for row in data for gid in row],
+                }
+            )
+        return layers
+
+    def tileset_data(self) -> list[dict]:
+        """Return image-based tilesets with the image path resolved on disk."""
+        tilesets = []
+        if not self.tile_map:
+            return tilesets
+
+        map_directory = Path(self.tmx_path).parent
+        for firstgid, tileset in sorted(self.tile_map.tiled_map.tilesets.items()):
+            if tileset.image is None:
+                continue
+            image = Path(tileset.image)
+            if not image.exists():
+                image = map_directory / tileset.image
+            tilesets.append(
+                {
+                    "firstgid": int(firstgid),
+                    "image": str(image),
+                    "tile_width": int(tileset.tile_width),
+                    "tile_height": int(tileset.tile_height),
+                    "columns": int(tileset.columns),
+                    "spacing": int(tileset.spacing or 0),
+                    "margin": int(tileset.margin or 0),
+                }
+            )
+        return tilesets
+
+    def _object_rect(self, obj, default_width: float, default_height: float):
+        """
+        Return (center_x, center_y, width, height) of a Tiled object.
+
+        Rectangle objects come back from arcade as a list of corner points,
+        point objects as a single (x, y) pair. Explicit ``width``/``height``
+        custom properties override the shape size.
+        """
+        shape = obj.shape
+        if shape and isinstance(shape[0], (tuple, list)):
+            xs = [point[0] for point in shape]
+            ys = [point[1] for point in shape]
+            x = (min(xs) + max(xs)) / 2
+            y = (min(ys) + max(ys)) / 2
+            shape_width = max(xs) - min(xs) or default_width
+            shape_height = max(ys) - min(ys) or default_height
+        else:
+            x, y = shape[0], shape[1]
+            shape_width, shape_height = default_width, default_height
+
+        width = int(obj.properties.get("width", shape_width))
+        height = int(obj.properties.get("height", shape_height))
+        return float(x), float(y), width, height
+
+    def _object_point(self, obj) -> tuple[float, float]:
+        """Return the center of a Tiled object of any shape."""
+        x, y, _, _ = self._object_rect(obj, 0, 0)
+        return (x, y)
+
     def _get_property(self, name: str, default, prop_type=str):
         """Get a property from the tile map."""
         if not self.tile_map or not hasattr(self.tile_map, "properties"):
@@ -145,8 +282,7 @@ class TMXLevelLoader:
         # Look for Spawn object layer
         spawn_layer = self.tile_map.object_lists.get("Spawn")
         if spawn_layer and len(spawn_layer) > 0:
-            spawn_obj = spawn_layer[0]
-            return (spawn_obj.shape[0], spawn_obj.shape[1])
+            return self._object_point(spawn_layer[0])
 
         return (100, 150)
 
@@ -163,9 +299,7 @@ class TMXLevelLoader:
 
         for obj in platform_layer:
             # Get position and size
-            x, y = obj.shape[0], obj.shape[1]
-            width = int(obj.properties.get("width", obj.shape[2] if len(obj.shape) > 2 else 100))
-            height = int(obj.properties.get("height", obj.shape[3] if len(obj.shape) > 3 else 24))
+            x, y, width, height = self._object_rect(obj, 100, 24)
 
             # Get color
             color_hex = obj.properties.get("color", "#708090")
@@ -177,6 +311,39 @@ class TMXLevelLoader:
 
         return platforms
 
+    def _extract_collision_platforms(self) -> list[PlatformSpec]:
+        """Turn the Collision tile layer into invisible merged wall rectangles."""
+        platforms = []
+
+        if not self.tile_map:
+            return platforms
+
+        tile_width = self.tile_map.tile_width
+        tile_height = self.tile_map.tile_height
+        color = self._hex_to_rgb("#708090")
+
+        for layer in self.tile_layer_data():
+            if layer["name"] != COLLISION_LAYER_NAME:
+                continue
+            rects = merge_solid_tiles(layer["gids"], layer["width"], layer["height"])
+            for column, row, columns, rows in rects:
+                width = columns * tile_width
+                height = rows * tile_height
+                bottom = (layer["height"] - row - rows) * tile_height
+                platforms.append(
+                    PlatformSpec(
+                        x=column * tile_width + width / 2,
+                        y=bottom + height / 2,
+                        width=width,
+                        height=height,
+                        color=color,
+                        visible=False,
+                    )
+                )
+            print(f"Merged Collision layer into {len(rects)} colliders")
+
+        return platforms
+
     def _extract_moving_platforms(self) -> list[MovingPlatformSpec]:
         """Extract moving platforms from MovingPlatforms object layer."""
         moving_platforms = []
@@ -189,9 +356,7 @@ class TMXLevelLoader:
             return moving_platforms
 
         for obj in moving_layer:
-            x, y = obj.shape[0], obj.shape[1]
-            width = int(obj.properties.get("width", 100))
-            height = int(obj.properties.get("height", 20))
+            x, y, width, height = self._object_rect(obj, 100, 20)
             color_hex = obj.properties.get("color", "#2E8B57")
             color = self._hex_to_rgb(color_hex)
 
@@ -241,7 +406,7 @@ class TMXLevelLoader:
             return coins
 
         for obj in coin_layer:
-            x, y = obj.shape[0], obj.shape[1]
+            x, y = self._object_point(obj)
             coins.append(CoinSpec(x=x, y=y))
 
         return coins
@@ -258,9 +423,7 @@ class TMXLevelLoader:
             return hazards
 
         for obj in hazard_layer:
-            x, y = obj.shape[0], obj.shape[1]
-            width = int(obj.properties.get("width", 32))
-            height = int(obj.properties.get("height", 32))
+            x, y, width, height = self._object_rect(obj, 32, 32)
             damage = int(obj.properties.get("damage", 10))
             color_hex = obj.properties.get("color", "#8B0000")
             color = self._hex_to_rgb(color_hex)
@@ -285,7 +448,7 @@ class TMXLevelLoader:
             return enemies
 
         for obj in enemy_layer:
-            x, y = obj.shape[0], obj.shape[1]
+            x, y = self._object_point(obj)
             enemy_type = obj.properties.get("type", "patrol")
 
             params = {}
@@ -323,8 +486,7 @@ class TMXLevelLoader:
         # Try both "Finish" and "Exit" layer names
         finish_layer = self.tile_map.object_lists.get("Finish") or self.tile_map.object_lists.get("Exit")
         if finish_layer and len(finish_layer) > 0:
-            finish_obj = finish_layer[0]
-            return finish_obj.shape[0]
+            return self._object_point(finish_layer[0])[0]
 
         return 0.0
 
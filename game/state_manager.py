@@ -1,11 +1,24 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
-
-from game.config import MUSIC_LEVEL, MUSIC_MENU, SFX_COIN, SFX_DEATH, SFX_JUMP, SFX_UI
+from typing import Callable, Optional
+
+from game.config import (
+    MENU_BACKGROUND,
+    MUSIC_LEVEL,
+    MUSIC_MENU,
+    SFX_COIN,
+    SFX_DEATH,
+    SFX_JUMP,
+    SFX_UI,
+)
+from game.systems.assets import asset_manager
 from game.systems.audio import SoundManager
 from game.systems.data import DataManager
+from game.systems.prefetch import LevelPrefetcher
+from game.systems.profiler import FrameProfiler
+from game.systems.textures import texture_registry
+from game.systems.thumbnails import ThumbnailCache
 
 
 class StateManager:
@@ -14,9 +27,19 @@ class StateManager:
         self.current_level = 1
         self.last_score = 0
         self._game_view = None
+        self._textures_preloaded = False
+        # Everything under assets/ decodes in the background from here on;
+        # the menu's background and click sound go first
+        self.assets = asset_manager
+        self.assets.start((MENU_BACKGROUND, SFX_UI))
+        self.prefetcher = LevelPrefetcher()
+        # Level-select thumbnails; kept across visits so they are decoded once
+        self.thumbnails = ThumbnailCache()
+        # Shared by every GameView so a session spans levels; off until F3
+        self.profiler = FrameProfiler()
         self.data_manager = DataManager()
         self.data = self.data_manager.load()
-        self.sound = SoundManager()
+        self.sound = SoundManager(self.assets)
         self.sound.load_sfx("coin", SFX_COIN)
         self.sound.load_sfx("jump", SFX_JUMP)
         self.sound.load_sfx("death", SFX_DEATH)
@@ -24,11 +47,30 @@ class StateManager:
         self._load_audio_settings()
         self.sound.play_music(MUSIC_MENU)
 
+    def update(self):
+        """Per-frame upkeep that does not belong to any one view."""
+        self.sound.update()
+
+    def shutdown(self):
+        """Cancel queued background work so quitting does not wait for it."""
+        self.assets.shutdown()
+        self.prefetcher.shutdown()
+        self.thumbnails.shutdown()
+
+    def when_ready(self, paths, show: Callable[[], None]):
+        """Call ``show`` once ``paths`` are decoded, behind a loading screen if they are not yet."""
+        if self.assets.ready(paths):
+            show()
+            return
+        from game.states.loading_state import LoadingView
+
+        self.window.show_view(LoadingView(self, paths, show))
+
     def show_menu(self):
         from game.states.menu_state import MenuView
 
         self.sound.play_music(MUSIC_MENU)
-        self.window.show_view(MenuView(self))
+        self.when_ready(MenuView.ASSETS, lambda: self.window.show_view(MenuView(self)))
 
     def show_level_select(self):
         from game.states.level_select_state import LevelSelectView
@@ -43,14 +85,33 @@ class StateManager:
         self.window.show_view(SettingsView(self))
 
     def start_level(self, level_id: int):
-        from game.states.game_state import GameView
+        from game.states.game_state import level_assets
 
         self.current_level = level_id
-        self._game_view = GameView(self, level_id)
         self.sound.play_sfx("ui")
+        self.when_ready(level_assets(), lambda: self._show_level(level_id))
+
+    def _show_level(self, level_id: int):
+        from game.states.game_state import GameView
+
+        self._preload_textures()
+        self._game_view = GameView(self, level_id)
         self.sound.play_music(MUSIC_LEVEL)
         self.window.show_view(self._game_view)
 
+    def _preload_textures(self):
+        """Put every entity texture in the atlas before the first level is built."""
+        if self._textures_preloaded:
+            return
+        self._textures_preloaded = True
+        atlas = self.window.ctx.default_atlas
+        texture_registry.preload(atlas)
+        usage = texture_registry.atlas_usage(atlas)
+        print(
+            f"Texture atlas: {usage['atlas_images']} images, "
+            f"{usage['atlas_width']}x{usage['atlas_height']}, {usage['atlas_fill']:.0%} full"
+        )
+
     def show_pause(self):
         from game.states.pause_state import PauseView
 
@@ -69,7 +130,11 @@ class StateManager:
         from game.states.game_over_state import GameOverView
 
         self.sound.play_sfx("ui")
-        self.window.show_view(GameOverView(self, won))
+        game_over_view = GameOverView(self, won)
+        self.window.show_view(game_over_view)
+        # "Next level" is the likely choice; load it while the screen is up
+        if game_over_view.next_button is not None:
+            self.prefetcher.prefetch(self.current_level + 1)
 
     def set_last_score(self, score: int):
         self.last_score = score
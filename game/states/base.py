@@ -1,10 +1,22 @@
+from typing import Optional
+
 import arcade
 
+from game.ui.shape_batch import UIBatch
+
 
 class BaseView(arcade.View):
+    # Menu screens keep their widgets in a UIBatch here
+    ui: Optional[UIBatch] = None
+
     def __init__(self, state_manager):
         super().__init__()
         self.state_manager = state_manager
 
     def on_show_view(self):
         arcade.set_background_color(arcade.color.BLACK)
+
+    def on_hide_view(self):
+        # Menu screens are built anew each time they are shown
+        if self.ui is not None:
+            self.ui.release()
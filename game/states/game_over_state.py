@@ -1,17 +1,20 @@
 import arcade
 
 from game.config import SCREEN_HEIGHT, SCREEN_WIDTH
-from game.levels import get_level_specs
+from game.levels import level_registry
 from game.states.base import BaseView
 from game.ui.button import Button
+from game.ui.shape_batch import UIBatch
+from game.ui.label import BoundLabel
 
 
 class GameOverView(BaseView):
     def __init__(self, state_manager, won: bool):
         super().__init__(state_manager)
+        self.ui = UIBatch()
         self.won = won
         self.current_level = state_manager.current_level
-        self.max_level = max(get_level_specs().keys())
+        self.max_level = level_registry.max_level_id()
 
         # Title
         title = "LEVEL COMPLETE!" if self.won else "GAME OVER"
@@ -24,17 +27,20 @@ class GameOverView(BaseView):
             48,
             anchor_x="center",
             bold=True,
+            batch=self.ui.text,
         )
 
         # Score
-        self._score_text = arcade.Text(
-            f"Score: {state_manager.last_score}",
+        self._score_text = BoundLabel(
+            "Score: {}",
+            state_manager.last_score,
             SCREEN_WIDTH / 2,
             SCREEN_HEIGHT / 2 + 80,
             arcade.color.GOLD,
             32,
             anchor_x="center",
             bold=True,
+            batch=self.ui.text,
         )
 
         # Buttons - единая цветовая палитра
@@ -56,6 +62,7 @@ class GameOverView(BaseView):
                 color=(40, 80, 120),
                 hover_color=(60, 120, 180),
                 click_color=(20, 40, 80),
+            batch=self.ui,
             )
             self.buttons.append(self.next_button)
             start_y -= 80
@@ -72,6 +79,7 @@ class GameOverView(BaseView):
             color=(40, 80, 120),
             hover_color=(60, 120, 180),
             click_color=(20, 40, 80),
+            batch=self.ui,
         )
         self.buttons.append(self.retry_button)
 
@@ -85,21 +93,15 @@ class GameOverView(BaseView):
             color=(40, 80, 120),
             hover_color=(60, 120, 180),
             click_color=(20, 40, 80),
+            batch=self.ui,
         )
         self.buttons.append(self.menu_button)
 
     def on_draw(self):
         self.clear()
 
-        # Draw title
-        self._title_text.draw()
-
-        # Draw score
-        self._score_text.draw()
-
-        # Draw buttons
-        for button in self.buttons:
-            button.draw()
+        # Draw title, score and buttons
+        self.ui.draw()
 
     def on_mouse_motion(self, x: float, y: float, dx: float, dy: float):
         """Handle mouse movement for hover effects."""
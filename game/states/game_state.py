@@ -1,118 +1,137 @@
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple
+
 import arcade
 
 from game.config import (
-    GRAVITY,
-    JUMP_BLOCK_CHECK_DISTANCE,
-    PLAYER_JUMP_SPEED,
-    PLAYER_JUMP_HOLD_FORCE,
-    PLAYER_JUMP_HOLD_FRAMES,
-    PLAYER_MOVE_SPEED,
+    MAX_SIMULATION_STEPS,
+    PROFILE_DIR,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
+    STATIC_GEOMETRY_CACHE,
 )
-from game.entities.player import FaceDirection, Player
-from game.levels import LevelBuilder, get_level_specs
+from game.entities.player import FaceDirection, animation_frame_paths
 from game.states.base import BaseView
 from game.systems.camera import CameraManager
-from game.systems.particles import ParticleEmitter, ParticleManager
+from game.systems.particles import ParticleSystem
+from game.systems.simulation import (
+    EVENT_COIN,
+    EVENT_DEATH,
+    EVENT_FINISH_BLOCKED,
+    EVENT_JUMP,
+    EVENT_LOST,
+    EVENT_WON,
+    SIMULATION_DT,
+    LevelSimulation,
+    PlayerInput,
+)
+from game.systems.static_cache import StaticGeometryCache
 from game.ui.hud import HUD
+from game.ui.profiler_overlay import ProfilerOverlay
+
+
+DEATH_COLORS = {
+    "hazard": arcade.color.YELLOW,
+    "enemy": arcade.color.RED,
+    "fall": arcade.color.ORANGE_RED,
+}
+
+
+@lru_cache(maxsize=None)
+def level_assets() -> Tuple[str, ...]:
+    """Files decoded before a level is shown; see StateManager.when_ready."""
+    return tuple(path for paths in animation_frame_paths().values() for path in paths)
 
 
 class GameView(BaseView):
+    """Interactive front end for a LevelSimulation.
+
+    The simulation decides what happens; this view feeds it keyboard input,
+    turns its events into sounds, particles and screen changes, and draws.
+    """
+
     def __init__(self, state_manager, level_id: int):
         super().__init__(state_manager)
         self.level_id = level_id
+        self.simulation = None
 
-        self.player_list = arcade.SpriteList()
-        self.enemy_list = arcade.SpriteList()
-        self.platform_list = arcade.SpriteList()
-        self.moving_platform_list = arcade.SpriteList()
-        self.coin_list = arcade.SpriteList()
-        self.hazard_list = arcade.SpriteList()
-        self.ui_button_list = arcade.SpriteList()
-        self.finish_platform_list = arcade.SpriteList()
-        
         # Visual tile layers from TMX
         self.background_layer = None
         self.ground_layer = None
         self.decorations_layer = None
         self.collision_layer = None  # Visual collision layer for debugging
+        self.static_cache = None
 
-        self.player = None
-        self.physics_engine = None
-        self.enemy_physics_engines = []
         self.camera = CameraManager(
             SCREEN_WIDTH,
             SCREEN_HEIGHT,
             window=state_manager.window,
         )
         self.hud = HUD()
-        self.particles = ParticleManager()
+        self.particles = ParticleSystem()
+        self.profiler = state_manager.profiler
+        self.profiler_overlay = ProfilerOverlay(self.profiler)
 
-        self.score = 0
-        self.time_elapsed = 0.0
-        self.level_end_x = 0
-        self.lives = 3
-        self.spawn_point = (100, 150)
         self._move_left = False
         self._move_right = False
         self._jump_pressed = False
         self._jump_held = False
-        self._jump_active = False
-        self._jump_frames = 0
-        self._moving_platform_last_pos = {}
-        self.level_spec = None
+        self._accumulator = 0.0
+        self._level_over = False
+        self._previous_positions = {}
+        self._previous_camera = None
         self._status_message = ""
         self._status_timer = 0.0
-        self._status_text = arcade.Text(
-            "",
-            SCREEN_WIDTH / 2,
-            SCREEN_HEIGHT - 80,
-            arcade.color.GOLD,
-            16,
-            anchor_x="center",
-        )
+
+    @property
+    def player(self):
+        return self.simulation.player if self.simulation else None
+
+    @property
+    def level_spec(self):
+        return self.simulation.level_spec if self.simulation else None
+
+    @property
+    def score(self) -> int:
+        return self.simulation.score if self.simulation else 0
+
+    @property
+    def lives(self) -> int:
+        return self.simulation.lives if self.simulation else 0
+
+    @property
+    def time_elapsed(self) -> float:
+        return self.simulation.time_elapsed if self.simulation else 0.0
 
     def setup(self):
-        self.player_list.clear()
-        self.enemy_list.clear()
-        self.platform_list.clear()
-        self.moving_platform_list.clear()
-        self.coin_list.clear()
-        self.hazard_list.clear()
-        self.ui_button_list.clear()
-        self.finish_platform_list.clear()
-
-        self.player = Player()
-        self.player_list.append(self.player)
-
-        self.score = 0
-        self.time_elapsed = 0.0
-        self.level_end_x = 0
-        self.lives = 3
-        self.spawn_point = (100, 150)
+        self.background_layer = None
+        self.ground_layer = None
+        self.decorations_layer = None
+        self.collision_layer = None
         self._move_left = False
         self._move_right = False
         self._jump_pressed = False
         self._jump_held = False
-        self._jump_active = False
-        self._jump_frames = 0
-        self._moving_platform_last_pos = {}
-        self.level_spec = None
+        self._accumulator = 0.0
+        self._level_over = False
+        self._previous_positions = {}
+        self._previous_camera = None
         self._status_message = ""
         self._status_timer = 0.0
         self.particles.clear()
+        if self.static_cache is not None:
+            self.static_cache.release()
+            self.static_cache = None
 
-        level_specs = get_level_specs()
-        spec = level_specs.get(self.level_id)
+        spec = self.state_manager.prefetcher.get(self.level_id)
         if spec is None:
-            self.physics_engine = None
+            self.simulation = None
             return
-        self.level_spec = spec
+        self.simulation = LevelSimulation(self.level_id, spec=spec, profiler=self.profiler)
+        self.hud.lives = self.simulation.lives
 
-        builder = LevelBuilder(self)
-        builder.build(spec)
-        
         # Load visual tile layers if available
         if hasattr(spec, 'visual_layers') and spec.visual_layers:
             self.background_layer = spec.visual_layers.get("Background")
@@ -121,224 +140,252 @@ class GameView(BaseView):
             self.collision_layer = spec.visual_layers.get("Collision")
             print(f"Loaded {len(spec.visual_layers)} visual layers")
 
-        gravity = getattr(spec, "gravity_constant", GRAVITY)
-        self.physics_engine = arcade.PhysicsEnginePlatformer(
-            self.player,
-            platforms=self.moving_platform_list,
-            walls=self.platform_list,
-            gravity_constant=gravity,
-        )
-        if self.level_spec and self.level_spec.requires_all_coins:
+        if STATIC_GEOMETRY_CACHE:
+            sim = self.simulation
+            self.static_cache = StaticGeometryCache(
+                [
+                    self.background_layer,
+                    self.ground_layer,
+                    sim.platform_list,
+                    sim.finish_platform_list,
+                    sim.hazard_list,
+                ],
+                window=self.state_manager.window,
+            )
+
+        if spec.requires_all_coins:
             self._show_status("Collect all coins to finish!", duration=3.0)
 
-    def _respawn_player(self):
-        self.player.center_x, self.player.center_y = self.spawn_point
-        self.player.change_x = 0
-        self.player.change_y = 0
+    def invalidate_static_geometry(self, bounds=None):
+        """Call after static geometry changes inside ``bounds`` (or anywhere)."""
+        if self.static_cache is not None:
+            self.static_cache.invalidate(bounds)
 
     def on_show_view(self):
         super().on_show_view()
         self.setup()
 
+    def on_hide_view(self):
+        # A new GameView is made for every level; free what this one holds on the GPU
+        self.particles.release()
+        if self.static_cache is not None:
+            self.static_cache.release()
+
     def on_draw(self):
         self.clear()
+        sim = self.simulation
+        if sim is None:
+            return
+        profiler = self.profiler
+        # Draw the world between the last two ticks; positions are put back after
+        current = self._interpolate(self._accumulator / SIMULATION_DT)
         self.camera.use_world()
-        
-        # Draw visual tile layers (background to foreground)
-        if self.background_layer:
-            self.background_layer.draw()
-        if self.ground_layer:
-            self.ground_layer.draw()
-        
-        # Draw game objects
-        self.platform_list.draw()
-        self.moving_platform_list.draw()
-        self.finish_platform_list.draw()
-        self.coin_list.draw()
-        self.hazard_list.draw()
-        self.enemy_list.draw()
-        self.player_list.draw()
-        self.particles.draw()
-        
+        view = self.camera.visible_bounds()
+
+        if self.static_cache is not None:
+            # Background, ground, walls, finish and hazards in one cached pass
+            with profiler.section("draw.static"):
+                self.static_cache.draw(view, profiler)
+            with profiler.section("draw.level"):
+                sim.moving_platform_list.draw()
+            with profiler.section("draw.entities"):
+                sim.coin_list.draw()
+                sim.enemy_list.draw()
+                sim.player_list.draw()
+        else:
+            self._draw_level_sprites(view)
+
+        with profiler.section("draw.particles"):
+            self.particles.draw()
+
         # Draw decorations on top
-        if self.decorations_layer:
-            self.decorations_layer.draw()
-        
+        with profiler.section("draw.decorations"):
+            if self.decorations_layer:
+                self.decorations_layer.draw(view, profiler)
+
         # Debug: draw collision layer (uncomment to see collision tiles)
         # if self.collision_layer:
-        #     self.collision_layer.draw()
+        #     self.collision_layer.draw(view)
 
+        self._restore_positions(current)
         self.camera.use_hud()
-        self.hud.score = self.score
-        if self.level_spec and self.level_spec.time_limit is not None:
-            remaining = max(0.0, self.level_spec.time_limit - self.time_elapsed)
-            self.hud.time_elapsed = remaining
-        else:
-            self.hud.time_elapsed = self.time_elapsed
-        self.hud.draw()
-        if self._status_message:
-            self._status_text.text = self._status_message
-            self._status_text.draw()
+        with profiler.section("draw.hud"):
+            self.hud.score = sim.score
+            if sim.level_spec.time_limit is not None:
+                remaining = max(0.0, sim.level_spec.time_limit - sim.time_elapsed)
+                self.hud.time_elapsed = remaining
+            else:
+                self.hud.time_elapsed = sim.time_elapsed
+            self.hud.status = self._status_message
+            self.hud.draw()
+        if profiler.enabled:
+            self.profiler_overlay.draw()
+
+    def _draw_level_sprites(self, view):
+        sim = self.simulation
+        profiler = self.profiler
+
+        # Draw visual tile layers (background to foreground)
+        with profiler.section("draw.tiles"):
+            if self.background_layer:
+                self.background_layer.draw(view, profiler)
+            if self.ground_layer:
+                self.ground_layer.draw(view, profiler)
+
+        # Draw game objects
+        with profiler.section("draw.level"):
+            sim.platform_list.draw()
+            sim.moving_platform_list.draw()
+            sim.finish_platform_list.draw()
+        with profiler.section("draw.entities"):
+            sim.coin_list.draw()
+            sim.hazard_list.draw()
+            sim.enemy_list.draw()
+            sim.player_list.draw()
 
     def on_update(self, delta_time: float):
-        self.time_elapsed += delta_time
-        self.particles.update(delta_time)
-        self.enemy_list.update()
+        profiler = self.profiler
+        profiler.next_frame()
+        if profiler.enabled:
+            self.profiler_overlay.update(delta_time)
+
+        # Particles are purely visual and follow real time
+        with profiler.section("update.particles"):
+            self.particles.update(delta_time)
+        if self.simulation is None:
+            return
+
+        self._accumulator += delta_time
+        steps = 0
+        while self._accumulator >= SIMULATION_DT and not self._level_over:
+            if steps >= MAX_SIMULATION_STEPS:
+                # Too far behind: drop the backlog instead of slowing every frame
+                self._accumulator = 0.0
+                break
+            self._accumulator -= SIMULATION_DT
+            steps += 1
+            self._capture_previous_positions()
+            self._fixed_update(SIMULATION_DT)
+
+    def _fixed_update(self, delta_time: float):
+        """Advance gameplay by one tick of ``delta_time`` seconds."""
         if self._status_timer > 0:
             self._status_timer -= delta_time
             if self._status_timer <= 0:
                 self._status_timer = 0.0
                 self._status_message = ""
-        if self.level_spec and self.level_spec.time_limit is not None:
-            if self.time_elapsed >= self.level_spec.time_limit:
-                self.state_manager.set_last_score(self.score)
-                self.state_manager.update_progress(
-                    self.level_id, self.score, False, self.time_elapsed
-                )
-                self.state_manager.show_game_over(False)
-                return
-
-        player_prev_x = self.player.center_x
-        player_prev_y = self.player.center_y
-        prev_positions = {
-            platform: self._moving_platform_last_pos.get(
-                platform, (platform.center_x, platform.center_y)
-            )
-            for platform in self.moving_platform_list
-        }
 
-        direction = (-1 if self._move_left else 0) + (1 if self._move_right else 0)
-        input_dx = direction * PLAYER_MOVE_SPEED
-        self.player.change_x = input_dx
         self._update_player_animation(delta_time)
-
-        if self._jump_pressed and self.physics_engine and self.physics_engine.can_jump():
-            if not self._is_blocked_above():
-                self.player.change_y = PLAYER_JUMP_SPEED
-                self.state_manager.sound.play_sfx("jump")
-                self._jump_frames = 0
-                self._jump_active = True
+        events = self.simulation.step(
+            PlayerInput(
+                left=self._move_left,
+                right=self._move_right,
+                jump_pressed=self._jump_pressed,
+                jump_held=self._jump_held,
+            ),
+            delta_time,
+        )
         self._jump_pressed = False
-
-        if self._jump_active:
-            if self._jump_held and self._jump_frames < PLAYER_JUMP_HOLD_FRAMES:
-                self.player.change_y += PLAYER_JUMP_HOLD_FORCE
-                self._jump_frames += 1
-                if self._jump_frames >= PLAYER_JUMP_HOLD_FRAMES:
-                    self._jump_active = False
-            elif not self._jump_held and self.player.change_y > 0:
-                self.player.change_y *= 0.6
-                self._jump_active = False
-                self._jump_frames = PLAYER_JUMP_HOLD_FRAMES
-
-        if self.physics_engine:
-            self.physics_engine.update()
-
-        platform_under = self._platform_under_player()
-        if platform_under and not self._jump_active:
-            prev_x, prev_y = prev_positions.get(
-                platform_under, (platform_under.center_x, platform_under.center_y)
-            )
-            delta_x = platform_under.center_x - prev_x
-            delta_y = platform_under.center_y - prev_y
-            player_dx = self.player.center_x - player_prev_x
-            extra_dx = player_dx - input_dx
-            carry_x = delta_x
-
-            if delta_x != 0 and extra_dx != 0 and (delta_x > 0) == (extra_dx > 0):
-                carry_x = delta_x - extra_dx
-
-            if delta_x > 0:
-                carry_x = max(0, min(delta_x, carry_x))
-            elif delta_x < 0:
-                carry_x = min(0, max(delta_x, carry_x))
-
-            self.player.center_x += carry_x
-            if delta_y:
-                self.player.center_y += delta_y
-
-        for platform in self.moving_platform_list:
-            self._moving_platform_last_pos[platform] = (
-                platform.center_x,
-                platform.center_y,
-            )
-
-        for engine in self.enemy_physics_engines:
-            engine.update()
-
-        coins_hit = arcade.check_for_collision_with_list(self.player, self.coin_list)
-        for coin in coins_hit:
+        for event in events:
+            self._handle_event(event)
+        if not self._level_over:
+            with self.profiler.section("update.camera"):
+                self.camera.update(self.player)
+                # The simulation wakes enemies and platforms near what is shown
+                self.simulation.view_bounds = self.camera.visible_bounds()
+
+    def _handle_event(self, event):
+        sound = self.state_manager.sound
+        if event.kind == EVENT_JUMP:
+            sound.play_sfx("jump")
+        elif event.kind == EVENT_COIN:
             self._spawn_particles(
-                (coin.center_x, coin.center_y),
+                (event.x, event.y),
                 color=arcade.color.GOLD,
                 count=6,
                 speed_range=(40, 120),
                 lifetime_range=(0.25, 0.55),
                 size_range=(3, 6),
             )
-            self.state_manager.sound.play_sfx("coin")
-            coin.remove_from_sprite_lists()
-            self.score += getattr(coin, "value", 0)
-
-        if arcade.check_for_collision_with_list(self.player, self.hazard_list):
-            self._handle_death(arcade.color.YELLOW)
-            return
-
-        if arcade.check_for_collision_with_list(self.player, self.enemy_list):
-            self._handle_death(arcade.color.RED)
-            return
-
-        # Проверка завершения уровня - касание финишной платформы
-        if arcade.check_for_collision_with_list(self.player, self.finish_platform_list):
-            if (
-                self.level_spec
-                and self.level_spec.requires_all_coins
-                and len(self.coin_list) > 0
-            ):
-                if self._status_message != "Collect all coins to finish!":
-                    self._show_status("Collect all coins to finish!")
-                    self.state_manager.sound.play_sfx("ui")
-            else:
-                self.state_manager.set_last_score(self.score)
-                self.state_manager.update_progress(
-                    self.level_id, self.score, True, self.time_elapsed
-                )
-                self.state_manager.show_game_over(True)
-                return
-
-        # Дополнительная проверка по координатам (на случай если финишная платформа не добавлена)
-        if self.level_end_x and self.player.center_x >= self.level_end_x - 50:
-            if (
-                self.level_spec
-                and self.level_spec.requires_all_coins
-                and len(self.coin_list) > 0
-            ):
-                if self._status_message != "Collect all coins to finish!":
-                    self._show_status("Collect all coins to finish!")
-                    self.state_manager.sound.play_sfx("ui")
-            else:
-                self.state_manager.set_last_score(self.score)
-                self.state_manager.update_progress(
-                    self.level_id, self.score, True, self.time_elapsed
-                )
-                self.state_manager.show_game_over(True)
-                return
-
-        if self.player.center_y < -200:
-            self._handle_death(arcade.color.ORANGE_RED)
-            return
-
-        self.camera.update(self.player)
+            sound.play_sfx("coin")
+        elif event.kind == EVENT_DEATH:
+            self._spawn_particles(
+                (event.x, event.y),
+                color=DEATH_COLORS.get(event.cause, arcade.color.RED),
+                count=14,
+                speed_range=(80, 200),
+                lifetime_range=(0.4, 0.9),
+                size_range=(4, 7),
+            )
+            sound.play_sfx("death")
+            self.hud.lives = self.simulation.lives
+            # Don't interpolate the teleport back to the spawn point
+            self._previous_positions.pop(self.player, None)
+        elif event.kind == EVENT_FINISH_BLOCKED:
+            if self._status_message != "Collect all coins to finish!":
+                self._show_status("Collect all coins to finish!")
+                sound.play_sfx("ui")
+        elif event.kind in (EVENT_WON, EVENT_LOST):
+            self._end_level(event.kind == EVENT_WON)
+
+    def _capture_previous_positions(self):
+        sim = self.simulation
+        activity = sim.activity
+        # Sleeping movers don't move, so only the awake ones are interpolated
+        self._previous_positions = {
+            sprite: (sprite.center_x, sprite.center_y)
+            for sprites in (sim.player_list, activity.awake_enemies, activity.active_platforms)
+            for sprite in sprites
+        }
+        self._previous_camera = tuple(self.camera.world_camera.position)
+
+    def _interpolate(self, alpha: float):
+        """Move sprites and the camera ``alpha`` of the way from the previous tick.
+
+        Returns the real positions so _restore_positions can put them back.
+        """
+        alpha = min(max(alpha, 0.0), 1.0)
+        current = {}
+        for sprite, (prev_x, prev_y) in self._previous_positions.items():
+            x, y = sprite.center_x, sprite.center_y
+            current[sprite] = (x, y)
+            sprite.center_x = prev_x + (x - prev_x) * alpha
+            sprite.center_y = prev_y + (y - prev_y) * alpha
+        camera_position = None
+        if self._previous_camera is not None:
+            camera_position = tuple(self.camera.world_camera.position)
+            prev_x, prev_y = self._previous_camera
+            self.camera.world_camera.position = (
+                prev_x + (camera_position[0] - prev_x) * alpha,
+                prev_y + (camera_position[1] - prev_y) * alpha,
+            )
+        return current, camera_position
+
+    def _restore_positions(self, state):
+        current, camera_position = state
+        for sprite, (x, y) in current.items():
+            sprite.center_x = x
+            sprite.center_y = y
+        if camera_position is not None:
+            self.camera.world_camera.position = camera_position
+
+    def _end_level(self, won: bool):
+        self._level_over = True
+        self.state_manager.set_last_score(self.score)
+        self.state_manager.update_progress(
+            self.level_id, self.score, won, self.time_elapsed
+        )
+        self.state_manager.show_game_over(won)
 
     def _update_player_animation(self, delta_time: float):
         if self._move_left:
             self.player.face_direction = FaceDirection.LEFT
         elif self._move_right:
             self.player.face_direction = FaceDirection.RIGHT
-        
+
         # Update animation states
         self.player.is_walking = self._move_left or self._move_right
-        
+
         # Check if jumping or falling
         if self.player.change_y > 1:
             self.player.is_jumping = True
@@ -349,7 +396,7 @@ class GameView(BaseView):
         else:
             self.player.is_jumping = False
             self.player.is_falling = False
-        
+
         self.player.update_animation(delta_time)
 
     def _show_status(self, message: str, duration: float = 2.0):
@@ -365,8 +412,7 @@ class GameView(BaseView):
         lifetime_range=(0.3, 0.7),
         size_range=(3, 6),
     ):
-        emitter = ParticleEmitter()
-        emitter.emit_burst(
+        self.particles.emit_burst(
             position=position,
             color=color,
             count=count,
@@ -374,63 +420,6 @@ class GameView(BaseView):
             lifetime_range=lifetime_range,
             size_range=size_range,
         )
-        self.particles.emitters.append(emitter)
-
-    def _is_blocked_above(self, check_distance: float = JUMP_BLOCK_CHECK_DISTANCE) -> bool:
-        original_y = self.player.center_y
-        self.player.center_y += check_distance
-        blocked_by_static = arcade.check_for_collision_with_list(
-            self.player, self.platform_list
-        )
-        blocked_by_moving = arcade.check_for_collision_with_list(
-            self.player, self.moving_platform_list
-        )
-        self.player.center_y = original_y
-        return len(blocked_by_static) > 0 or len(blocked_by_moving) > 0
-
-    def _platform_under_player(self):
-        if self.player.change_y > 0:
-            return None
-        original_y = self.player.center_y
-        self.player.center_y -= 10
-        candidates = arcade.check_for_collision_with_list(
-            self.player, self.moving_platform_list
-        )
-        self.player.center_y = original_y
-        if not candidates:
-            return None
-        best_platform = None
-        best_top = None
-        for platform in candidates:
-            if self.player.right <= platform.left or self.player.left >= platform.right:
-                continue
-            if self.player.center_y < platform.center_y:
-                continue
-            if best_top is None or platform.top > best_top:
-                best_platform = platform
-                best_top = platform.top
-        return best_platform
-
-    def _handle_death(self, color=arcade.color.RED):
-        self._spawn_particles(
-            (self.player.center_x, self.player.center_y),
-            color=color,
-            count=14,
-            speed_range=(80, 200),
-            lifetime_range=(0.4, 0.9),
-            size_range=(4, 7),
-        )
-        self.state_manager.sound.play_sfx("death")
-        self.lives -= 1
-        self.hud.lives = self.lives
-        if self.lives <= 0:
-            self.state_manager.set_last_score(self.score)
-            self.state_manager.update_progress(
-                self.level_id, self.score, False, self.time_elapsed
-            )
-            self.state_manager.show_game_over(False)
-            return
-        self._respawn_player()
 
     def on_key_press(self, key, modifiers):
         if key in (arcade.key.LEFT, arcade.key.A):
@@ -440,11 +429,20 @@ class GameView(BaseView):
         elif key in (arcade.key.SPACE, arcade.key.W, arcade.key.UP):
             self._jump_pressed = True
             self._jump_held = True
+        elif key == arcade.key.F3:
+            self.profiler.toggle()
+        elif key == arcade.key.F4 and self.profiler.enabled:
+            self._dump_profile()
         elif key == arcade.key.P:
             self.state_manager.show_pause()
         elif key == arcade.key.ESCAPE:
             self.state_manager.show_menu()
 
+    def _dump_profile(self):
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = self.profiler.dump(Path(PROFILE_DIR) / f"profile-{stamp}.json")
+        self._show_status(f"Profile saved to {path}")
+
     def on_key_release(self, key, modifiers):
         if key in (arcade.key.LEFT, arcade.key.A):
             self._move_left = False
@@ -1,13 +1,17 @@
 import arcade
 
 from game.config import SCREEN_HEIGHT, SCREEN_WIDTH
+from game.levels import level_registry
 from game.states.base import BaseView
 from game.ui.button import Button
+from game.ui.level_list import LevelList, level_entries
+from game.ui.shape_batch import UIBatch
 
 
 class LevelSelectView(BaseView):
     def __init__(self, state_manager):
         super().__init__(state_manager)
+        self.ui = UIBatch()
 
         # Title
         self._title_text = arcade.Text(
@@ -18,98 +22,61 @@ class LevelSelectView(BaseView):
             42,
             anchor_x="center",
             bold=True,
+            batch=self.ui.text,
         )
 
-        # Get high scores
-        high_scores = state_manager.data.get("high_scores", {})
-        level_one_score = high_scores.get("level_1", 0)
-        level_two_score = high_scores.get("level_2", 0)
-        level_three_score = high_scores.get("level_3", 0)
-
-        # Level buttons - единая цветовая палитра
-        button_width = 400
-        button_height = 70
-        center_x = SCREEN_WIDTH / 2
-        start_y = SCREEN_HEIGHT / 2 + 80
-
-        self.level1_button = Button(
-            center_x,
-            start_y,
-            button_width,
-            button_height,
-            f"LEVEL 1 - EASY\nBest: {level_one_score}",
-            color=(40, 80, 120),
-            hover_color=(60, 120, 180),
-            click_color=(20, 40, 80),
-            font_size=20,
-        )
-
-        self.level2_button = Button(
-            center_x,
-            start_y - 100,
-            button_width,
-            button_height,
-            f"LEVEL 2 - MEDIUM\nBest: {level_two_score}",
-            color=(40, 80, 120),
-            hover_color=(60, 120, 180),
-            click_color=(20, 40, 80),
-            font_size=20,
-        )
-
-        self.level3_button = Button(
-            center_x,
-            start_y - 200,
-            button_width,
-            button_height,
-            f"LEVEL 3 - HARD\nBest: {level_three_score}",
-            color=(40, 80, 120),
-            hover_color=(60, 120, 180),
-            click_color=(20, 40, 80),
-            font_size=20,
+        # Every level in the registry, with best score/time from the save file
+        self.level_list = LevelList(
+            level_entries(level_registry, state_manager.data),
+            center_x=SCREEN_WIDTH / 2,
+            top=SCREEN_HEIGHT - 150,
+            width=640,
+            height=420,
+            row_height=84,
+            thumbnails=state_manager.thumbnails,
         )
 
         self.back_button = Button(
-            center_x,
-            100,
+            SCREEN_WIDTH / 2,
+            70,
             250,
             50,
             "BACK",
             color=(40, 80, 120),
             hover_color=(60, 120, 180),
             click_color=(20, 40, 80),
+            batch=self.ui,
         )
 
     def on_draw(self):
         self.clear()
 
-        # Draw title
-        self._title_text.draw()
+        # Draw title, list and back button
+        self.ui.draw()
+        self.level_list.draw()
+
+    def on_hide_view(self):
+        super().on_hide_view()
+        self.level_list.release()
 
-        # Draw buttons
-        self.level1_button.draw()
-        self.level2_button.draw()
-        self.level3_button.draw()
-        self.back_button.draw()
+    def on_update(self, delta_time: float):
+        self.level_list.update(delta_time)
 
     def on_mouse_motion(self, x: float, y: float, dx: float, dy: float):
         """Handle mouse movement for hover effects."""
-        self.level1_button.check_mouse_hover(x, y)
-        self.level2_button.check_mouse_hover(x, y)
-        self.level3_button.check_mouse_hover(x, y)
+        self.level_list.on_mouse_motion(x, y)
         self.back_button.check_mouse_hover(x, y)
 
+    def on_mouse_scroll(self, x: int, y: int, scroll_x: float, scroll_y: float):
+        self.level_list.scroll_by(-scroll_y * self.level_list.row_height)
+
     def on_mouse_press(self, x: float, y: float, button: int, modifiers: int):
         """Handle mouse press."""
         if button == arcade.MOUSE_BUTTON_LEFT:
-            if self.level1_button.check_mouse_press(x, y):
-                self.state_manager.sound.play_sfx("ui")
-                self.state_manager.start_level(1)
-            elif self.level2_button.check_mouse_press(x, y):
-                self.state_manager.sound.play_sfx("ui")
-                self.state_manager.start_level(2)
-            elif self.level3_button.check_mouse_press(x, y):
+            entry = self.level_list.on_mouse_press(x, y)
+            if entry is not None:
                 self.state_manager.sound.play_sfx("ui")
-                self.state_manager.start_level(3)
+                self.state_manager.start_level(entry.level_id)
             elif self.back_button.check_mouse_press(x, y):
                 self.state_manager.sound.play_sfx("ui")
                 self.state_manager.show_menu()
@@ -117,18 +84,29 @@ class LevelSelectView(BaseView):
     def on_mouse_release(self, x: float, y: float, button: int, modifiers: int):
         """Handle mouse release."""
         if button == arcade.MOUSE_BUTTON_LEFT:
-            self.level1_button.check_mouse_release(x, y)
-            self.level2_button.check_mouse_release(x, y)
-            self.level3_button.check_mouse_release(x, y)
+            self.level_list.on_mouse_release(x, y)
             self.back_button.check_mouse_release(x, y)
 
     def on_key_press(self, key, modifiers):
         """Keep keyboard shortcuts."""
+        level_list = self.level_list
         if key == arcade.key.KEY_1:
             self.state_manager.start_level(1)
         elif key == arcade.key.KEY_2:
             self.state_manager.start_level(2)
         elif key == arcade.key.KEY_3:
             self.state_manager.start_level(3)
+        elif key == arcade.key.UP:
+            level_list.scroll_by(-level_list.row_height)
+        elif key == arcade.key.DOWN:
+            level_list.scroll_by(level_list.row_height)
+        elif key == arcade.key.PAGEUP:
+            level_list.scroll_by(-level_list.height)
+        elif key == arcade.key.PAGEDOWN:
+            level_list.scroll_by(level_list.height)
+        elif key == arcade.key.HOME:
+            level_list.scroll_by(-level_list.max_scroll)
+        elif key == arcade.key.END:
+            level_list.scroll_by(level_list.max_scroll)
         elif key == arcade.key.ESCAPE:
             self.state_manager.show_menu()
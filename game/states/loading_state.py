@@ -0,0 +1,58 @@
+import arcade
+
+from game.config import SCREEN_HEIGHT, SCREEN_WIDTH
+from game.states.base import BaseView
+from game.ui.label import BoundLabel
+from game.ui.shape_batch import UIBatch
+
+BAR_WIDTH = 480
+BAR_HEIGHT = 16
+
+
+class LoadingView(BaseView):
+    """Progress over a set of assets; calls ``then`` once they are all decoded."""
+
+    def __init__(self, state_manager, paths, then):
+        super().__init__(state_manager)
+        self.paths = list(paths)
+        self.then = then
+        self._done = False
+        state_manager.assets.request(self.paths)
+
+        self.ui = UIBatch()
+        left = self._left = SCREEN_WIDTH / 2 - BAR_WIDTH / 2
+        bottom = self._bottom = SCREEN_HEIGHT / 2 - BAR_HEIGHT / 2
+        shapes = self.ui.shapes
+        shapes.add_rect(left, left + BAR_WIDTH, bottom, bottom + BAR_HEIGHT, (30, 40, 55))
+        self._fill = shapes.add_rect(left, left, bottom, bottom + BAR_HEIGHT, (90, 140, 200))
+        shapes.add_outline(left, left + BAR_WIDTH, bottom, bottom + BAR_HEIGHT, (60, 120, 180))
+        self._label = BoundLabel(
+            "LOADING {}%",
+            0,
+            SCREEN_WIDTH / 2,
+            bottom + BAR_HEIGHT + 24,
+            arcade.color.WHITE,
+            18,
+            anchor_x="center",
+            batch=self.ui.text,
+        )
+
+    def on_draw(self):
+        self.clear()
+        self.ui.draw()
+
+    def on_update(self, delta_time: float):
+        if self._done:
+            return
+        progress = self.state_manager.assets.progress(self.paths)
+        self.ui.shapes.set_rect(
+            self._fill,
+            self._left,
+            self._left + BAR_WIDTH * progress,
+            self._bottom,
+            self._bottom + BAR_HEIGHT,
+        )
+        self._label.set(int(progress * 100))
+        if progress >= 1.0:
+            self._done = True
+            self.then()
@@ -1,13 +1,18 @@
 import arcade
 
-from game.config import SCREEN_HEIGHT, SCREEN_TITLE, SCREEN_WIDTH
+from game.config import MENU_BACKGROUND, SCREEN_HEIGHT, SCREEN_TITLE, SCREEN_WIDTH
 from game.states.base import BaseView
 from game.ui.button import Button
+from game.ui.shape_batch import UIBatch
 
 
 class MenuView(BaseView):
+    # Decoded before the menu is shown; see StateManager.when_ready
+    ASSETS = (MENU_BACKGROUND,)
+
     def __init__(self, state_manager):
         super().__init__(state_manager)
+        self.ui = UIBatch()
 
         # Buttons - единая цветовая палитра (синие оттенки)
         button_width = 300
@@ -24,6 +29,7 @@ class MenuView(BaseView):
             color=(40, 80, 120),
             hover_color=(60, 120, 180),
             click_color=(20, 40, 80),
+            batch=self.ui,
         )
 
         self.settings_button = Button(
@@ -35,6 +41,7 @@ class MenuView(BaseView):
             color=(40, 80, 120),
             hover_color=(60, 120, 180),
             click_color=(20, 40, 80),
+            batch=self.ui,
         )
 
         self.exit_button = Button(
@@ -46,6 +53,7 @@ class MenuView(BaseView):
             color=(40, 80, 120),
             hover_color=(60, 120, 180),
             click_color=(20, 40, 80),
+            batch=self.ui,
         )
 
         # High score display
@@ -58,31 +66,26 @@ class MenuView(BaseView):
             arcade.color.GOLD,
             16,
             anchor_x="center",
+            batch=self.ui.text,
         )
 
         # Background
-        self.background_texture = arcade.load_texture(
-            "assets/backgrounds/menu_background.jpg"
-        )
+        self.background_texture = state_manager.assets.wait(MENU_BACKGROUND)
 
     def on_draw(self):
         self.clear()
 
         # Draw background (БЕЗ затемнения!)
-        arcade.draw_texture_rect(
-            self.background_texture,
-            arcade.rect.XYWH(
-                SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, SCREEN_WIDTH, SCREEN_HEIGHT
-            ),
-        )
-
-        # Draw buttons
-        self.start_button.draw()
-        self.settings_button.draw()
-        self.exit_button.draw()
-
-        # Draw high score
-        self._highscore_text.draw()
+        if self.background_texture is not None:
+            arcade.draw_texture_rect(
+                self.background_texture,
+                arcade.rect.XYWH(
+                    SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, SCREEN_WIDTH, SCREEN_HEIGHT
+                ),
+            )
+
+        # Draw buttons and high score
+        self.ui.draw()
 
     def on_mouse_motion(self, x: float, y: float, dx: float, dy: float):
         """Handle mouse movement for hover effects."""
@@ -1,14 +1,22 @@
 import arcade
 
-from game.config import SCREEN_HEIGHT, SCREEN_WIDTH
+from game.config import PAUSED_RENDER_FPS, RENDER_FPS, SCREEN_HEIGHT, SCREEN_WIDTH
 from game.states.base import BaseView
+from game.systems.snapshot import FrameSnapshot
 from game.ui.button import Button
+from game.ui.shape_batch import UIBatch
 
 
 class PauseView(BaseView):
     def __init__(self, state_manager, game_view):
         super().__init__(state_manager)
+        self.ui = UIBatch()
         self.game_view = game_view
+        # The game is frozen, so its last frame is drawn once and reused
+        self.snapshot = None
+
+        # Semi-transparent overlay over the game frame, first shape in the batch
+        self.ui.shapes.add_rect(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, (0, 0, 0, 180))
 
         # Title
         self._title_text = arcade.Text(
@@ -19,6 +27,7 @@ class PauseView(BaseView):
             48,
             anchor_x="center",
             bold=True,
+            batch=self.ui.text,
         )
 
         # Buttons - единая цветовая палитра
@@ -36,6 +45,7 @@ class PauseView(BaseView):
             color=(40, 80, 120),
             hover_color=(60, 120, 180),
             click_color=(20, 40, 80),
+            batch=self.ui,
         )
 
         self.settings_button = Button(
@@ -47,6 +57,7 @@ class PauseView(BaseView):
             color=(40, 80, 120),
             hover_color=(60, 120, 180),
             click_color=(20, 40, 80),
+            batch=self.ui,
         )
 
         self.quit_button = Button(
@@ -58,31 +69,35 @@ class PauseView(BaseView):
             color=(40, 80, 120),
             hover_color=(60, 120, 180),
             click_color=(20, 40, 80),
+            batch=self.ui,
         )
 
+    def on_show_view(self):
+        super().on_show_view()
+        if self.game_view and self.snapshot is None:
+            self.snapshot = FrameSnapshot(self.window)
+            self.snapshot.capture(self.game_view.on_draw)
+        # Nothing moves behind the menu; wake up less often
+        self.window.set_draw_rate(1 / PAUSED_RENDER_FPS)
+        self.window.set_update_rate(1 / PAUSED_RENDER_FPS)
+
+    def on_hide_view(self):
+        super().on_hide_view()
+        self.window.set_update_rate(1 / RENDER_FPS)
+        self.window.set_draw_rate(1 / RENDER_FPS)
+        if self.snapshot is not None:
+            self.snapshot.release()
+            self.snapshot = None
+
     def on_draw(self):
         self.clear()
 
-        # Draw game in background
-        if self.game_view:
-            self.game_view.on_draw()
-
-        # Draw semi-transparent overlay
-        arcade.draw_lrbt_rectangle_filled(
-            0,
-            SCREEN_WIDTH,
-            0,
-            SCREEN_HEIGHT,
-            (0, 0, 0, 180),
-        )
-
-        # Draw title
-        self._title_text.draw()
+        # Draw the frozen game frame in background
+        if self.snapshot is not None:
+            self.snapshot.draw()
 
-        # Draw buttons
-        self.resume_button.draw()
-        self.settings_button.draw()
-        self.quit_button.draw()
+        # Draw overlay, title and buttons
+        self.ui.draw()
 
     def on_mouse_motion(self, x: float, y: float, dx: float, dy: float):
         """Handle mouse movement for hover effects."""
@@ -4,11 +4,13 @@ from game.config import SCREEN_HEIGHT, SCREEN_WIDTH
 from game.states.base import BaseView
 from game.ui.slider import Slider
 from game.ui.button import Button
+from game.ui.shape_batch import UIBatch
 
 
 class SettingsView(BaseView):
     def __init__(self, state_manager):
         super().__init__(state_manager)
+        self.ui = UIBatch()
 
         # Title
         self._title_text = arcade.Text(
@@ -19,6 +21,7 @@ class SettingsView(BaseView):
             42,
             anchor_x="center",
             bold=True,
+            batch=self.ui.text,
         )
 
         # Sliders
@@ -37,6 +40,7 @@ class SettingsView(BaseView):
             max_value=1.0,
             initial_value=sound.music_volume,
             label="Music Volume:",
+            batch=self.ui,
         )
 
         self.sfx_slider = Slider(
@@ -48,6 +52,7 @@ class SettingsView(BaseView):
             max_value=1.0,
             initial_value=sound.sfx_volume,
             label="SFX Volume:",
+            batch=self.ui,
         )
 
         # Toggle buttons - единая цветовая палитра
@@ -64,6 +69,7 @@ class SettingsView(BaseView):
             color=(40, 80, 120),
             hover_color=(60, 120, 180),
             click_color=(20, 40, 80),
+            batch=self.ui,
         )
 
         sfx_text = "UNMUTE SFX" if sound.sfx_muted else "MUTE SFX"
@@ -76,6 +82,7 @@ class SettingsView(BaseView):
             color=(40, 80, 120),
             hover_color=(60, 120, 180),
             click_color=(20, 40, 80),
+            batch=self.ui,
         )
 
         # Back button
@@ -88,22 +95,14 @@ class SettingsView(BaseView):
             color=(40, 80, 120),
             hover_color=(60, 120, 180),
             click_color=(20, 40, 80),
+            batch=self.ui,
         )
 
     def on_draw(self):
         self.clear()
 
-        # Draw title
-        self._title_text.draw()
-
-        # Draw sliders
-        self.music_slider.draw()
-        self.sfx_slider.draw()
-
-        # Draw buttons
-        self.music_toggle_button.draw()
-        self.sfx_toggle_button.draw()
-        self.back_button.draw()
+        # Draw title, sliders and buttons
+        self.ui.draw()
 
     def on_mouse_motion(self, x: float, y: float, dx: float, dy: float):
         """Handle mouse movement."""
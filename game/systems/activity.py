@@ -0,0 +1,122 @@
+"""
+Sleep for enemies and moving platforms far from the view.
+
+An ActivityRegion keeps a level's movers in two groups. Awake ones are
+updated every tick as before. Asleep ones are not touched at all: they
+sit in a coarse spatial index under their *reach*, the rectangle they can
+be anywhere in (a patrol enemy's whole patrol span, a platform's
+whole path). Each tick the region around the view is queried to wake
+what has come near, and awake movers whose reach has left a slightly
+larger region go to sleep, so nothing flickers at the edge.
+
+A woken enemy catches up on the ticks it slept through in closed form
+(see ``Enemy.advance_asleep``), and a platform's position is a function
+of the tick anyway (see ``MovingPlatform.follow``), so where it reappears
+depends only on how long it slept, never on the frame rate or the path
+the camera took. Per-tick cost follows what is near the view, not the
+size of the level.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List
+
+import arcade
+
+from game.config import ACTIVITY_MARGIN
+from game.systems.spatial import Bounds, SpatialHash
+
+# Extra distance before an awake mover is put back to sleep
+SLEEP_HYSTERESIS = 128
+SLEEP_CELL_SIZE = 512
+
+
+class _Reach:
+    __slots__ = ("sprite", "left", "right", "bottom", "top", "since", "order")
+
+    def __init__(self, sprite, bounds: Bounds, since: int, order: int):
+        self.sprite = sprite
+        self.left, self.right, self.bottom, self.top = bounds
+        self.since = since
+        self.order = order
+
+
+def _overlaps(bounds: Bounds, region: Bounds) -> bool:
+    return (
+        bounds[0] <= region[1]
+        and bounds[1] >= region[0]
+        and bounds[2] <= region[3]
+        and bounds[3] >= region[2]
+    )
+
+
+def _expand(bounds: Bounds, margin: float) -> Bounds:
+    return (bounds[0] - margin, bounds[1] + margin, bounds[2] - margin, bounds[3] + margin)
+
+
+class ActivityRegion:
+    def __init__(self, margin: float = ACTIVITY_MARGIN, hysteresis: float = SLEEP_HYSTERESIS):
+        self.margin = margin
+        self.hysteresis = hysteresis
+        # Insertion-ordered so awake movers update in a stable order
+        self.awake_enemies: Dict[arcade.Sprite, None] = {}
+        self.active_platforms = arcade.SpriteList()
+        self._asleep: Dict[arcade.Sprite, _Reach] = {}
+        self._sleep_index = SpatialHash(SLEEP_CELL_SIZE)
+        self._platforms = set()
+        # Position in track() order, so movers woken together wake in a fixed order
+        self._order: Dict[arcade.Sprite, int] = {}
+
+    def track(self, enemies: Iterable = (), platforms: Iterable = ()):
+        """Start tracking movers; they begin awake."""
+        for enemy in enemies:
+            self._order[enemy] = len(self._order)
+            self.awake_enemies[enemy] = None
+        for platform in platforms:
+            self._order[platform] = len(self._order)
+            self._platforms.add(platform)
+            self.active_platforms.append(platform)
+
+    @property
+    def asleep_count(self) -> int:
+        return len(self._asleep)
+
+    def is_asleep(self, sprite) -> bool:
+        return sprite in self._asleep
+
+    def update(self, view: Bounds, tick: int, delta_time: float) -> List[arcade.Sprite]:
+        """Sleep and wake movers for a view rectangle; returns the ones woken."""
+        wake_region = _expand(view, self.margin)
+        keep_region = _expand(view, self.margin + self.hysteresis)
+
+        for enemy in list(self.awake_enemies):
+            if enemy.can_sleep and not _overlaps(enemy.reach(), keep_region):
+                del self.awake_enemies[enemy]
+                self._sleep(enemy, enemy.reach(), tick)
+        for platform in list(self.active_platforms):
+            reach = platform.reach()
+            if not _overlaps(reach, keep_region):
+                self.active_platforms.remove(platform)
+                self._sleep(platform, reach, tick)
+
+        woken = []
+        # The index hands back a set; sort it so update order, and so event
+        # order, is the same on every run
+        near = sorted(self._sleep_index.query(*wake_region), key=lambda reach: reach.order)
+        for reach in near:
+            sprite = reach.sprite
+            self._sleep_index.remove(reach)
+            del self._asleep[sprite]
+            if sprite in self._platforms:
+                # The simulation puts it where its path is at this tick
+                self.active_platforms.append(sprite)
+            else:
+                sprite.advance_asleep(tick - reach.since, delta_time)
+                self.awake_enemies[sprite] = None
+            woken.append(sprite)
+        return woken
+
+    def _sleep(self, sprite, reach: Bounds, tick: int):
+        entry = _Reach(sprite, reach, tick, self._order[sprite])
+        self._asleep[sprite] = entry
+        self._sleep_index.add(entry)
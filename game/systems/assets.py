@@ -0,0 +1,189 @@
+"""
+Background decoding of everything under assets/.
+
+The manifest lists every image and sound file under ASSETS_PATH with its
+size. AssetManager decodes them on a small thread pool: images become
+arcade.Textures (CPU only; they reach the atlas when first drawn) and
+sounds are decoded into memory, so the first frame no longer waits for
+them. Screens ask for what they need:
+
+- ``get`` never blocks and returns None until the asset is decoded,
+- ``request`` queues a set of paths, and ``ready`` and ``progress``
+  drive a loading screen over it,
+- ``wait`` blocks for one asset, decoding it on the spot if nothing
+  queued it, so code that runs before ``start`` keeps working.
+
+An asset that fails to decode (a missing codec, a broken file) counts as
+done; ``get`` returns None for it and the error is kept in ``errors``.
+Call everything but the decoding itself from the main thread.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import arcade
+
+from game.config import ASSET_WORKERS, ASSETS_PATH
+
+KIND_IMAGE = "image"
+KIND_SOUND = "sound"
+
+_KINDS = {
+    ".png": KIND_IMAGE,
+    ".jpg": KIND_IMAGE,
+    ".jpeg": KIND_IMAGE,
+    ".wav": KIND_SOUND,
+    ".ogg": KIND_SOUND,
+    ".mp3": KIND_SOUND,
+}
+
+
+@dataclass(frozen=True)
+class AssetEntry:
+    path: str
+    kind: str
+    size: int
+
+
+def asset_key(path) -> str:
+    """Manifest key for ``path``: relative to the working directory, with /."""
+    return Path(os.path.relpath(path)).as_posix()
+
+
+def build_manifest(root: str = ASSETS_PATH) -> Dict[str, AssetEntry]:
+    """Every decodable file under ``root``, keyed by ``asset_key``."""
+    manifest = {}
+    for path in sorted(Path(root).rglob("*")):
+        kind = _KINDS.get(path.suffix.lower())
+        if kind is None or not path.is_file():
+            continue
+        key = asset_key(path)
+        manifest[key] = AssetEntry(key, kind, path.stat().st_size)
+    return manifest
+
+
+def decode(entry: AssetEntry):
+    if entry.kind == KIND_IMAGE:
+        return arcade.load_texture(entry.path)
+    return arcade.Sound(entry.path)
+
+
+class AssetManager:
+    def __init__(
+        self,
+        manifest: Optional[Dict[str, AssetEntry]] = None,
+        workers: int = ASSET_WORKERS,
+    ):
+        self._manifest = manifest
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[str, Future] = {}
+        self._loaded: Dict[str, object] = {}
+        self.errors: Dict[str, str] = {}
+
+    @property
+    def manifest(self) -> Dict[str, AssetEntry]:
+        if self._manifest is None:
+            self._manifest = build_manifest()
+        return self._manifest
+
+    def start(self, first: Iterable = ()):
+        """Queue every asset in the manifest, ``first`` ahead of the rest."""
+        self.request(first)
+        self.request(self.manifest)
+
+    def request(self, paths: Iterable):
+        """Queue ``paths`` for decoding unless they already are."""
+        for path in paths:
+            self._queue(asset_key(path))
+
+    def get(self, path):
+        """The decoded asset, or None while it is loading or if it failed."""
+        key = asset_key(path)
+        if key not in self._loaded:
+            self._collect(key)
+        return self._loaded.get(key)
+
+    def wait(self, path):
+        """The decoded asset, blocking until it is ready."""
+        key = asset_key(path)
+        if key not in self._loaded and key not in self.errors:
+            future = self._pending.get(key)
+            if future is None or future.cancel():
+                self._pending.pop(key, None)
+                self._store(key, self._decode, key)
+            else:
+                del self._pending[key]
+                self._store(key, future.result)
+        return self._loaded.get(key)
+
+    def is_done(self, path) -> bool:
+        key = asset_key(path)
+        if key in self._loaded or key in self.errors:
+            return True
+        return self._collect(key)
+
+    def ready(self, paths: Iterable) -> bool:
+        return all(self.is_done(path) for path in paths)
+
+    def progress(self, paths: Optional[Iterable] = None) -> float:
+        """Fraction of the bytes in ``paths`` (default: everything) decoded."""
+        keys = list(self.manifest) if paths is None else [asset_key(path) for path in paths]
+        total = done = 0
+        for key in keys:
+            entry = self.manifest.get(key)
+            # Files outside the manifest still count, as one byte each
+            size = max(1, entry.size) if entry is not None else 1
+            total += size
+            if self.is_done(key):
+                done += size
+        return done / total if total else 1.0
+
+    def shutdown(self):
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _queue(self, key: str):
+        if key in self._pending or key in self._loaded or key in self.errors:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="assets"
+            )
+        self._pending[key] = self._executor.submit(self._decode, key)
+
+    def _decode(self, key: str):
+        entry = self.manifest.get(key)
+        if entry is None:
+            kind = _KINDS.get(Path(key).suffix.lower(), KIND_IMAGE)
+            entry = AssetEntry(key, kind, 0)
+        return decode(entry)
+
+    def _collect(self, key: str) -> bool:
+        """Take a finished background decode; False while it is still running."""
+        future = self._pending.get(key)
+        if future is None or not future.done():
+            return False
+        del self._pending[key]
+        self._store(key, future.result)
+        return True
+
+    def _store(self, key: str, load, *args):
+        try:
+            self._loaded[key] = load(*args)
+        except Exception as e:
+            print(f"Asset {key} failed to load: {e}")
+            self.errors[key] = str(e)
+
+
+# Shared by the whole game, like texture_registry
+asset_manager = AssetManager()
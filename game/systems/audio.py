@@ -2,15 +2,24 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import arcade
+from game.systems.assets import AssetManager, asset_manager
 
 
 class SoundManager:
-    def __init__(self):
+    """Sound effects and music, decoded by an AssetManager in the background.
+
+    A sound asked for before it is decoded is skipped (effects) or starts
+    once it is ready (music; see ``update``).
+    """
+
+    def __init__(self, assets: AssetManager = asset_manager):
+        self.assets = assets
         self.sfx = {}
         self.music = None
         self.music_player = None
         self.current_music_path = None
+        # Music asked for while still decoding
+        self.pending_music_path = None
         self.sfx_volume = 0.5
         self.music_volume = 0.5
         self.sfx_muted = False
@@ -19,11 +28,13 @@ class SoundManager:
     def load_sfx(self, key: str, path: str):
         if not Path(path).exists():
             return False
-        self.sfx[key] = arcade.Sound(path)
+        self.sfx[key] = path
+        self.assets.request([path])
         return True
 
     def play_sfx(self, key: str):
-        sound = self.sfx.get(key)
+        path = self.sfx.get(key)
+        sound = self.assets.get(path) if path else None
         if sound:
             volume = 0.0 if self.sfx_muted else self.sfx_volume
             sound.play(volume=volume)
@@ -37,14 +48,29 @@ class SoundManager:
             return True
         
         self.stop_music()
-        self.music = arcade.Sound(path)
+        music = self.assets.get(path)
+        if music is None:
+            self.assets.request([path])
+            self.pending_music_path = path
+            return True
+        self.music = music
         self.music_player = self.music.play(
             volume=self._music_effective_volume(), loop=True
         )
         self.current_music_path = path
         return True
 
+    def update(self):
+        """Start music that finished decoding since it was asked for."""
+        path = self.pending_music_path
+        if path is None or not self.assets.is_done(path):
+            return
+        self.pending_music_path = None
+        if self.assets.get(path) is not None:
+            self.play_music(path)
+
     def stop_music(self):
+        self.pending_music_path = None
         if self.music_player:
             try:
                 self.music_player.pause()
@@ -0,0 +1,581 @@
+"""
+Vectorized playtesting: many copies of one level stepped in lock-step.
+
+BatchSimulation keeps every instance's player and enemies in NumPy arrays
+and runs LevelSimulation's rules for all of them at once against the
+level's colliders. Moving platforms do not depend on the player, so one
+copy is shared by every instance. The level is built once through
+LevelSimulation, so colliders, hit boxes and finish platforms match the
+real game.
+
+Collision resolution snaps to edges instead of running arcade's
+pixel-stepping loops, so trajectories can drift from LevelSimulation by
+a fraction of a pixel; use it for statistics, not replays.
+
+    python -m game.systems.batch_simulation 1 2 3 --runs 1000 --policy random
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from game.config import (
+    JUMP_BLOCK_CHECK_DISTANCE,
+    PLAYER_JUMP_HOLD_FORCE,
+    PLAYER_JUMP_HOLD_FRAMES,
+    PLAYER_JUMP_SPEED,
+    PLAYER_MOVE_SPEED,
+    SIMULATION_RATE,
+)
+from game.entities.enemy import JumpingEnemy, PatrolEnemy
+from game.levels import LevelSpec, level_registry
+from game.systems.simulation import (
+    FALL_DEATH_Y,
+    PLAYER_LIVES,
+    RIDE_TOLERANCE,
+    SIMULATION_DT,
+    LevelSimulation,
+    PlayerInput,
+)
+
+
+# left, right, jump_pressed, jump_held; each a bool array of shape (count,)
+BatchInput = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+Policy = Callable[["BatchSimulation", int], BatchInput]
+
+DEFAULT_MAX_TIME = 120.0
+
+_KIND_PATROL = 0
+_KIND_JUMPING = 1
+_KIND_STATIC = 2
+
+
+def _bounds(sprites) -> np.ndarray:
+    """(K, 4) array of left, right, bottom, top."""
+    boxes = [(s.left, s.right, s.bottom, s.top) for s in sprites]
+    return np.array(boxes, dtype=np.float64).reshape(-1, 4)
+
+
+def _box_offsets(sprite) -> Tuple[float, float, float, float]:
+    return (
+        sprite.left - sprite.center_x,
+        sprite.right - sprite.center_x,
+        sprite.bottom - sprite.center_y,
+        sprite.top - sprite.center_y,
+    )
+
+
+def _overlaps(left, right, bottom, top, boxes: np.ndarray) -> np.ndarray:
+    """Strict AABB overlap of every row against every box: shape (rows, K).
+
+    Touching edges do not count, like arcade.check_for_collision.
+    """
+    if len(boxes) == 0:
+        return np.zeros((np.shape(left)[0], 0), dtype=bool)
+    return (
+        (left[:, None] < boxes[None, :, 1])
+        & (right[:, None] > boxes[None, :, 0])
+        & (bottom[:, None] < boxes[None, :, 3])
+        & (top[:, None] > boxes[None, :, 2])
+    )
+
+
+def _move(x, y, vx, vy, offsets, walls, wall_vx, wall_vy):
+    """One platformer move (gravity already applied): y first, then x.
+
+    Mirrors arcade's PhysicsEnginePlatformer: landing carries the body by
+    the platform's change_x and walls low enough are stepped up onto.
+    """
+    off_l, off_r, off_b, off_t = offsets
+
+    y = y + vy
+    hits = _overlaps(x + off_l, x + off_r, y + off_b, y + off_t, walls)
+    any_hit = hits.any(axis=1)
+    if any_hit.any():
+        up = any_hit & (vy > 0)
+        down = any_hit & (vy < 0)
+        lowest_bottom = np.where(hits, walls[None, :, 2], np.inf).min(axis=1)
+        highest_top = np.where(hits, walls[None, :, 3], -np.inf).max(axis=1)
+        y = np.where(up, lowest_bottom - off_t, y)
+        y = np.where(down, highest_top - off_b, y)
+        carry = np.where(hits, wall_vx[None, :], 0.0).sum(axis=1)
+        x = x + np.where(down, carry, 0.0)
+        first = hits.argmax(axis=1)
+        vy = np.where(any_hit, np.minimum(0.0, wall_vy[first]), vy)
+    y = np.round(y, 2)
+
+    moving = vx != 0
+    if not moving.any():
+        return x, y, vy
+    new_x = x + vx
+    hits = _overlaps(new_x + off_l, new_x + off_r, y + off_b, y + off_t, walls) & moving[:, None]
+    blocked = hits.any(axis=1)
+    if blocked.any():
+        # Step up onto anything no higher than this tick's horizontal speed
+        raised = y + np.abs(vx)
+        clear = ~_overlaps(
+            new_x + off_l, new_x + off_r, raised + off_b, raised + off_t, walls
+        ).any(axis=1)
+        step_up = blocked & clear
+        highest_top = np.where(hits, walls[None, :, 3], -np.inf).max(axis=1)
+        y = np.where(step_up, np.maximum(y, highest_top - off_b), y)
+
+        wall = blocked & ~step_up
+        nearest_left = np.where(hits, walls[None, :, 0], np.inf).min(axis=1)
+        nearest_right = np.where(hits, walls[None, :, 1], -np.inf).max(axis=1)
+        new_x = np.where(wall & (vx > 0), nearest_left - off_r, new_x)
+        new_x = np.where(wall & (vx < 0), nearest_right - off_l, new_x)
+    return new_x, y, vy
+
+
+class BatchSimulation:
+    """``count`` independent playthroughs of one LevelSpec.
+
+    Instances keep stepping after they finish (it is cheaper than masking);
+    their outcome is frozen in ``finished``/``won``/``finish_time`` the
+    first time they win or lose.
+    """
+
+    def __init__(
+        self,
+        spec: LevelSpec,
+        count: int,
+        seed: Optional[int] = None,
+        lives: int = PLAYER_LIVES,
+    ):
+        self.spec = spec
+        self.count = count
+        self.rng = np.random.default_rng(seed)
+
+        world = LevelSimulation(spec=spec, lives=lives)
+        self.gravity = spec.gravity_constant
+        self.spawn_point = world.spawn_point
+        self.level_end_x = world.level_end_x
+        self._player_offsets = _box_offsets(world.player)
+
+        self._static = _bounds(world.platform_list)
+        self._finish_boxes = _bounds(world.finish_platform_list)
+        self._hazards = _bounds(world.hazard_list)
+        self._coins = _bounds(world.coin_list)
+        self._coin_values = np.array(
+            [getattr(coin, "value", 0) for coin in world.coin_list], dtype=np.int64
+        )
+
+        platforms = list(world.moving_platform_list)
+        self._mp_paths = [p.path for p in platforms]
+        self._mp_x = np.array([p.center_x for p in platforms], dtype=np.float64)
+        self._mp_y = np.array([p.center_y for p in platforms], dtype=np.float64)
+        self._mp_half_w = np.array([p.width / 2 for p in platforms], dtype=np.float64)
+        self._mp_half_h = np.array([p.height / 2 for p in platforms], dtype=np.float64)
+        self._mp_dx = np.zeros(len(platforms))
+        self._mp_dy = np.zeros(len(platforms))
+
+        enemies = list(world.enemy_list)
+        self._enemy_count = len(enemies)
+        self._enemy_offsets = tuple(
+            np.array(values, dtype=np.float64)
+            for values in zip(*(_box_offsets(e) for e in enemies))
+        ) if enemies else tuple(np.zeros(0) for _ in range(4))
+        self._enemy_kind = np.array(
+            [
+                _KIND_PATROL if isinstance(e, PatrolEnemy)
+                else _KIND_JUMPING if isinstance(e, JumpingEnemy)
+                else _KIND_STATIC
+                for e in enemies
+            ],
+            dtype=np.int8,
+        )
+        self._enemy_left_bound = np.array([getattr(e, "left_bound", 0.0) for e in enemies])
+        self._enemy_right_bound = np.array([getattr(e, "right_bound", 0.0) for e in enemies])
+        self._jump_min = np.array([getattr(e, "jump_interval_min", 1.0) for e in enemies])
+        self._jump_max = np.array([getattr(e, "jump_interval_max", 1.0) for e in enemies])
+        self._jump_strength = np.array([getattr(e, "jump_strength", 0.0) for e in enemies])
+
+        shape = (count, self._enemy_count)
+        self.enemy_x = np.broadcast_to([e.center_x for e in enemies], shape).astype(np.float64)
+        self.enemy_y = np.broadcast_to([e.center_y for e in enemies], shape).astype(np.float64)
+        self.enemy_vx = np.broadcast_to([e.change_x for e in enemies], shape).astype(np.float64)
+        self.enemy_vy = np.zeros(shape)
+        self._enemy_timer = self.rng.uniform(self._jump_min, self._jump_max, size=shape)
+
+        self.x = np.full(count, float(self.spawn_point[0]))
+        self.y = np.full(count, float(self.spawn_point[1]))
+        self.vx = np.zeros(count)
+        self.vy = np.zeros(count)
+        self._jump_active = np.zeros(count, dtype=bool)
+        self._jump_frames = np.zeros(count, dtype=np.int32)
+        # Index of the moving platform each instance rides, or -1
+        self._riding = np.full(count, -1, dtype=np.int64)
+        self.lives = np.full(count, lives, dtype=np.int32)
+        self.deaths = np.zeros(count, dtype=np.int32)
+        self.score = np.zeros(count, dtype=np.int64)
+        self.coins_taken = np.zeros((count, len(self._coins)), dtype=bool)
+
+        self.ticks = 0
+        self.time_elapsed = 0.0
+        self.finished = np.zeros(count, dtype=bool)
+        self.won = np.zeros(count, dtype=bool)
+        self.finish_time = np.full(count, np.nan)
+        self.final_score = np.zeros(count, dtype=np.int64)
+
+    @property
+    def all_finished(self) -> bool:
+        return bool(self.finished.all())
+
+    def step(self, inputs: BatchInput, delta_time: float = SIMULATION_DT):
+        """Advance every instance by one tick."""
+        left, right, jump_pressed, jump_held = (np.asarray(a, dtype=bool) for a in inputs)
+        self.ticks += 1
+        self.time_elapsed += delta_time
+        self._update_enemy_ai(delta_time)
+
+        spec = self.spec
+        if spec.time_limit is not None and self.time_elapsed >= spec.time_limit:
+            self._finish(np.ones(self.count, dtype=bool), won=False)
+            return
+
+        self._step_moving_platforms()
+        self._carry_riders()
+
+        input_dx = (right.astype(np.float64) - left.astype(np.float64)) * PLAYER_MOVE_SPEED
+        self.vx = input_dx
+
+        # Jump start needs ground within 5px and nothing solid just overhead
+        walls, wall_vx, wall_vy = self._walls()
+        off_l, off_r, off_b, off_t = self._player_offsets
+        left_edge, right_edge = self.x + off_l, self.x + off_r
+        grounded = _overlaps(
+            left_edge, right_edge, self.y - 5 + off_b, self.y - 5 + off_t, walls
+        ).any(axis=1)
+        # Swept like queries.sweep: only what starts at or above the head blocks
+        head = self.y + off_t
+        blocked = (
+            _overlaps(left_edge, right_edge, head, head + JUMP_BLOCK_CHECK_DISTANCE, walls)
+            & (walls[None, :, 2] >= head[:, None])
+        ).any(axis=1)
+        jump = jump_pressed & grounded & ~blocked
+        self.vy = np.where(jump, float(PLAYER_JUMP_SPEED), self.vy)
+        self._jump_frames = np.where(jump, 0, self._jump_frames)
+        self._jump_active |= jump
+        self._riding = np.where(jump, -1, self._riding)
+
+        holding = self._jump_active & jump_held & (self._jump_frames < PLAYER_JUMP_HOLD_FRAMES)
+        self.vy = np.where(holding, self.vy + PLAYER_JUMP_HOLD_FORCE, self.vy)
+        self._jump_frames = np.where(holding, self._jump_frames + 1, self._jump_frames)
+        released = self._jump_active & ~jump_held & (self.vy > 0)
+        self.vy = np.where(released, self.vy * 0.6, self.vy)
+        self._jump_frames = np.where(released, PLAYER_JUMP_HOLD_FRAMES, self._jump_frames)
+        self._jump_active &= ~released & ~(holding & (self._jump_frames >= PLAYER_JUMP_HOLD_FRAMES))
+
+        # Riders are carried above, so landing on a platform carries nothing
+        no_carry = np.zeros(len(walls))
+        self.vy = self.vy - self.gravity
+        self.x, self.y, self.vy = _move(
+            self.x, self.y, self.vx, self.vy, self._player_offsets, walls, no_carry, no_carry
+        )
+        self._find_riders()
+        self._step_enemy_physics(walls, wall_vx, wall_vy)
+        self._check_pickups_and_finish()
+
+    def run(self, policy: Policy, max_ticks: int):
+        """Step until every instance finished or ``max_ticks`` ran out."""
+        while self.ticks < max_ticks and not self.all_finished:
+            self.step(policy(self, self.ticks))
+
+    def _walls(self):
+        """Moving platforms (current positions) followed by static colliders."""
+        moving = np.stack(
+            (
+                self._mp_x - self._mp_half_w,
+                self._mp_x + self._mp_half_w,
+                self._mp_y - self._mp_half_h,
+                self._mp_y + self._mp_half_h,
+            ),
+            axis=1,
+        ).reshape(-1, 4)
+        walls = np.concatenate((moving, self._static))
+        zeros = np.zeros(len(self._static))
+        return (
+            walls,
+            np.concatenate((self._mp_dx, zeros)),
+            np.concatenate((self._mp_dy, zeros)),
+        )
+
+    def _step_moving_platforms(self):
+        """Every platform to its path's position at this tick, as in LevelSimulation."""
+        if not self._mp_paths:
+            return
+        now = np.array([path.position(self.ticks) for path in self._mp_paths])
+        last = np.array([path.position(self.ticks - 1) for path in self._mp_paths])
+        self._mp_x, self._mp_y = now[:, 0], now[:, 1]
+        self._mp_dx, self._mp_dy = now[:, 0] - last[:, 0], now[:, 1] - last[:, 1]
+
+    def _carry_riders(self):
+        """LevelSimulation's carry: riders move with their platform unless a wall is in the way."""
+        riding = self._riding >= 0
+        if not riding.any():
+            return
+        index = np.maximum(self._riding, 0)
+        off_l, off_r, off_b, off_t = self._player_offsets
+        x = self.x + np.where(riding, self._mp_dx[index], 0.0)
+        blocked = _overlaps(x + off_l, x + off_r, self.y + off_b, self.y + off_t, self._static)
+        self.x = np.where(blocked.any(axis=1), self.x, x)
+        y = self.y + np.where(riding, self._mp_dy[index], 0.0)
+        blocked = _overlaps(self.x + off_l, self.x + off_r, y + off_b, y + off_t, self._static)
+        self.y = np.where(blocked.any(axis=1), self.y, y)
+
+    def _find_riders(self):
+        """The highest moving platform under each instance's feet, or -1."""
+        if not self._mp_paths:
+            return
+        off_l, off_r, off_b, _ = self._player_offsets
+        tops = self._mp_y + self._mp_half_h
+        feet = self.y + off_b
+        under = (
+            (self.x[:, None] + off_l < (self._mp_x + self._mp_half_w)[None, :])
+            & (self.x[:, None] + off_r > (self._mp_x - self._mp_half_w)[None, :])
+            & (np.abs(tops[None, :] - feet[:, None]) <= RIDE_TOLERANCE)
+        )
+        standing = under.any(axis=1) & (self.vy <= 0) & ~self._jump_active
+        best = np.where(under, tops[None, :], -np.inf).argmax(axis=1)
+        self._riding = np.where(standing, best, -1)
+
+    def _update_enemy_ai(self, delta_time: float):
+        """Enemy.update: patrol turns and jump timers, then the sprite's own move."""
+        if not self._enemy_count:
+            return
+        patrol = self._enemy_kind == _KIND_PATROL
+        left, right = self._enemy_left_bound, self._enemy_right_bound
+        over = patrol & (self.enemy_x > right)
+        under = patrol & (self.enemy_x < left)
+        speed = np.abs(self.enemy_vx)
+        self.enemy_x = np.where(
+            over, 2 * right - self.enemy_x, np.where(under, 2 * left - self.enemy_x, self.enemy_x)
+        )
+        self.enemy_vx = np.where(over, -speed, np.where(under, speed, self.enemy_vx))
+
+        jumping = self._enemy_kind == _KIND_JUMPING
+        self._enemy_timer = np.where(jumping, self._enemy_timer - delta_time, self._enemy_timer)
+        jump = jumping & (self._enemy_timer <= 0)
+        if jump.any():
+            self.enemy_vy = np.where(jump, self._jump_strength, self.enemy_vy)
+            fresh = self.rng.uniform(self._jump_min, self._jump_max, size=self._enemy_timer.shape)
+            self._enemy_timer = np.where(jump, fresh, self._enemy_timer)
+
+        self.enemy_x = self.enemy_x + self.enemy_vx
+        self.enemy_y = self.enemy_y + self.enemy_vy
+
+    def _step_enemy_physics(self, walls, wall_vx, wall_vy):
+        if not self._enemy_count:
+            return
+        shape = self.enemy_x.shape
+        offsets = tuple(np.broadcast_to(o, shape).ravel() for o in self._enemy_offsets)
+        vy = self.enemy_vy.ravel() - self.gravity
+        x, y, vy = _move(
+            self.enemy_x.ravel(), self.enemy_y.ravel(), self.enemy_vx.ravel(), vy,
+            offsets, walls, wall_vx, wall_vy,
+        )
+        self.enemy_x, self.enemy_y, self.enemy_vy = (
+            x.reshape(shape), y.reshape(shape), vy.reshape(shape)
+        )
+
+    def _check_pickups_and_finish(self):
+        off_l, off_r, off_b, off_t = self._player_offsets
+        left, right = self.x + off_l, self.x + off_r
+        bottom, top = self.y + off_b, self.y + off_t
+
+        if len(self._coins):
+            new_coins = _overlaps(left, right, bottom, top, self._coins) & ~self.coins_taken
+            self.coins_taken |= new_coins
+            self.score += (new_coins * self._coin_values[None, :]).sum(axis=1)
+
+        dead = _overlaps(left, right, bottom, top, self._hazards).any(axis=1)
+        if self._enemy_count:
+            ex0, ex1, ey0, ey1 = self._enemy_offsets
+            dead |= (
+                (left[:, None] < self.enemy_x + ex1)
+                & (right[:, None] > self.enemy_x + ex0)
+                & (bottom[:, None] < self.enemy_y + ey1)
+                & (top[:, None] > self.enemy_y + ey0)
+            ).any(axis=1)
+
+        at_finish = _overlaps(left, right, bottom, top, self._finish_boxes).any(axis=1)
+        if self.level_end_x:
+            at_finish |= self.x >= self.level_end_x - 50
+        if self.spec.requires_all_coins:
+            at_finish &= self.coins_taken.all(axis=1)
+        at_finish &= ~dead
+        self._finish(at_finish, won=True)
+
+        dead |= ~at_finish & (self.y < FALL_DEATH_Y)
+        if dead.any():
+            self.deaths += dead & ~self.finished
+            self.lives -= dead
+            self._finish(dead & (self.lives <= 0), won=False)
+            respawn = dead & (self.lives > 0)
+            self.x = np.where(respawn, float(self.spawn_point[0]), self.x)
+            self.y = np.where(respawn, float(self.spawn_point[1]), self.y)
+            self.vx = np.where(respawn, 0.0, self.vx)
+            self.vy = np.where(respawn, 0.0, self.vy)
+            self._riding = np.where(respawn, -1, self._riding)
+
+    def _finish(self, mask: np.ndarray, won: bool):
+        mask = mask & ~self.finished
+        if not mask.any():
+            return
+        self.finished |= mask
+        self.won |= mask & won
+        self.finish_time = np.where(mask, self.time_elapsed, self.finish_time)
+        self.final_score = np.where(mask, self.score, self.final_score)
+
+
+class ScriptedPolicy:
+    """The same input sequence for every instance, looped."""
+
+    def __init__(self, script: Sequence[PlayerInput]):
+        if not script:
+            raise ValueError("ScriptedPolicy needs at least one input")
+        self.script = list(script)
+
+    @classmethod
+    def run_and_jump(cls, period: int = 40, hold: int = 20) -> "ScriptedPolicy":
+        """Hold right; press jump every ``period`` ticks and hold it ``hold`` ticks."""
+        return cls(
+            [
+                PlayerInput(right=True, jump_pressed=tick == 0, jump_held=tick < hold)
+                for tick in range(period)
+            ]
+        )
+
+    def __call__(self, sim: BatchSimulation, tick: int) -> BatchInput:
+        step = self.script[tick % len(self.script)]
+        return tuple(
+            np.full(sim.count, value, dtype=bool)
+            for value in (step.left, step.right, step.jump_pressed, step.jump_held)
+        )
+
+
+class RandomPolicy:
+    """Per-instance random walk biased towards the right, with random jumps."""
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        right_bias: float = 0.75,
+        switch_probability: float = 0.05,
+        jump_probability: float = 0.08,
+        hold_ticks: Tuple[int, int] = (2, PLAYER_JUMP_HOLD_FRAMES),
+    ):
+        self.rng = np.random.default_rng(seed)
+        rest = (1.0 - right_bias) / 2
+        self.direction_weights = (rest, rest, right_bias)
+        self.switch_probability = switch_probability
+        self.jump_probability = jump_probability
+        self.hold_ticks = hold_ticks
+        self._direction = None
+        self._hold = None
+
+    def _pick_directions(self, count: int) -> np.ndarray:
+        return self.rng.choice((-1, 0, 1), size=count, p=self.direction_weights)
+
+    def __call__(self, sim: BatchSimulation, tick: int) -> BatchInput:
+        count = sim.count
+        if self._direction is None or len(self._direction) != count:
+            self._direction = self._pick_directions(count)
+            self._hold = np.zeros(count, dtype=np.int32)
+
+        switch = self.rng.random(count) < self.switch_probability
+        self._direction = np.where(switch, self._pick_directions(count), self._direction)
+
+        low, high = self.hold_ticks
+        pressed = (self._hold == 0) & (self.rng.random(count) < self.jump_probability)
+        self._hold = np.where(
+            pressed, self.rng.integers(low, high + 1, size=count), np.maximum(self._hold - 1, 0)
+        )
+        return self._direction < 0, self._direction > 0, pressed, self._hold > 0
+
+
+@dataclass
+class PlaytestReport:
+    level_id: int
+    runs: int
+    completed: int
+    completion_rate: float
+    par_time: Optional[float]
+    best_time: Optional[float]
+    mean_score: float
+    mean_deaths: float
+    seconds: float
+
+
+def playtest(
+    spec: LevelSpec,
+    policy: Policy,
+    runs: int = 1000,
+    max_time: float = DEFAULT_MAX_TIME,
+    seed: Optional[int] = None,
+) -> PlaytestReport:
+    """Play ``runs`` instances of ``spec`` with ``policy`` and summarise them.
+
+    ``par_time`` is the median completion time of the runs that finished.
+    """
+    start = time.perf_counter()
+    sim = BatchSimulation(spec, runs, seed=seed)
+    limit = spec.time_limit if spec.time_limit is not None else max_time
+    sim.run(policy, max_ticks=int(np.ceil(limit * SIMULATION_RATE)) + 1)
+
+    times = sim.finish_time[sim.won]
+    completed = int(sim.won.sum())
+    score = np.where(sim.finished, sim.final_score, sim.score)
+    return PlaytestReport(
+        level_id=spec.level_id,
+        runs=runs,
+        completed=completed,
+        completion_rate=completed / runs if runs else 0.0,
+        par_time=float(np.median(times)) if completed else None,
+        best_time=float(times.min()) if completed else None,
+        mean_score=float(score.mean()) if runs else 0.0,
+        mean_deaths=float(sim.deaths.mean()) if runs else 0.0,
+        seconds=time.perf_counter() - start,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Estimate completion rate and par time with simulated players."
+    )
+    parser.add_argument("levels", nargs="*", type=int, help="level ids (default: all)")
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--policy", choices=("random", "scripted"), default="random")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-time", type=float, default=DEFAULT_MAX_TIME)
+    args = parser.parse_args(argv)
+
+    level_ids = args.levels or level_registry.level_ids()
+    for level_id in level_ids:
+        spec = level_registry.get(level_id)
+        if spec is None:
+            print(f"Level {level_id}: not found")
+            continue
+        if args.policy == "random":
+            policy = RandomPolicy(seed=args.seed)
+        else:
+            policy = ScriptedPolicy.run_and_jump()
+        report = playtest(spec, policy, args.runs, args.max_time, seed=args.seed)
+        par = "-" if report.par_time is None else f"{report.par_time:.2f}s"
+        print(
+            f"Level {level_id}: {report.completion_rate:.1%} of {report.runs} runs, "
+            f"par {par}, mean score {report.mean_score:.1f}, "
+            f"mean deaths {report.mean_deaths:.2f} ({report.seconds:.2f}s)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
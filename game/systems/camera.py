@@ -33,6 +33,20 @@ class CameraManager:
     def use_hud(self):
         self.hud_camera.use()
 
+    def visible_bounds(self):
+        """World-space (left, right, bottom, top) the world camera shows."""
+        camera = self.world_camera
+        if CAMERA_MODE == "legacy":
+            left, bottom = camera.position
+            return (
+                left,
+                left + camera.viewport_width,
+                bottom,
+                bottom + camera.viewport_height,
+            )
+        rect = camera.aabb()
+        return (rect.left, rect.right, rect.bottom, rect.top)
+
     def update(self, target_sprite):
         if target_sprite is None:
             return
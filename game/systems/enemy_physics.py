@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import List, Sequence
+
+import arcade
+
+from game.config import GRAVITY
+from game.systems.spatial import SpatialHash
+
+
+class EnemyPhysics:
+    """One platformer physics pass for every enemy in a level.
+
+    Replaces one arcade.PhysicsEnginePlatformer per enemy. Each enemy gets
+    gravity, a y move resolved against walls, then an x move resolved the
+    same way (with the engine's step-up over small ledges). Walls come from
+    the level's spatial indexes, so each enemy only tests nearby geometry.
+    Moving platforms follow their paths in LevelSimulation, not here.
+    """
+
+    def __init__(
+        self,
+        enemies: arcade.SpriteList,
+        obstacles: Sequence[SpatialHash],
+        gravity_constant: float = GRAVITY,
+    ):
+        self.enemies = enemies
+        self.obstacles = list(obstacles)
+        self.gravity_constant = gravity_constant
+
+    def update(self, enemies=None):
+        """Step ``enemies`` (default: every enemy)."""
+        for enemy in self.enemies if enemies is None else enemies:
+            self.step(enemy)
+
+    def step(self, enemy):
+        enemy.change_y -= self.gravity_constant
+
+        # --- Move in the y direction
+        enemy.center_y += enemy.change_y
+        hits = self._collisions(enemy)
+        if hits:
+            if enemy.change_y > 0:
+                enemy.top = min(hit.bottom for hit in hits)
+            elif enemy.change_y < 0:
+                enemy.bottom = max(hit.top for hit in hits)
+                # Ride along with whatever we landed on
+                for hit in hits:
+                    carry = getattr(hit, "carry_x", 0.0)
+                    if carry:
+                        enemy.center_x += carry
+            enemy.change_y = min(0.0, getattr(hits[0], "carry_y", 0.0))
+        enemy.center_y = round(enemy.center_y, 2)
+
+        # --- Move in the x direction
+        if not enemy.change_x:
+            return
+        enemy.center_x += enemy.change_x
+        hits = self._collisions(enemy)
+        if not hits:
+            return
+
+        # Step up small ledges like the platformer engine's ramp_up
+        step = abs(enemy.change_x)
+        enemy.center_y += step
+        if not self._collisions(enemy):
+            return
+        enemy.center_y -= step
+
+        if enemy.change_x > 0:
+            enemy.right = min(hit.left for hit in hits)
+        else:
+            enemy.left = max(hit.right for hit in hits)
+
+    def _collisions(self, enemy) -> List:
+        hits = []
+        for index in self.obstacles:
+            for other in index.query_sprite(enemy):
+                if arcade.check_for_collision(enemy, other):
+                    hits.append(other)
+        return hits
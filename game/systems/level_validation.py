@@ -0,0 +1,299 @@
+"""
+Batch validation of TMX levels.
+
+Every level is parsed, built into a LevelSimulation and searched for
+reachability in its own worker process. The search walks the surfaces a
+player can stand on, starting from the spawn point, and links two surfaces
+when the game's jump arc (PLAYER_JUMP_SPEED, the held-jump boost and the
+level's gravity) covers the gap at PLAYER_MOVE_SPEED. Moving platforms
+count as standing room over their whole travel range.
+
+The search is a heuristic, wrong in both directions. Ceilings, hazards and
+enemies are ignored, so a level can pass and still be impossible. The
+physics engine's step-up onto low ledges and the extra reach a moving
+platform's carry gives a jump are not modelled, so a level can also be
+reported unreachable when it can in fact be completed.
+
+    python -m game.systems.level_validation                  # levels/tmx/*.tmx
+    python -m game.systems.level_validation a.tmx --jobs 4 --output report.json
+
+The report is a JSON list with one object per level. The exit status is 1
+when any level fails to load or cannot be completed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from game.config import (
+    PLAYER_JUMP_HOLD_FORCE,
+    PLAYER_JUMP_HOLD_FRAMES,
+    PLAYER_JUMP_SPEED,
+    PLAYER_MOVE_SPEED,
+)
+from game.levels.registry import TMX_FOLDER
+from game.levels.tmx_loader import TMXLevelLoader
+from game.systems.simulation import FALL_DEATH_Y, LevelSimulation
+from game.systems.spatial import Bounds
+
+
+# left, right, top when landing, top when jumping off
+Surface = Tuple[float, float, float, float]
+
+
+def jump_arc(gravity: float, depth: float, jump: bool = True) -> List[float]:
+    """Height above the take-off point after each tick, for a fully held jump.
+
+    Mirrors LevelSimulation: the jump speed and first hold boost land on the
+    same tick, then the engine applies gravity and moves. With ``jump=False``
+    it is a plain fall. Stops once the arc is ``depth`` below the start,
+    which takes positive ``gravity``; anything else raises ValueError.
+    """
+    if not gravity > 0:
+        raise ValueError(f"gravity must be positive, not {gravity}")
+    arc = [0.0]
+    y = 0.0
+    vy = PLAYER_JUMP_SPEED if jump else 0.0
+    frames = 0
+    while y > -depth:
+        if jump and frames < PLAYER_JUMP_HOLD_FRAMES:
+            vy += PLAYER_JUMP_HOLD_FORCE
+            frames += 1
+        vy -= gravity
+        y += vy
+        arc.append(y)
+    return arc
+
+
+def horizontal_reach(arc: Sequence[float], dy: float) -> Optional[float]:
+    """How far sideways the player can be when last at height ``dy`` on ``arc``.
+
+    None if the arc never gets that high.
+    """
+    for tick in range(len(arc) - 1, -1, -1):
+        if arc[tick] >= dy:
+            return tick * PLAYER_MOVE_SPEED
+    return None
+
+
+def _gap(a: Tuple[float, float], b: Tuple[float, float]) -> float:
+    return max(0.0, b[0] - a[1], a[0] - b[1])
+
+
+def _box(sprite) -> Bounds:
+    return (sprite.left, sprite.right, sprite.bottom, sprite.top)
+
+
+def _surface(sprite) -> Surface:
+    return (sprite.left, sprite.right, sprite.top, sprite.top)
+
+
+def _moving_surface(platform) -> Surface:
+    """A moving platform's standing room over its whole travel.
+
+    It is easiest to land on at its lowest and best to jump from at its
+    highest, so both tops are kept.
+    """
+    left, right, land_top, takeoff_top = _surface(platform)
+    reach_left, reach_right, reach_bottom, reach_top = platform.reach()
+    # A path that never turns back only counts where it starts
+    if math.isfinite(reach_left) and math.isfinite(reach_right):
+        left, right = reach_left, reach_right
+    if math.isfinite(reach_bottom) and math.isfinite(reach_top):
+        land_top, takeoff_top = reach_bottom + platform.height, reach_top
+    return (left, right, land_top, takeoff_top)
+
+
+@dataclass
+class LevelReport:
+    path: str
+    level_id: Optional[int] = None
+    loaded: bool = False
+    error: Optional[str] = None
+    seconds: float = 0.0
+    coins: int = 0
+    unreachable_coins: List[Dict[str, float]] = field(default_factory=list)
+    finish_platforms: int = 0
+    unreachable_finish_platforms: List[Dict[str, float]] = field(default_factory=list)
+    finish_reachable: bool = False
+    completable: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return (
+            self.loaded
+            and self.completable
+            and not self.unreachable_coins
+            and not self.unreachable_finish_platforms
+        )
+
+
+class ReachabilitySearch:
+    """Which surfaces, coins and finish platforms a player can get to."""
+
+    def __init__(self, sim: LevelSimulation):
+        # Hit box edges relative to the player's centre
+        player = sim.player
+        self.off_left = player.left - player.center_x
+        self.off_right = player.right - player.center_x
+        self.off_bottom = player.bottom - player.center_y
+        self.off_top = player.top - player.center_y
+
+        self.surfaces: List[Surface] = [_surface(p) for p in sim.platform_list]
+        self.surfaces += [_moving_surface(p) for p in sim.moving_platform_list]
+
+        tops = [top for surface in self.surfaces for top in surface[2:]] + [sim.spawn_point[1]]
+        depth = max(tops) - min(min(tops), FALL_DEATH_Y) + self.off_top - self.off_bottom
+        gravity = sim.level_spec.gravity_constant
+        self.jump = jump_arc(gravity, depth)
+        self.fall = jump_arc(gravity, depth, jump=False)
+
+        self.spawn = sim.spawn_point
+        self.reachable = self._search()
+
+    def _stand_range(self, surface: Surface) -> Tuple[float, float]:
+        """Player centre x range that still has the feet on ``surface``."""
+        return (surface[0] - self.off_right, surface[1] - self.off_left)
+
+    def _origins(self):
+        """(arc, centre x range, centre y) for the spawn and every reached surface."""
+        spawn_x, spawn_y = self.spawn
+        yield self.fall, (spawn_x, spawn_x), spawn_y
+        for index in self.reachable:
+            surface = self.surfaces[index]
+            yield self.jump, self._stand_range(surface), surface[3] - self.off_bottom
+
+    def _can_land(self, arc, x_range, y, surface: Surface) -> bool:
+        reach = horizontal_reach(arc, surface[2] - self.off_bottom - y)
+        return reach is not None and _gap(x_range, self._stand_range(surface)) <= reach
+
+    def _search(self) -> List[int]:
+        spawn_x, spawn_y = self.spawn
+        reached = [
+            index
+            for index, surface in enumerate(self.surfaces)
+            if self._can_land(self.fall, (spawn_x, spawn_x), spawn_y, surface)
+        ]
+        seen = set(reached)
+        frontier = list(reached)
+        while frontier:
+            surface = self.surfaces[frontier.pop()]
+            x_range = self._stand_range(surface)
+            y = surface[3] - self.off_bottom
+            for index, other in enumerate(self.surfaces):
+                if index not in seen and self._can_land(self.jump, x_range, y, other):
+                    seen.add(index)
+                    reached.append(index)
+                    frontier.append(index)
+        return reached
+
+    def can_touch(self, box: Bounds) -> bool:
+        """True if the player's hit box can overlap ``box`` from anywhere reachable."""
+        target_x = (box[0] - self.off_right, box[1] - self.off_left)
+        for arc, x_range, y in self._origins():
+            reach = horizontal_reach(arc, box[2] - self.off_top - y)
+            if reach is not None and _gap(x_range, target_x) <= reach:
+                return True
+        return False
+
+    def max_x(self) -> float:
+        """Furthest right the player's centre can get while standing somewhere."""
+        ranges = [self._stand_range(self.surfaces[index]) for index in self.reachable]
+        return max([self.spawn[0]] + [right for _, right in ranges])
+
+
+def _point(box: Bounds) -> Dict[str, float]:
+    return {"x": (box[0] + box[1]) / 2, "y": (box[2] + box[3]) / 2}
+
+
+def validate_level(tmx_path: str) -> LevelReport:
+    """Parse, build and search one TMX level. Never raises."""
+    start = time.perf_counter()
+    report = LevelReport(path=str(tmx_path))
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+            spec = TMXLevelLoader(str(tmx_path)).load()
+        if spec is None:
+            report.error = log.getvalue().strip() or "Level could not be loaded"
+            return report
+        report.level_id = spec.level_id
+        report.loaded = True
+
+        sim = LevelSimulation(spec=spec)
+        search = ReachabilitySearch(sim)
+
+        coins = [_box(coin) for coin in sim.coin_list]
+        report.coins = len(coins)
+        report.unreachable_coins = [_point(c) for c in coins if not search.can_touch(c)]
+
+        finishes = [_box(p) for p in sim.finish_platform_list]
+        report.finish_platforms = len(finishes)
+        report.unreachable_finish_platforms = [
+            _point(f) for f in finishes if not search.can_touch(f)
+        ]
+        if finishes:
+            report.finish_reachable = len(report.unreachable_finish_platforms) < len(finishes)
+        elif sim.level_end_x:
+            report.finish_reachable = search.max_x() >= sim.level_end_x - 50
+        report.completable = report.finish_reachable and not (
+            spec.requires_all_coins and report.unreachable_coins
+        )
+    except Exception as e:
+        report.error = f"{type(e).__name__}: {e}"
+    finally:
+        report.seconds = time.perf_counter() - start
+    return report
+
+
+def validate_levels(paths: Sequence[str], jobs: Optional[int] = None) -> List[LevelReport]:
+    """Validate ``paths`` in a process pool; reports come back in input order."""
+    if jobs == 1 or len(paths) <= 1:
+        return [validate_level(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(validate_level, paths))
+
+
+def _collect_paths(args: Sequence[str]) -> List[str]:
+    paths = []
+    for arg in args or [TMX_FOLDER]:
+        path = Path(arg)
+        if path.is_dir():
+            paths.extend(str(p) for p in sorted(path.glob("*.tmx")))
+        else:
+            paths.append(str(path))
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Check TMX levels load and can be completed."
+    )
+    parser.add_argument("paths", nargs="*", help=f"TMX files or folders (default: {TMX_FOLDER})")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    reports = validate_levels(_collect_paths(args.paths), args.jobs)
+    payload = json.dumps(
+        [dict(asdict(report), ok=report.ok) for report in reports], indent=2
+    )
+    if args.output:
+        Path(args.output).write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+    return 0 if all(report.ok for report in reports) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
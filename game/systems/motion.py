@@ -0,0 +1,123 @@
+"""
+Closed-form motion shared by entities that move on fixed paths.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from typing import Optional, Sequence, Tuple
+
+from game.systems.spatial import Bounds
+
+Point = Tuple[float, float]
+
+
+def ping_pong(
+    position: float, velocity: float, low: float, high: float, ticks: float
+) -> Tuple[float, float]:
+    """Position and velocity after ``ticks`` steps of ``velocity`` per tick,
+    bouncing between ``low`` and ``high``.
+
+    The path is unfolded onto a loop of length ``2 * (high - low)``, so the
+    cost does not depend on ``ticks``.
+    """
+    if velocity == 0 or high <= low:
+        return position, velocity
+    span = high - low
+    speed = abs(velocity)
+    offset = min(span, max(0.0, position - low))
+    # Distance travelled around the loop: out along [0, span], back along [span, 2 span)
+    loop = offset if velocity > 0 else 2 * span - offset
+    loop = (loop + speed * ticks) % (2 * span)
+    if loop <= span:
+        return low + loop, speed
+    return low + 2 * span - loop, -speed
+
+
+class PingPongPath:
+    """Each axis bounces between its own limits, independently.
+
+    This is how arcade moves a platform between its boundaries. The limits
+    are for the centre; an axis with velocity but no limits never turns.
+    """
+
+    def __init__(
+        self,
+        origin: Point,
+        velocity: Point,
+        x_limits: Optional[Tuple[float, float]] = None,
+        y_limits: Optional[Tuple[float, float]] = None,
+    ):
+        self.origin = origin
+        self.velocity = velocity
+        self.x_limits = x_limits
+        self.y_limits = y_limits
+
+    def position(self, tick: float) -> Point:
+        return (
+            self._axis(self.origin[0], self.velocity[0], self.x_limits, tick),
+            self._axis(self.origin[1], self.velocity[1], self.y_limits, tick),
+        )
+
+    def bounds(self) -> Bounds:
+        """Rectangle the centre stays in (infinite along an unlimited axis)."""
+        left, right = self._axis_bounds(self.origin[0], self.velocity[0], self.x_limits)
+        bottom, top = self._axis_bounds(self.origin[1], self.velocity[1], self.y_limits)
+        return (left, right, bottom, top)
+
+    @staticmethod
+    def _axis(origin: float, velocity: float, limits, tick: float) -> float:
+        if limits is None:
+            return origin + velocity * tick
+        return ping_pong(origin, velocity, limits[0], limits[1], tick)[0]
+
+    @staticmethod
+    def _axis_bounds(origin: float, velocity: float, limits) -> Tuple[float, float]:
+        if not velocity:
+            return origin, origin
+        if limits is None:
+            return (-math.inf, origin) if velocity < 0 else (origin, math.inf)
+        return min(origin, limits[0]), max(origin, limits[1])
+
+
+class WaypointPath:
+    """Constant speed along a polyline through ``points``.
+
+    An open path goes to the last point and back again; a ``loop`` returns
+    from the last point straight to the first. It starts at the first point.
+    """
+
+    def __init__(self, points: Sequence[Point], speed: float, loop: bool = False):
+        if not points:
+            raise ValueError("WaypointPath needs at least one point")
+        self.points = [tuple(point) for point in points]
+        self.speed = abs(speed)
+        self.loop = loop
+        stops = self.points + self.points[:1] if loop else self.points
+        self._stops = stops
+        # Distance along the path at which each stop is reached
+        self._distances = [0.0]
+        for (x0, y0), (x1, y1) in zip(stops, stops[1:]):
+            self._distances.append(self._distances[-1] + math.hypot(x1 - x0, y1 - y0))
+        self.length = self._distances[-1]
+
+    def position(self, tick: float) -> Point:
+        if self.length == 0 or self.speed == 0:
+            return self.points[0]
+        if self.loop:
+            distance = (self.speed * tick) % self.length
+        else:
+            distance = (self.speed * tick) % (2 * self.length)
+            if distance > self.length:
+                distance = 2 * self.length - distance
+        index = min(bisect_right(self._distances, distance), len(self._stops) - 1) - 1
+        start, end = self._distances[index], self._distances[index + 1]
+        t = (distance - start) / (end - start) if end > start else 0.0
+        (x0, y0), (x1, y1) = self._stops[index], self._stops[index + 1]
+        return (x0 + (x1 - x0) * t, y0 + (y1 - y0) * t)
+
+    def bounds(self) -> Bounds:
+        xs = [x for x, _ in self.points]
+        ys = [y for _, y in self.points]
+        return (min(xs), max(xs), min(ys), max(ys))
@@ -1,48 +1,90 @@
+"""
+Pooled particle system.
+
+Every live particle is a row in a set of fixed-capacity NumPy arrays
+(position, velocity, age, lifetime, size, colour). Live particles are
+kept packed at the front of the arrays: update is one vectorized step
+that also compacts out the dead, and draw uploads the live rows to one
+vertex buffer and renders them as a single batch of GL points.
+
+GL objects are created on the first draw, so emitting and updating work
+without a window. The shader program is shared per GL context (see
+shaders); ``release`` frees the vertex buffer when the system is put away.
+"""
+
 from __future__ import annotations
 
 import math
-import random
-from typing import List, Tuple
+from typing import Optional, Tuple
 
 import arcade
+import numpy as np
 
+from game.systems.shaders import shared_program
 
-class Particle(arcade.SpriteSolidColor):
-    def __init__(
-        self,
-        x: float,
-        y: float,
-        size: int,
-        color: arcade.Color,
-        velocity: Tuple[float, float],
-        lifetime: float,
-    ):
-        super().__init__(size, size, color)
-        self.base_color = tuple(color[:3]) if len(color) >= 3 else (255, 255, 255)
-        self.color = self.base_color
-        if len(color) >= 4:
-            self.alpha = int(color[3])
-        self.center_x = x
-        self.center_y = y
-        self.velocity = velocity
-        self.lifetime = max(lifetime, 0.05)
-        self.elapsed = 0.0
 
-    def update(self, delta_time: float = 1 / 60):
-        self.center_x += self.velocity[0] * delta_time
-        self.center_y += self.velocity[1] * delta_time
-        self.elapsed += delta_time
-        if self.elapsed >= self.lifetime:
-            self.remove_from_sprite_lists()
-            return
-        remaining = max(0.0, 1.0 - (self.elapsed / self.lifetime))
-        self.color = (*self.base_color, int(255 * remaining))
+PARTICLE_CAPACITY = 10_000
+
+# x, y, size, r, g, b, a
+_VERTEX_FLOATS = 7
+
+_VERTEX_SHADER = """
+#version 330
+
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+in vec2 in_pos;
+in float in_size;
+in vec4 in_color;
+out vec4 v_color;
+
+void main() {
+    gl_Position = window.projection * window.view * vec4(in_pos, 0.0, 1.0);
+    gl_PointSize = in_size;
+    v_color = in_color;
+}
+"""
+
+_FRAGMENT_SHADER = """
+#version 330
+
+in vec4 v_color;
+out vec4 fragColor;
 
+void main() {
+    fragColor = v_color;
+}
+"""
 
-class ParticleEmitter:
-    def __init__(self):
-        self.particles = arcade.SpriteList()
-        self.finished = False
+
+class ParticleSystem:
+    """Fixed pool of square particles that fade out over their lifetime.
+
+    Bursts that do not fit in the free part of the pool are truncated.
+    """
+
+    def __init__(self, capacity: int = PARTICLE_CAPACITY, seed: Optional[int] = None):
+        self.capacity = capacity
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+        self.position = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocity = np.zeros((capacity, 2), dtype=np.float32)
+        self.age = np.zeros(capacity, dtype=np.float32)
+        self.lifetime = np.ones(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        # 0..1 floats, alpha is the value at birth
+        self.color = np.zeros((capacity, 4), dtype=np.float32)
+
+        self._vertices = np.zeros((capacity, _VERTEX_FLOATS), dtype=np.float32)
+        self._program = None
+        self._buffer = None
+        self._geometry = None
+
+    def __len__(self) -> int:
+        return self.count
 
     def emit_burst(
         self,
@@ -52,45 +94,77 @@ class ParticleEmitter:
         speed_range: Tuple[float, float] = (30.0, 120.0),
         lifetime_range: Tuple[float, float] = (0.3, 0.7),
         size_range: Tuple[int, int] = (3, 6),
-    ):
-        x, y = position
-        min_speed, max_speed = speed_range
-        min_life, max_life = lifetime_range
-        min_size, max_size = size_range
-        for _ in range(max(1, count)):
-            angle = random.uniform(0, math.tau)
-            speed = random.uniform(min_speed, max_speed)
-            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
-            lifetime = random.uniform(min_life, max_life)
-            size = random.randint(min_size, max_size)
-            particle = Particle(x, y, size, color, velocity, lifetime)
-            self.particles.append(particle)
+    ) -> int:
+        """Spray ``count`` particles in random directions; returns how many fit."""
+        count = min(max(1, count), self.capacity - self.count)
+        if count <= 0:
+            return 0
+        start, end = self.count, self.count + count
+        rng = self.rng
+
+        angle = rng.uniform(0, math.tau, count)
+        speed = rng.uniform(speed_range[0], speed_range[1], count)
+        self.position[start:end] = position
+        self.velocity[start:end, 0] = np.cos(angle) * speed
+        self.velocity[start:end, 1] = np.sin(angle) * speed
+        self.age[start:end] = 0.0
+        self.lifetime[start:end] = np.maximum(
+            rng.uniform(lifetime_range[0], lifetime_range[1], count), 0.05
+        )
+        self.size[start:end] = rng.integers(size_range[0], size_range[1] + 1, count)
+        alpha = color[3] if len(color) >= 4 else 255
+        self.color[start:end] = (color[0] / 255, color[1] / 255, color[2] / 255, alpha / 255)
+
+        self.count = end
+        return count
 
     def update(self, delta_time: float = 1 / 60):
-        self.particles.update(delta_time)
-        if len(self.particles) == 0:
-            self.finished = True
+        """Move and age every live particle, then drop the expired ones."""
+        n = self.count
+        if n == 0:
+            return
+        self.position[:n] += self.velocity[:n] * delta_time
+        self.age[:n] += delta_time
+
+        alive = self.age[:n] < self.lifetime[:n]
+        live = int(np.count_nonzero(alive))
+        if live == n:
+            return
+        for array in (self.position, self.velocity, self.age, self.lifetime, self.size, self.color):
+            array[:live] = array[:n][alive]
+        self.count = live
 
     def draw(self):
-        self.particles.draw()
+        n = self.count
+        if n == 0:
+            return
+        if self._geometry is None:
+            self._create_gl_objects()
 
+        vertices = self._vertices[:n]
+        vertices[:, 0:2] = self.position[:n]
+        vertices[:, 2] = self.size[:n]
+        vertices[:, 3:7] = self.color[:n]
+        vertices[:, 6] *= 1.0 - self.age[:n] / self.lifetime[:n]
+        self._buffer.write(vertices.tobytes())
 
-class ParticleManager:
-    def __init__(self):
-        self.emitters: List[ParticleEmitter] = []
+        ctx = self._program.ctx
+        with ctx.enabled(ctx.BLEND, ctx.PROGRAM_POINT_SIZE):
+            self._geometry.render(self._program, mode=ctx.POINTS, vertices=n)
 
-    def update(self, delta_time: float):
-        for emitter in list(self.emitters):
-            try:
-                emitter.update(delta_time)
-            except TypeError:
-                emitter.update()
-            if getattr(emitter, "finished", False):
-                self.emitters.remove(emitter)
+    def clear(self):
+        self.count = 0
 
-    def draw(self):
-        for emitter in self.emitters:
-            emitter.draw()
+    def release(self):
+        """Free the vertex buffer; the next draw creates it again."""
+        if self._buffer is not None:
+            self._buffer.delete()
+        self._geometry = self._buffer = None
 
-    def clear(self):
-        self.emitters.clear()
+    def _create_gl_objects(self):
+        ctx = arcade.get_window().ctx
+        self._program = shared_program(ctx, _VERTEX_SHADER, _FRAGMENT_SHADER)
+        self._buffer = ctx.buffer(reserve=self._vertices.nbytes)
+        self._geometry = ctx.geometry(
+            [arcade.gl.BufferDescription(self._buffer, "2f 1f 4f", ["in_pos", "in_size", "in_color"])]
+        )
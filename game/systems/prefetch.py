@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional
+
+from game.levels import LevelSpec, level_registry
+
+
+class LevelPrefetcher:
+    """Loads level specs on a worker thread ahead of time.
+
+    Only CPU work runs on the worker: parsing or decoding the level and
+    decoding tile textures (sprite lists are created lazily, so no GL calls
+    happen off the main thread). Building sprites and physics engines stays
+    with LevelBuilder on the main thread.
+    """
+
+    def __init__(self, registry=level_registry):
+        self.registry = registry
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[int, Future] = {}
+
+    def prefetch(self, level_id: int) -> bool:
+        """Start loading ``level_id`` in the background if it exists."""
+        if level_id in self._pending:
+            return True
+        if level_id not in self.registry.level_ids():
+            return False
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="level-prefetch"
+            )
+        self._pending[level_id] = self._executor.submit(self.registry.get, level_id)
+        return True
+
+    def is_ready(self, level_id: int) -> bool:
+        future = self._pending.get(level_id)
+        return future is not None and future.done()
+
+    def get(self, level_id: int) -> Optional[LevelSpec]:
+        """Return the spec, waiting for an in-flight prefetch instead of loading twice."""
+        future = self._pending.pop(level_id, None)
+        if future is not None:
+            try:
+                return future.result()
+            except Exception as e:
+                print(f"Prefetch of level {level_id} failed: {e}")
+        return self.registry.get(level_id)
+
+    def shutdown(self):
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
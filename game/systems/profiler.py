@@ -0,0 +1,160 @@
+"""
+Per-frame timing of named phases.
+
+Code wraps its phases in ``profiler.section(name)``; every section entered
+during a frame adds to that frame's total for the name, and
+``next_frame()`` closes the frame. While the profiler is disabled a section
+is a shared no-op context, so instrumented code costs one method call.
+
+    with profiler.section("draw.hud"):
+        hud.draw()
+
+Counters (``profiler.count(name, n)``) record per-frame quantities such as
+how many chunks were drawn. Rolling percentiles cover the last ``window``
+frames; ``dump`` writes every frame kept in the session history as JSON
+for offline comparison.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import deque
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Deque, Dict, List, Optional
+
+FRAME = "frame"
+
+_NULL_SECTION = nullcontext()
+
+
+class _Section:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        current = self.profiler._current
+        current[self.name] = current.get(self.name, 0.0) + elapsed
+        return False
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list (0.0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    """Records seconds spent per named section for every frame."""
+
+    def __init__(self, enabled: bool = False, window: int = 300, history: int = 36000):
+        self.enabled = enabled
+        self.window = window
+        self._recent: Deque[Dict[str, float]] = deque(maxlen=window)
+        self._history: Deque[Dict[str, float]] = deque(maxlen=history)
+        self._current: Dict[str, float] = {}
+        self._frame_start: Optional[float] = None
+        self._names: List[str] = []
+        self._counter_names: List[str] = []
+
+    def toggle(self) -> bool:
+        self.enabled = not self.enabled
+        # Don't count the time spent disabled as one long frame
+        self._frame_start = None
+        self._current = {}
+        return self.enabled
+
+    def reset(self):
+        self._recent.clear()
+        self._history.clear()
+        self._current = {}
+        self._frame_start = None
+        self._names = []
+        self._counter_names = []
+
+    def section(self, name: str):
+        """Context manager that adds its wall time to ``name`` for this frame."""
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def count(self, name: str, amount: float = 1):
+        """Add ``amount`` to the counter ``name`` for this frame."""
+        if not self.enabled:
+            return
+        if name not in self._counter_names:
+            self._counter_names.append(name)
+        self._current[name] = self._current.get(name, 0) + amount
+
+    def next_frame(self):
+        """Close the running frame and start the next one."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            frame = self._current
+            frame[FRAME] = now - self._frame_start
+            for name in frame:
+                if name not in self._names:
+                    self._names.append(name)
+            self._recent.append(frame)
+            self._history.append(frame)
+        self._current = {}
+        self._frame_start = now
+
+    def section_names(self) -> List[str]:
+        """Every section seen so far, in first-seen order, without ``FRAME``."""
+        return [
+            name for name in self._names
+            if name != FRAME and name not in self._counter_names
+        ]
+
+    def counter_names(self) -> List[str]:
+        return list(self._counter_names)
+
+    def frame_times(self) -> List[float]:
+        """Frame wall times in seconds over the rolling window, oldest first."""
+        return [frame[FRAME] for frame in self._recent]
+
+    def percentiles(self, name: str = FRAME) -> Dict[str, float]:
+        """p50/p95/p99 of ``name`` over the rolling window.
+
+        Sections are in seconds. Frames where the section did not run, or the
+        counter was not touched, count as zero.
+        """
+        values = sorted(frame.get(name, 0.0) for frame in self._recent)
+        return {
+            "p50": percentile(values, 0.50),
+            "p95": percentile(values, 0.95),
+            "p99": percentile(values, 0.99),
+        }
+
+    def dump(self, path: str) -> Path:
+        """Write the session history to ``path`` as JSON (times in milliseconds)."""
+        names = [FRAME, *self.section_names()]
+        counters = self.counter_names()
+        payload = {
+            "sections": names,
+            "counters": counters,
+            "frames": [
+                [round(frame.get(name, 0.0) * 1000, 4) for name in names]
+                + [frame.get(name, 0) for name in counters]
+                for frame in self._history
+            ],
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        return path
@@ -0,0 +1,91 @@
+"""
+Geometric questions about a level, asked of its spatial indexes.
+
+Each query takes a rectangle (left, right, bottom, top) and the
+SpatialHash layers to test against, and never moves a sprite to find the
+answer, so no hit box is recomputed and no index goes stale. Boxes are
+compared as axis-aligned rectangles and, like arcade.check_for_collision,
+touching edges do not count as overlapping.
+
+    solid = (sim.platform_index, sim.moving_platform_index)
+    ground = ground_probe(sim.player, solid)
+    room = sweep(sprite_rect(sim.player), 20, solid)
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Optional
+
+from game.systems.spatial import Bounds, SpatialHash
+
+# How far below the feet still counts as standing, like arcade's can_jump
+GROUND_PROBE_DISTANCE = 5.0
+
+
+def sprite_rect(sprite) -> Bounds:
+    return (sprite.left, sprite.right, sprite.bottom, sprite.top)
+
+
+def offset_rect(rect: Bounds, dx: float = 0.0, dy: float = 0.0) -> Bounds:
+    left, right, bottom, top = rect
+    return (left + dx, right + dx, bottom + dy, top + dy)
+
+
+def _overlaps_x(rect: Bounds, other) -> bool:
+    return rect[0] < other.right and rect[1] > other.left
+
+
+def overlap_aabb(rect: Bounds, layers: Iterable[SpatialHash]) -> List:
+    """Every object in ``layers`` whose box overlaps ``rect``."""
+    left, right, bottom, top = rect
+    hits = []
+    for layer in layers:
+        for other in layer.query(left, right, bottom, top):
+            if left < other.right and right > other.left and bottom < other.top and top > other.bottom:
+                hits.append(other)
+    return hits
+
+
+def sweep(rect: Bounds, dy: float, layers: Iterable[SpatialHash]) -> float:
+    """How far ``rect`` can move by ``dy`` vertically before touching something.
+
+    The result has the sign of ``dy`` and is never longer. Objects that
+    already overlap ``rect`` do not block it.
+    """
+    if dy == 0:
+        return 0.0
+    left, right, bottom, top = rect
+    if dy > 0:
+        allowed = dy
+        for layer in layers:
+            for other in layer.query(left, right, top, top + dy):
+                if _overlaps_x(rect, other) and other.bottom >= top:
+                    allowed = min(allowed, other.bottom - top)
+        return allowed
+    allowed = dy
+    for layer in layers:
+        for other in layer.query(left, right, bottom + dy, bottom):
+            if _overlaps_x(rect, other) and other.top <= bottom:
+                allowed = max(allowed, other.top - bottom)
+    return allowed
+
+
+def ground_probe(
+    sprite, layers: Iterable[SpatialHash], distance: float = GROUND_PROBE_DISTANCE
+) -> Optional[object]:
+    """The highest object the sprite stands on, if any.
+
+    Anything under the sprite whose top is within ``distance`` of its feet
+    counts, above or below them.
+    """
+    left, right, feet = sprite.left, sprite.right, sprite.bottom
+    best = None
+    for layer in layers:
+        for other in layer.query(left, right, feet - distance, feet + distance):
+            if other is sprite or not (left < other.right and right > other.left):
+                continue
+            if not feet - distance < other.top <= feet + distance:
+                continue
+            if best is None or other.top > best.top:
+                best = other
+    return best
@@ -0,0 +1,26 @@
+"""
+Shader programs shared within a GL context.
+
+Particle systems, geometry caches and UI batches are rebuilt with every
+level and screen; compiling their program each time left one more program
+behind per rebuild. ``shared_program`` compiles each vertex/fragment pair
+once per context and keeps it on the context, so it lives as long as the
+window does.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+
+def shared_program(ctx, vertex_shader: str, fragment_shader: str):
+    """The program for this shader pair in ``ctx``, compiled on first use."""
+    programs: Dict[Tuple[str, str], object] = getattr(ctx, "_shared_programs", None)
+    if programs is None:
+        programs = ctx._shared_programs = {}
+    key = (vertex_shader, fragment_shader)
+    program = programs.get(key)
+    if program is None:
+        program = ctx.program(vertex_shader=vertex_shader, fragment_shader=fragment_shader)
+        programs[key] = program
+    return program
@@ -0,0 +1,349 @@
+"""
+Window-free gameplay core.
+
+LevelSimulation owns everything that decides what happens in a level:
+sprites, physics, pickups, deaths and completion. It never draws, plays
+sounds or needs a window or GL context; callers react to the events each
+step returns. GameView wraps it for interactive play, and it can be driven
+directly:
+
+    sim = LevelSimulation(1)
+    while not sim.finished:
+        sim.step(PlayerInput(right=True))
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+import arcade
+
+from game.config import (
+    GRAVITY,
+    JUMP_BLOCK_CHECK_DISTANCE,
+    PHYSICS_SUBSTEPS,
+    PLAYER_JUMP_HOLD_FORCE,
+    PLAYER_JUMP_HOLD_FRAMES,
+    PLAYER_JUMP_SPEED,
+    PLAYER_MOVE_SPEED,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    SIMULATION_RATE,
+)
+from game.entities.player import Player
+from game.levels import LevelBuilder, LevelSpec, level_registry
+from game.systems.activity import ActivityRegion
+from game.systems.profiler import FrameProfiler
+from game.systems.queries import ground_probe, offset_rect, overlap_aabb, sprite_rect, sweep
+from game.systems.spatial import SpatialHash, check_for_collision_with_index
+
+
+SIMULATION_DT = 1 / SIMULATION_RATE
+PLAYER_LIVES = 3
+FALL_DEATH_Y = -200
+# How far the player's feet may be from a moving platform's top to ride it
+RIDE_TOLERANCE = 1.0
+
+EVENT_JUMP = "jump"
+EVENT_COIN = "coin"
+EVENT_DEATH = "death"
+EVENT_FINISH_BLOCKED = "finish_blocked"
+EVENT_WON = "won"
+EVENT_LOST = "lost"
+
+
+@dataclass
+class PlayerInput:
+    """Player controls for one tick. ``jump_pressed`` is the press edge."""
+
+    left: bool = False
+    right: bool = False
+    jump_pressed: bool = False
+    jump_held: bool = False
+
+
+@dataclass
+class SimulationEvent:
+    kind: str
+    x: float = 0.0
+    y: float = 0.0
+    # "hazard", "enemy" or "fall" for deaths; "time" or "lives" when lost
+    cause: Optional[str] = None
+    value: int = 0
+
+
+class LevelSimulation:
+    def __init__(
+        self,
+        level_id: Optional[int] = None,
+        spec: Optional[LevelSpec] = None,
+        lives: int = PLAYER_LIVES,
+        registry=level_registry,
+        profiler: Optional[FrameProfiler] = None,
+    ):
+        if spec is None:
+            if level_id is None:
+                raise ValueError("LevelSimulation needs a level_id or a spec")
+            spec = registry.get(level_id)
+            if spec is None:
+                raise ValueError(f"Unknown level {level_id}")
+        self.level_spec = spec
+        self.level_id = spec.level_id if level_id is None else level_id
+        # Disabled unless the caller shares one; see game.systems.profiler
+        self.profiler = profiler if profiler is not None else FrameProfiler()
+
+        self.player_list = arcade.SpriteList()
+        self.enemy_list = arcade.SpriteList()
+        # Static walls also get arcade's own spatial hash for the physics engine
+        self.platform_list = arcade.SpriteList(use_spatial_hash=True)
+        self.moving_platform_list = arcade.SpriteList()
+        self.coin_list = arcade.SpriteList()
+        self.hazard_list = arcade.SpriteList()
+        self.finish_platform_list = arcade.SpriteList()
+
+        # Grid indexes over the lists above, filled by LevelBuilder
+        self.platform_index = SpatialHash()
+        self.moving_platform_index = SpatialHash()
+        self.coin_index = SpatialHash()
+        self.hazard_index = SpatialHash()
+        self.enemy_index = SpatialHash()
+        self.finish_index = SpatialHash()
+
+        self.player = Player()
+        self.player_list.append(self.player)
+
+        self.score = 0
+        self.time_elapsed = 0.0
+        self.ticks = 0
+        self.lives = lives
+        self.level_end_x = 0
+        self.spawn_point = (100, 150)
+        self.finished = False
+        self.won = False
+        self._jump_active = False
+        self._jump_frames = 0
+        # Moving platform the player stands on; it carries the player each tick
+        self.rider_platform = None
+        # World rectangle on screen, set by the view each tick; without one
+        # a screen-sized box around the player decides what stays awake
+        self.view_bounds = None
+
+        self.enemy_physics = None
+        LevelBuilder(self).build(spec)
+        # Everything the player stands on or bumps into, for geometric queries
+        self.solid_layers = (self.platform_index, self.moving_platform_index)
+        # Only enemies and platforms near the view are updated
+        self.activity = ActivityRegion()
+        self.activity.track(self.enemy_list, self.moving_platform_list)
+        # Moving platforms follow their paths (see _move_platforms), so the
+        # engine only collides with them
+        self.physics_engine = arcade.PhysicsEnginePlatformer(
+            self.player,
+            walls=[self.platform_list, self.activity.active_platforms],
+            gravity_constant=getattr(spec, "gravity_constant", GRAVITY),
+        )
+
+    def _respawn_player(self):
+        self.player.center_x, self.player.center_y = self.spawn_point
+        self.player.change_x = 0
+        self.player.change_y = 0
+        self.rider_platform = None
+
+    def step(
+        self, inputs: PlayerInput, delta_time: float = SIMULATION_DT
+    ) -> List[SimulationEvent]:
+        """Advance the level by one tick and return what happened in it."""
+        if self.finished:
+            return []
+        events: List[SimulationEvent] = []
+        self.ticks += 1
+        self.time_elapsed += delta_time
+        profiler = self.profiler
+        activity = self.activity
+        with profiler.section("sim.activity"):
+            activity.update(self._activity_view(), self.ticks, delta_time)
+        profiler.count("sim.awake_enemies", len(activity.awake_enemies))
+        profiler.count("sim.active_platforms", len(activity.active_platforms))
+        with profiler.section("sim.enemy_ai"):
+            for enemy in activity.awake_enemies:
+                enemy.update(delta_time)
+
+        spec = self.level_spec
+        if spec.time_limit is not None and self.time_elapsed >= spec.time_limit:
+            self._finish(events, won=False, cause="time")
+            return events
+
+        with profiler.section("sim.platforms"):
+            self._move_platforms()
+
+        player = self.player
+        direction = (-1 if inputs.left else 0) + (1 if inputs.right else 0)
+        input_dx = direction * PLAYER_MOVE_SPEED
+        player.change_x = input_dx
+
+        if inputs.jump_pressed and ground_probe(player, self.solid_layers) is not None:
+            if not self._is_blocked_above():
+                player.change_y = PLAYER_JUMP_SPEED
+                self._jump_frames = 0
+                self._jump_active = True
+                self.rider_platform = None
+                events.append(SimulationEvent(EVENT_JUMP, player.center_x, player.center_y))
+
+        if self._jump_active:
+            if inputs.jump_held and self._jump_frames < PLAYER_JUMP_HOLD_FRAMES:
+                player.change_y += PLAYER_JUMP_HOLD_FORCE
+                self._jump_frames += 1
+                if self._jump_frames >= PLAYER_JUMP_HOLD_FRAMES:
+                    self._jump_active = False
+            elif not inputs.jump_held and player.change_y > 0:
+                player.change_y *= 0.6
+                self._jump_active = False
+                self._jump_frames = PLAYER_JUMP_HOLD_FRAMES
+
+        with profiler.section("sim.player_physics"):
+            self._step_player_physics()
+            self.rider_platform = self._find_rider_platform()
+
+        with profiler.section("sim.enemy_physics"):
+            if self.enemy_physics:
+                self.enemy_physics.update(activity.awake_enemies)
+            self.enemy_index.move_all(activity.awake_enemies)
+
+        with profiler.section("sim.collision.coins"):
+            coins = check_for_collision_with_index(player, self.coin_index)
+        for coin in coins:
+            value = getattr(coin, "value", 0)
+            events.append(
+                SimulationEvent(EVENT_COIN, coin.center_x, coin.center_y, value=value)
+            )
+            coin.remove_from_sprite_lists()
+            self.coin_index.remove(coin)
+            self.score += value
+
+        with profiler.section("sim.collision.hazards"):
+            hit_hazard = check_for_collision_with_index(player, self.hazard_index)
+        if hit_hazard:
+            self._kill_player(events, "hazard")
+            return events
+
+        with profiler.section("sim.collision.enemies"):
+            hit_enemy = check_for_collision_with_index(player, self.enemy_index)
+        if hit_enemy:
+            self._kill_player(events, "enemy")
+            return events
+
+        with profiler.section("sim.collision.finish"):
+            reached_finish = bool(check_for_collision_with_index(player, self.finish_index))
+        # Fallback for levels whose finish platform is missing
+        if not reached_finish and self.level_end_x:
+            reached_finish = player.center_x >= self.level_end_x - 50
+        if reached_finish:
+            if spec.requires_all_coins and len(self.coin_list) > 0:
+                events.append(
+                    SimulationEvent(EVENT_FINISH_BLOCKED, player.center_x, player.center_y)
+                )
+            else:
+                self._finish(events, won=True)
+                return events
+
+        if player.center_y < FALL_DEATH_Y:
+            self._kill_player(events, "fall")
+        return events
+
+    def _activity_view(self):
+        if self.view_bounds is not None:
+            return self.view_bounds
+        x, y = self.player.center_x, self.player.center_y
+        return (
+            x - SCREEN_WIDTH / 2,
+            x + SCREEN_WIDTH / 2,
+            y - SCREEN_HEIGHT / 2,
+            y + SCREEN_HEIGHT / 2,
+        )
+
+    def _finish(self, events: List[SimulationEvent], won: bool, cause: Optional[str] = None):
+        self.finished = True
+        self.won = won
+        kind = EVENT_WON if won else EVENT_LOST
+        events.append(
+            SimulationEvent(kind, self.player.center_x, self.player.center_y, cause=cause)
+        )
+
+    def _kill_player(self, events: List[SimulationEvent], cause: str):
+        events.append(
+            SimulationEvent(EVENT_DEATH, self.player.center_x, self.player.center_y, cause=cause)
+        )
+        self.lives -= 1
+        if self.lives <= 0:
+            self._finish(events, won=False, cause="lives")
+            return
+        self._respawn_player()
+
+    def _move_platforms(self):
+        """Put awake platforms where their paths are now and carry the rider.
+
+        The rider moves by exactly the platform's step, before the player's
+        own physics, so it neither sinks into a rising platform nor drops
+        off a falling one, including where the path turns around.
+        """
+        for platform in self.activity.active_platforms:
+            platform.follow(self.ticks)
+        self.moving_platform_index.move_all(self.activity.active_platforms)
+
+        rider = self.rider_platform
+        if rider is None or self.activity.is_asleep(rider):
+            return
+        player = self.player
+        walls = (self.platform_index,)
+        # Carried into a wall, the player stays put on that axis
+        rect = sprite_rect(player)
+        if not overlap_aabb(offset_rect(rect, dx=rider.carry_x), walls):
+            player.center_x += rider.carry_x
+            rect = offset_rect(rect, dx=rider.carry_x)
+        if not overlap_aabb(offset_rect(rect, dy=rider.carry_y), walls):
+            player.center_y += rider.carry_y
+
+    def _find_rider_platform(self):
+        """The highest moving platform the player is standing on, if any."""
+        if self._jump_active or self.player.change_y > 0:
+            return None
+        return ground_probe(self.player, (self.moving_platform_index,), RIDE_TOLERANCE)
+
+    def _step_player_physics(self):
+        """Run the player's engine, split into PHYSICS_SUBSTEPS smaller moves.
+
+        Gravity is applied once for the tick, as a single update would, and
+        the fall is then made in n equal parts, so the path through open air
+        is the same as with one step but each part is checked for collisions.
+        The sideways move runs in the last part, after the fall, which is
+        also where a single update makes it.
+        """
+        substeps = max(1, PHYSICS_SUBSTEPS)
+        engine = self.physics_engine
+        if substeps == 1:
+            engine.update()
+            return
+
+        player = self.player
+        change_x = player.change_x
+        change_y = player.change_y - engine.gravity_constant
+        part = change_y / substeps
+        gravity = engine.gravity_constant
+        engine.gravity_constant = 0.0
+        try:
+            for i in range(substeps):
+                player.change_x = change_x if i == substeps - 1 else 0.0
+                player.change_y = part
+                engine.update()
+                if player.change_y != part:
+                    # Landed or bumped a ceiling; the engine has set the new velocity
+                    change_y = player.change_y
+                    part = 0.0
+        finally:
+            engine.gravity_constant = gravity
+            player.change_x = change_x
+            player.change_y = change_y
+
+    def _is_blocked_above(self, check_distance: float = JUMP_BLOCK_CHECK_DISTANCE) -> bool:
+        return sweep(sprite_rect(self.player), check_distance, self.solid_layers) < check_distance
@@ -0,0 +1,70 @@
+"""
+Frozen copy of a view's last frame.
+
+Overlay screens (pause, and anything else drawn on top of a level) used
+to redraw the whole level underneath themselves every frame. A
+FrameSnapshot draws the view once into an offscreen texture the size of
+the window framebuffer and after that blits it with one full-screen quad.
+
+The view is drawn with its own cameras, so the snapshot is pixel for
+pixel what was on screen and overlay widgets land at the same place over
+the world.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import arcade
+from arcade.gl import geometry
+
+
+class FrameSnapshot:
+    def __init__(self, window=None):
+        self.window = window or arcade.get_window()
+        self.ctx = self.window.ctx
+        self.texture = None
+        self.framebuffer = None
+        self._quad = None
+
+    @property
+    def captured(self) -> bool:
+        return self.texture is not None
+
+    def capture(self, draw: Callable[[], None]):
+        """Run ``draw`` (normally a view's ``on_draw``) into the offscreen texture."""
+        size = self.window.get_framebuffer_size()
+        if self.texture is None or self.texture.size != size:
+            self.release()
+            self.texture = self.ctx.texture(size, components=4)
+            self.framebuffer = self.ctx.framebuffer(color_attachments=[self.texture])
+        # Window.clear() always clears the screen, so clear the target here;
+        # cameras only rebind framebuffers they own, so drawing stays in ours
+        with self.framebuffer.activate():
+            self.framebuffer.clear(color=self.window.background_color)
+            draw()
+        # The view's cameras were left active; hand drawing back to the screen
+        self.window.default_camera.use()
+
+    def draw(self):
+        """Copy the captured frame to the whole of the current framebuffer."""
+        if self.texture is None:
+            return
+        if self._quad is None:
+            self._quad = geometry.quad_2d_fs()
+        program = self.ctx.utility_textured_quad_program
+        program["texture0"] = 0
+        self.texture.use(0)
+        previous_viewport = self.ctx.viewport
+        self.ctx.viewport = (0, 0, *self.window.get_framebuffer_size())
+        # A straight copy: blending would darken pixels the world left translucent
+        with self.ctx.enabled_only():
+            self._quad.render(program)
+        self.ctx.viewport = previous_viewport
+
+    def release(self):
+        if self.framebuffer is not None:
+            self.framebuffer.delete()
+            self.texture.delete()
+        self.framebuffer = None
+        self.texture = None
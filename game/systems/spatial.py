@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterable, List, Set, Tuple
+
+import arcade
+
+
+Cell = Tuple[int, int]
+CellRange = Tuple[int, int, int, int]
+# left, right, bottom, top
+Bounds = Tuple[float, float, float, float]
+
+SPATIAL_CELL_SIZE = 128
+
+
+class SpatialHash:
+    """Uniform grid over sprite bounding boxes.
+
+    Works with anything exposing ``left``/``right``/``bottom``/``top``.
+    Static geometry is inserted once; moving objects call :meth:`move`
+    after they change position and are only re-bucketed when they cross
+    into a different set of cells.
+    """
+
+    def __init__(self, cell_size: float = SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells: Dict[Cell, Set] = {}
+        self._ranges: Dict[object, CellRange] = {}
+
+    @classmethod
+    def from_sprites(cls, sprites: Iterable, cell_size: float = SPATIAL_CELL_SIZE):
+        index = cls(cell_size)
+        for sprite in sprites:
+            index.add(sprite)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def __contains__(self, sprite) -> bool:
+        return sprite in self._ranges
+
+    def __iter__(self):
+        return iter(self._ranges)
+
+    def clear(self):
+        self._cells.clear()
+        self._ranges.clear()
+
+    def add(self, sprite):
+        if sprite in self._ranges:
+            self.move(sprite)
+            return
+        cell_range = self._cell_range(sprite.left, sprite.right, sprite.bottom, sprite.top)
+        self._ranges[sprite] = cell_range
+        self._insert(sprite, cell_range)
+
+    def remove(self, sprite):
+        cell_range = self._ranges.pop(sprite, None)
+        if cell_range is not None:
+            self._discard(sprite, cell_range)
+
+    def move(self, sprite):
+        """Re-bucket ``sprite`` after it moved; cheap when it stays in its cells."""
+        old_range = self._ranges.get(sprite)
+        if old_range is None:
+            self.add(sprite)
+            return
+        new_range = self._cell_range(sprite.left, sprite.right, sprite.bottom, sprite.top)
+        if new_range == old_range:
+            return
+        self._discard(sprite, old_range)
+        self._ranges[sprite] = new_range
+        self._insert(sprite, new_range)
+
+    def move_all(self, sprites: Iterable):
+        for sprite in sprites:
+            self.move(sprite)
+
+    def query(self, left: float, right: float, bottom: float, top: float) -> List:
+        """Return every indexed object whose bounding box overlaps the rectangle."""
+        x0, x1, y0, y1 = self._cell_range(left, right, bottom, top)
+        cells = self._cells
+        seen = set()
+        result = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for sprite in bucket:
+                    if sprite in seen:
+                        continue
+                    seen.add(sprite)
+                    if (
+                        sprite.left <= right
+                        and sprite.right >= left
+                        and sprite.bottom <= top
+                        and sprite.top >= bottom
+                    ):
+                        result.append(sprite)
+        return result
+
+    def query_sprite(self, sprite) -> List:
+        return self.query(sprite.left, sprite.right, sprite.bottom, sprite.top)
+
+    def _cell_range(self, left: float, right: float, bottom: float, top: float) -> CellRange:
+        size = self.cell_size
+        return (
+            math.floor(left / size),
+            math.floor(right / size),
+            math.floor(bottom / size),
+            math.floor(top / size),
+        )
+
+    def _insert(self, sprite, cell_range: CellRange):
+        x0, x1, y0, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self._cells.setdefault((cx, cy), set()).add(sprite)
+
+    def _discard(self, sprite, cell_range: CellRange):
+        x0, x1, y0, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self._cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                bucket.discard(sprite)
+                if not bucket:
+                    del self._cells[(cx, cy)]
+
+
+def check_for_collision_with_index(sprite, index: SpatialHash) -> List:
+    """Same result as arcade.check_for_collision_with_list, using the index as broadphase."""
+    return [
+        other
+        for other in index.query_sprite(sprite)
+        if other is not sprite and arcade.check_for_collision(sprite, other)
+    ]
@@ -0,0 +1,289 @@
+"""
+Offscreen cache for level geometry that does not move.
+
+StaticGeometryCache renders a stack of static layers (tile layers, walls,
+finish platforms, hazards) into square framebuffer tiles of TILE_SIZE
+world pixels, the first time each tile comes into view. After that a
+frame draws one textured quad per visible tile instead of every sprite.
+Tiles that hold no geometry are never allocated.
+
+Static geometry rarely changes, but when it does (a UI element dropped
+into the level as a platform, a wall removed) call ``invalidate`` with the
+changed world rectangle, or with nothing to redraw every tile.
+
+The cache is optional; see STATIC_GEOMETRY_CACHE in game.config. Compare
+it with plain sprite drawing on a real GPU with:
+
+    python -m game.systems.static_cache 1 --frames 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import arcade
+from arcade.camera import Camera2D
+from arcade.gl import BufferDescription
+from arcade.types import LBWH, LRBT
+
+from game.systems.shaders import shared_program
+from game.systems.spatial import Bounds
+from game.systems.tile_chunks import ChunkedLayer
+
+
+TILE_SIZE = 1024
+
+
+_VERTEX_SHADER = """
+#version 330
+
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+in vec2 in_vert;
+in vec2 in_uv;
+out vec2 v_uv;
+
+void main() {
+    gl_Position = window.projection * window.view * vec4(in_vert, 0.0, 1.0);
+    v_uv = in_uv;
+}
+"""
+
+_FRAGMENT_SHADER = """
+#version 330
+
+uniform sampler2D tile_texture;
+in vec2 v_uv;
+out vec4 fragColor;
+
+void main() {
+    fragColor = texture(tile_texture, v_uv);
+}
+"""
+
+
+@dataclass
+class _Tile:
+    texture: object
+    framebuffer: object
+    quad_buffer: object
+    quad: object
+    dirty: bool = True
+
+
+def _sprites(layer) -> Iterable[arcade.Sprite]:
+    if isinstance(layer, ChunkedLayer):
+        for chunk in layer.chunks.values():
+            yield from chunk
+    else:
+        yield from layer
+
+
+def draw_layer(layer, bounds: Bounds, profiler=None) -> int:
+    """Draw a SpriteList or ChunkedLayer; returns the draw calls issued."""
+    if isinstance(layer, ChunkedLayer):
+        return layer.draw(bounds, profiler)
+    if not layer.visible or len(layer) == 0:
+        return 0
+    layer.draw()
+    return 1
+
+
+class StaticGeometryCache:
+    def __init__(self, layers: Sequence, tile_size: int = TILE_SIZE, window=None):
+        self.layers = [layer for layer in layers if layer is not None]
+        self.tile_size = tile_size
+        self.window = window or arcade.get_window()
+        self.ctx = self.window.ctx
+        self.tiles: Dict[Tuple[int, int], _Tile] = {}
+        self.occupied: Set[Tuple[int, int]] = set()
+        for layer in self.layers:
+            for sprite in _sprites(layer):
+                self.occupied.update(
+                    self._cells((sprite.left, sprite.right, sprite.bottom, sprite.top))
+                )
+        self._program = shared_program(self.ctx, _VERTEX_SHADER, _FRAGMENT_SHADER)
+
+    def _cells(self, bounds: Bounds) -> List[Tuple[int, int]]:
+        left, right, bottom, top = bounds
+        size = self.tile_size
+        return [
+            (cx, cy)
+            for cx in range(math.floor(left / size), math.floor(right / size) + 1)
+            for cy in range(math.floor(bottom / size), math.floor(top / size) + 1)
+        ]
+
+    def invalidate(self, bounds: Optional[Bounds] = None):
+        """Redraw the tiles overlapping ``bounds`` (every tile if None) on next use."""
+        if bounds is None:
+            for tile in self.tiles.values():
+                tile.dirty = True
+            return
+        for cell in self._cells(bounds):
+            # New geometry may land where there was none before
+            self.occupied.add(cell)
+            tile = self.tiles.get(cell)
+            if tile is not None:
+                tile.dirty = True
+
+    def draw(self, bounds: Bounds, profiler=None) -> int:
+        """Draw the cached tiles inside ``bounds``; returns the draw calls issued."""
+        visible = [cell for cell in self._cells(bounds) if cell in self.occupied]
+        rendered = 0
+        for cell in visible:
+            tile = self.tiles.get(cell)
+            if tile is None:
+                tile = self._create_tile(cell)
+            if tile.dirty:
+                self._render_tile(cell, tile)
+                rendered += 1
+
+        program = self._program
+        program["tile_texture"] = 0
+        with self.ctx.enabled(self.ctx.BLEND):
+            for cell in visible:
+                tile = self.tiles[cell]
+                tile.texture.use(0)
+                tile.quad.render(program)
+        if profiler is not None:
+            profiler.count("static.tiles_drawn", len(visible))
+            profiler.count("static.tiles_rendered", rendered)
+        return len(visible)
+
+    def release(self):
+        """Free every tile's GPU memory; tiles are recreated on demand."""
+        for tile in self.tiles.values():
+            tile.framebuffer.delete()
+            tile.texture.delete()
+            # The quad's vertex array goes with the geometry once unreferenced
+            tile.quad_buffer.delete()
+        self.tiles.clear()
+
+    def _create_tile(self, cell: Tuple[int, int]) -> _Tile:
+        size = self.tile_size
+        texture = self.ctx.texture(
+            (size, size), components=4, filter=(self.ctx.NEAREST, self.ctx.NEAREST)
+        )
+        # Same layout as arcade's geometry.quad_2d, but keeping the buffer so it can be freed
+        left, bottom = cell[0] * size, cell[1] * size
+        quad_buffer = self.ctx.buffer(
+            data=array(
+                "f",
+                [
+                    left, bottom + size, 0.0, 1.0,
+                    left, bottom, 0.0, 0.0,
+                    left + size, bottom + size, 1.0, 1.0,
+                    left + size, bottom, 1.0, 0.0,
+                ],
+            )
+        )
+        tile = _Tile(
+            texture=texture,
+            framebuffer=self.ctx.framebuffer(color_attachments=[texture]),
+            quad_buffer=quad_buffer,
+            quad=self.ctx.geometry(
+                [BufferDescription(quad_buffer, "2f 2f", ["in_vert", "in_uv"])],
+                mode=self.ctx.TRIANGLE_STRIP,
+            ),
+        )
+        self.tiles[cell] = tile
+        return tile
+
+    def _render_tile(self, cell: Tuple[int, int], tile: _Tile):
+        size = self.tile_size
+        half = size / 2
+        camera = Camera2D(
+            viewport=LBWH(0, 0, size, size),
+            position=((cell[0] + 0.5) * size, (cell[1] + 0.5) * size),
+            projection=LRBT(-half, half, -half, half),
+            render_target=tile.framebuffer,
+            window=self.window,
+        )
+        bounds = (cell[0] * size, (cell[0] + 1) * size, cell[1] * size, (cell[1] + 1) * size)
+        with camera.activate():
+            tile.framebuffer.clear(color=(0, 0, 0, 0))
+            for layer in self.layers:
+                draw_layer(layer, bounds)
+        tile.dirty = False
+
+
+def benchmark(level_id: int, frames: int = 300, tile_size: int = TILE_SIZE):
+    """Pan across a level drawing its static layers both ways; print GPU cost.
+
+    Needs a real OpenGL context (a hidden window is opened).
+    """
+    from game.config import SCREEN_HEIGHT, SCREEN_WIDTH
+    from game.systems.simulation import LevelSimulation
+
+    window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, "static cache benchmark", visible=False)
+    ctx = window.ctx
+    sim = LevelSimulation(level_id)
+    visual = sim.level_spec.visual_layers or {}
+    layers = [
+        visual.get("Background"),
+        visual.get("Ground"),
+        sim.platform_list,
+        sim.finish_platform_list,
+        sim.hazard_list,
+    ]
+    layers = [layer for layer in layers if layer is not None]
+    cache = StaticGeometryCache(layers, tile_size=tile_size, window=window)
+    camera = Camera2D(window=window)
+
+    start_x = sim.spawn_point[0]
+    end_x = max(sim.level_end_x, start_x + SCREEN_WIDTH)
+
+    def sprite_path(bounds):
+        return sum(draw_layer(layer, bounds) for layer in layers)
+
+    def cached_path(bounds):
+        return cache.draw(bounds)
+
+    results = {}
+    for name, draw in (("sprites", sprite_path), ("cached", cached_path)):
+        calls = 0
+        gpu_ns = 0
+        for frame in range(frames):
+            x = start_x + (end_x - start_x) * frame / max(1, frames - 1)
+            camera.position = (x, sim.spawn_point[1])
+            rect = camera.aabb()
+            with camera.activate():
+                window.clear()
+                query = ctx.query(samples=False, primitives=False)
+                with query:
+                    calls += draw((rect.left, rect.right, rect.bottom, rect.top))
+                gpu_ns += query.time_elapsed
+        ctx.finish()
+        results[name] = (calls / frames, gpu_ns / frames / 1e6)
+
+    print(f"Level {level_id}, {frames} frames, {len(cache.tiles)} cached tiles")
+    print(f"{'path':<10}{'draw calls':>12}{'gpu ms':>10}")
+    for name, (calls, gpu_ms) in results.items():
+        print(f"{name:<10}{calls:>12.1f}{gpu_ms:>10.3f}")
+    cache.release()
+    window.close()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compare cached static geometry with per-sprite drawing."
+    )
+    parser.add_argument("level", type=int, nargs="?", default=1)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--tile-size", type=int, default=TILE_SIZE)
+    args = parser.parse_args(argv)
+    benchmark(args.level, args.frames, args.tile_size)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Shared procedural textures.
+
+arcade's make_soft_*_texture helpers redraw a PIL image and wrap it in a
+new Texture on every call, so building a level with hundreds of coins or
+enemies did that work once per object. TextureRegistry makes each distinct
+(shape, size, colour, alpha falloff) once and hands every caller the same
+Texture, which also means one atlas entry per key.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Tuple
+
+import arcade
+
+
+SHAPE_SOFT_CIRCLE = "soft_circle"
+SHAPE_SOFT_SQUARE = "soft_square"
+
+# shape, size, rgb, center alpha, outer alpha
+TextureKey = Tuple[str, int, Tuple[int, int, int], int, int]
+
+_FACTORIES: Dict[str, Callable[..., arcade.Texture]] = {
+    SHAPE_SOFT_CIRCLE: arcade.make_soft_circle_texture,
+    SHAPE_SOFT_SQUARE: arcade.make_soft_square_texture,
+}
+
+
+class TextureRegistry:
+    def __init__(self):
+        self._textures: Dict[TextureKey, arcade.Texture] = {}
+
+    def __len__(self) -> int:
+        return len(self._textures)
+
+    def get(
+        self,
+        shape: str,
+        size: int,
+        color: arcade.Color,
+        center_alpha: int = 255,
+        outer_alpha: int = 0,
+    ) -> arcade.Texture:
+        """Return the texture for this key, making it the first time only."""
+        key = (shape, int(size), tuple(color[:3]), center_alpha, outer_alpha)
+        texture = self._textures.get(key)
+        if texture is None:
+            factory = _FACTORIES.get(shape)
+            if factory is None:
+                raise ValueError(f"Unknown procedural texture shape: {shape}")
+            texture = factory(key[1], key[2], center_alpha, outer_alpha)
+            self._textures[key] = texture
+        return texture
+
+    def soft_circle(self, diameter: int, color: arcade.Color, center_alpha=255, outer_alpha=0):
+        return self.get(SHAPE_SOFT_CIRCLE, diameter, color, center_alpha, outer_alpha)
+
+    def soft_square(self, size: int, color: arcade.Color, center_alpha=255, outer_alpha=0):
+        return self.get(SHAPE_SOFT_SQUARE, size, color, center_alpha, outer_alpha)
+
+    def preload(self, atlas=None):
+        """Make every texture the entities use, player animation frames included.
+
+        Given an atlas, they are uploaded too. Called at startup so the first
+        level build does no texture work.
+        """
+        from game.entities.coin import COIN_TEXTURE
+        from game.entities.enemy import ENEMY_TEXTURES
+        from game.entities.player import PLAYER_FALLBACK_TEXTURE, player_animations
+        from game.entities.ui_button import UI_BUTTON_TEXTURE
+
+        keys = (COIN_TEXTURE, *ENEMY_TEXTURES, PLAYER_FALLBACK_TEXTURE, UI_BUTTON_TEXTURE)
+        textures = [self.get(*key) for key in keys]
+        textures += player_animations().textures()
+        if atlas is not None:
+            for texture in textures:
+                atlas.add(texture)
+
+    def atlas_usage(self, atlas=None) -> Dict[str, float]:
+        """Summarise ``atlas`` (default: the window's) and this registry."""
+        if atlas is None:
+            atlas = arcade.get_window().ctx.default_atlas
+        used = sum(image.width * image.height for image in atlas.images)
+        area = atlas.width * atlas.height
+        return {
+            "registry_textures": len(self._textures),
+            "atlas_textures": len(atlas.textures),
+            "atlas_images": len(atlas.images),
+            "atlas_width": atlas.width,
+            "atlas_height": atlas.height,
+            "atlas_fill": used / area if area else 0.0,
+        }
+
+    def clear(self):
+        self._textures.clear()
+
+
+texture_registry = TextureRegistry()
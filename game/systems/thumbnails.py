@@ -0,0 +1,188 @@
+"""
+Level thumbnails for the level-select list.
+
+A thumbnail is a small PIL drawing of a level's layout (platforms, hazards,
+coins, spawn and finish) rendered from its LevelSpec, so no GL work is
+involved and it can be made on a worker thread. Finished images are saved
+as PNGs under THUMBNAIL_DIR, keyed by level id and the source file's
+modification time, so each one is drawn once per edit of the level.
+
+Only levels that are asked for are made: the list requests the rows it
+shows, and ``retain`` cancels queued work for rows scrolled away.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import arcade
+from PIL import Image, ImageDraw
+
+from game.config import THUMBNAIL_DIR
+from game.levels import LevelSpec, level_registry
+
+
+THUMBNAIL_SIZE = (96, 54)
+# Bump when the drawing changes so old files are not reused
+THUMBNAIL_VERSION = 1
+# Decoded thumbnails kept as textures; older ones are reloaded from disk
+MEMORY_LIMIT = 128
+
+_BACKGROUND = (20, 24, 32, 255)
+_SPAWN = (80, 220, 120, 255)
+_FINISH = (240, 240, 240, 255)
+_COIN = (255, 215, 0, 255)
+
+
+def _level_bounds(spec: LevelSpec) -> Tuple[float, float, float, float]:
+    xs = [spec.spawn_point[0], spec.end_x]
+    ys = [spec.spawn_point[1]]
+    for rect in (*spec.platforms, *spec.moving_platforms, *spec.hazards):
+        xs += [rect.x - rect.width / 2, rect.x + rect.width / 2]
+        ys += [rect.y - rect.height / 2, rect.y + rect.height / 2]
+    for coin in spec.coins:
+        xs.append(coin.x)
+        ys.append(coin.y)
+    return min(xs), max(xs), min(ys), max(ys)
+
+
+def render_thumbnail(spec: LevelSpec, size: Tuple[int, int] = THUMBNAIL_SIZE) -> Image.Image:
+    """Draw ``spec``'s layout into an RGBA image of ``size``, aspect kept."""
+    width, height = size
+    image = Image.new("RGBA", size, _BACKGROUND)
+    draw = ImageDraw.Draw(image)
+    left, right, bottom, top = _level_bounds(spec)
+    pad = 2
+    scale = min(
+        (width - 2 * pad) / max(right - left, 1.0),
+        (height - 2 * pad) / max(top - bottom, 1.0),
+    )
+    # Centre the level; image y grows downwards
+    offset_x = (width - (right - left) * scale) / 2
+    offset_y = (height - (top - bottom) * scale) / 2
+
+    def point(x, y):
+        return (offset_x + (x - left) * scale, height - offset_y - (y - bottom) * scale)
+
+    def box(rect, color):
+        x0, y0 = point(rect.x - rect.width / 2, rect.y + rect.height / 2)
+        x1, y1 = point(rect.x + rect.width / 2, rect.y - rect.height / 2)
+        draw.rectangle((x0, y0, max(x0, x1 - 1), max(y0, y1 - 1)), fill=tuple(color))
+
+    for platform in spec.platforms:
+        if platform.visible:
+            box(platform, platform.color)
+    for platform in spec.moving_platforms:
+        box(platform, platform.color)
+    for hazard in spec.hazards:
+        box(hazard, hazard.color)
+    for coin in spec.coins:
+        draw.point(point(coin.x, coin.y), fill=_COIN)
+    if spec.end_x:
+        x, _ = point(spec.end_x, bottom)
+        draw.line((x, 0, x, height), fill=_FINISH)
+    x, y = point(*spec.spawn_point)
+    draw.rectangle((x - 1, y - 1, x + 1, y + 1), fill=_SPAWN)
+    return image
+
+
+class ThumbnailCache:
+    """Makes thumbnails on a worker thread and hands them out as textures.
+
+    ``request`` never blocks: it returns the texture once it is ready and
+    None until then. Call it from the main thread only.
+    """
+
+    def __init__(
+        self,
+        registry=level_registry,
+        folder: str = THUMBNAIL_DIR,
+        size: Tuple[int, int] = THUMBNAIL_SIZE,
+    ):
+        self.registry = registry
+        self.folder = Path(folder)
+        self.size = size
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[int, Future] = {}
+        self._textures: "OrderedDict[int, arcade.Texture]" = OrderedDict()
+
+    def path(self, level_id: int) -> Path:
+        info = self.registry.info(level_id)
+        stamp = "0"
+        if info is not None and info.source != "python":
+            try:
+                stamp = str(int(os.stat(info.source).st_mtime))
+            except OSError:
+                pass
+        return self.folder / f"level_{level_id}_{stamp}_v{THUMBNAIL_VERSION}.png"
+
+    def request(self, level_id: int) -> Optional[arcade.Texture]:
+        texture = self._textures.get(level_id)
+        if texture is not None:
+            self._textures.move_to_end(level_id)
+            return texture
+        future = self._pending.get(level_id)
+        if future is None:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="thumbnails"
+                )
+            self._pending[level_id] = self._executor.submit(
+                self._produce, level_id, self.path(level_id)
+            )
+            return None
+        if not future.done():
+            return None
+        del self._pending[level_id]
+        try:
+            image = future.result()
+        except Exception as e:
+            print(f"Thumbnail of level {level_id} failed: {e}")
+            image = None
+        if image is None:
+            # Keep a blank one so a broken level is not retried every frame
+            image = Image.new("RGBA", self.size, _BACKGROUND)
+        texture = arcade.Texture(
+            image,
+            hit_box_algorithm=arcade.hitbox.algo_bounding_box,
+            hash=f"level-thumbnail-{self.path(level_id).name}",
+        )
+        self._textures[level_id] = texture
+        if len(self._textures) > MEMORY_LIMIT:
+            self._textures.popitem(last=False)
+        return texture
+
+    def retain(self, level_ids: Iterable[int]):
+        """Cancel queued thumbnails that are not for ``level_ids``."""
+        keep = set(level_ids)
+        for level_id, future in list(self._pending.items()):
+            if level_id not in keep and future.cancel():
+                del self._pending[level_id]
+
+    def shutdown(self):
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _produce(self, level_id: int, path: Path) -> Optional[Image.Image]:
+        if path.exists():
+            with Image.open(path) as image:
+                return image.convert("RGBA")
+        # Not registry.get: that would keep every browsed level loaded
+        spec = self.registry.load(level_id)
+        if spec is None:
+            return None
+        image = render_thumbnail(spec, self.size)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a half-written file is never picked up
+        partial = path.with_suffix(".tmp")
+        image.save(partial, format="PNG")
+        partial.replace(path)
+        return image
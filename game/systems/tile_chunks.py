@@ -0,0 +1,85 @@
+"""
+Camera-culled drawing of large tile layers.
+
+A ChunkedLayer splits a layer's sprites into square chunks of CHUNK_SIZE
+world pixels, each its own SpriteList, keyed by grid cell. Drawing only
+visits the cells that overlap the camera's view, so the cost follows the
+screen size rather than the level length. Tiles never move, so the TMX
+loaders build the chunks once, when the level is loaded.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterable, Tuple
+
+import arcade
+
+
+CHUNK_SIZE = 512
+
+
+class ChunkedLayer:
+    def __init__(
+        self,
+        sprites: Iterable[arcade.Sprite],
+        visible: bool = True,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        self.chunk_size = chunk_size
+        self.visible = visible
+        self.chunks: Dict[Tuple[int, int], arcade.SpriteList] = {}
+        # Sprites are filed by centre, so the view is widened by the largest
+        # half extent to keep tiles that straddle a chunk edge on screen
+        self.margin = 0.0
+        self.sprite_count = 0
+        for sprite in sprites:
+            key = self._cell(sprite.center_x, sprite.center_y)
+            chunk = self.chunks.get(key)
+            if chunk is None:
+                chunk = arcade.SpriteList(lazy=True)
+                self.chunks[key] = chunk
+            chunk.append(sprite)
+            self.margin = max(self.margin, sprite.width / 2, sprite.height / 2)
+            self.sprite_count += 1
+
+    def __len__(self) -> int:
+        return self.sprite_count
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (math.floor(x / self.chunk_size), math.floor(y / self.chunk_size))
+
+    def visible_chunks(self, left: float, right: float, bottom: float, top: float):
+        """Chunks whose tiles may overlap the given world rectangle."""
+        margin = self.margin
+        min_x, min_y = self._cell(left - margin, bottom - margin)
+        max_x, max_y = self._cell(right + margin, top + margin)
+        chunks = self.chunks
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(chunks):
+            # View larger than the layer: filtering the dict is cheaper
+            return [
+                chunk for (cx, cy), chunk in chunks.items()
+                if min_x <= cx <= max_x and min_y <= cy <= max_y
+            ]
+        visible = []
+        for cx in range(min_x, max_x + 1):
+            for cy in range(min_y, max_y + 1):
+                chunk = chunks.get((cx, cy))
+                if chunk is not None:
+                    visible.append(chunk)
+        return visible
+
+    def draw(self, bounds: Tuple[float, float, float, float], profiler=None):
+        """Draw the chunks inside ``bounds`` (left, right, bottom, top).
+
+        Returns how many chunks were drawn; also counted on ``profiler``.
+        """
+        if not self.visible:
+            return 0
+        chunks = self.visible_chunks(*bounds)
+        for chunk in chunks:
+            chunk.draw()
+        if profiler is not None:
+            profiler.count("tiles.chunks_drawn", len(chunks))
+            profiler.count("tiles.sprites_drawn", sum(len(chunk) for chunk in chunks))
+        return len(chunks)
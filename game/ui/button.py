@@ -1,8 +1,18 @@
+from typing import Optional
+
 import arcade
 
+from game.ui.shape_batch import UIBatch
+
 
 class Button:
-    """Interactive button with hover and click effects."""
+    """Interactive button with hover and click effects.
+
+    The fill and border live in a UIBatch and are recoloured only when the
+    hover/press/enabled state changes. Without a ``batch`` the button keeps
+    a private one and ``draw`` draws it; with a shared one the screen draws
+    the batch and ``draw`` does nothing.
+    """
 
     def __init__(
         self,
@@ -16,6 +26,7 @@ class Button:
         click_color: tuple[int, int, int] = arcade.color.DARK_GRAY,
         text_color: tuple[int, int, int] = arcade.color.WHITE,
         font_size: int = 18,
+        batch: Optional[UIBatch] = None,
     ):
         self.x = x
         self.y = y
@@ -30,8 +41,11 @@ class Button:
 
         self.is_hovered = False
         self.is_pressed = False
-        self.enabled = True
+        self._enabled = True
+        self._visible = True
 
+        self._owns_batch = batch is None
+        self.batch = batch or UIBatch()
         self._text_obj = arcade.Text(
             text,
             x,
@@ -41,8 +55,83 @@ class Button:
             anchor_x="center",
             anchor_y="center",
             bold=True,
+            batch=self.batch.text,
+        )
+        shapes = self.batch.shapes
+        left, right, bottom, top = self._rect()
+        self._fill_shape = shapes.add_rect(left, right, bottom, top, color)
+        self._border_shape = shapes.add_outline(
+            left, right, bottom, top, arcade.color.DARK_GRAY, 2
+        )
+        self._shown_state = None
+        self._sync_shapes()
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool):
+        self._enabled = enabled
+        self._sync_shapes()
+
+    @property
+    def visible(self) -> bool:
+        return self._visible
+
+    @visible.setter
+    def visible(self, visible: bool):
+        """Hidden buttons draw nothing and ignore the mouse."""
+        if visible == self._visible:
+            return
+        self._visible = visible
+        shapes = self.batch.shapes
+        shapes.set_visible(self._fill_shape, visible)
+        shapes.set_visible(self._border_shape, visible)
+        self._text_obj.visible = visible
+        if not visible:
+            self.is_hovered = False
+            self.is_pressed = False
+            self._sync_shapes()
+
+    def _rect(self):
+        half_width = self.width / 2
+        half_height = self.height / 2
+        return (
+            self.x - half_width,
+            self.x + half_width,
+            self.y - half_height,
+            self.y + half_height,
         )
 
+    def _sync_shapes(self):
+        """Recolour the fill and border if the visual state changed."""
+        state = (self._enabled, self.is_pressed, self.is_hovered)
+        if state == self._shown_state:
+            return
+        self._shown_state = state
+        if not self._enabled:
+            current_color = tuple(c // 2 for c in self.color)
+        elif self.is_pressed:
+            current_color = self.click_color
+        elif self.is_hovered:
+            current_color = self.hover_color
+        else:
+            current_color = self.color
+        border_color = arcade.color.WHITE if self.is_hovered else arcade.color.DARK_GRAY
+        shapes = self.batch.shapes
+        shapes.set_color(self._fill_shape, current_color)
+        shapes.set_color(self._border_shape, border_color)
+
+    def move_to(self, x: float, y: float):
+        """Move the button, its shapes and its text."""
+        self.x = x
+        self.y = y
+        shapes = self.batch.shapes
+        shapes.set_rect(self._fill_shape, *self._rect())
+        shapes.set_rect(self._border_shape, *self._rect())
+        self._text_obj.position = (x, y)
+
     def update_text(self, new_text: str):
         """Update button text."""
         self.text = new_text
@@ -50,8 +139,9 @@ class Button:
 
     def check_mouse_hover(self, mouse_x: float, mouse_y: float) -> bool:
         """Check if mouse is hovering over button."""
-        if not self.enabled:
+        if not self.enabled or not self._visible:
             self.is_hovered = False
+            self._sync_shapes()
             return False
 
         half_width = self.width / 2
@@ -61,11 +151,12 @@ class Button:
             self.x - half_width <= mouse_x <= self.x + half_width
             and self.y - half_height <= mouse_y <= self.y + half_height
         )
+        self._sync_shapes()
         return self.is_hovered
 
     def check_mouse_press(self, mouse_x: float, mouse_y: float) -> bool:
         """Check if button was clicked."""
-        if not self.enabled:
+        if not self.enabled or not self._visible:
             return False
 
         half_width = self.width / 2
@@ -78,17 +169,20 @@ class Button:
 
         if clicked:
             self.is_pressed = True
+            self._sync_shapes()
 
         return clicked
 
     def check_mouse_release(self, mouse_x: float, mouse_y: float) -> bool:
         """Check if button was released (completes click action)."""
-        if not self.enabled:
+        if not self.enabled or not self._visible:
             self.is_pressed = False
+            self._sync_shapes()
             return False
 
         was_pressed = self.is_pressed
         self.is_pressed = False
+        self._sync_shapes()
 
         if not was_pressed:
             return False
@@ -102,35 +196,6 @@ class Button:
         )
 
     def draw(self):
-        """Draw the button."""
-        if not self.enabled:
-            current_color = tuple(c // 2 for c in self.color)
-        elif self.is_pressed:
-            current_color = self.click_color
-        elif self.is_hovered:
-            current_color = self.hover_color
-        else:
-            current_color = self.color
-
-        # Draw button background
-        arcade.draw_lrbt_rectangle_filled(
-            self.x - self.width / 2,
-            self.x + self.width / 2,
-            self.y - self.height / 2,
-            self.y + self.height / 2,
-            current_color,
-        )
-
-        # Draw border
-        border_color = arcade.color.WHITE if self.is_hovered else arcade.color.DARK_GRAY
-        arcade.draw_lrbt_rectangle_outline(
-            self.x - self.width / 2,
-            self.x + self.width / 2,
-            self.y - self.height / 2,
-            self.y + self.height / 2,
-            border_color,
-            2,
-        )
-
-        # Draw text
-        self._text_obj.draw()
+        """Draw the button when it has its own batch."""
+        if self._owns_batch:
+            self.batch.draw()
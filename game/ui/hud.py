@@ -1,39 +1,84 @@
 import arcade
+from pyglet.graphics import Batch
 
 from game.config import SCREEN_HEIGHT, SCREEN_WIDTH
+from game.ui.label import BoundLabel
 
 
 class HUD:
+    """Score, lives, timer and status line, drawn as one text batch.
+
+    Each label is laid out again only when its shown value changes, so a
+    typical frame just draws the batch.
+    """
+
     def __init__(self):
-        self.score = 0
-        self.lives = 3
-        self.time_elapsed = 0.0
-        self._score_text = arcade.Text(
-            "Score: 0",
-            20,
-            SCREEN_HEIGHT - 30,
-            arcade.color.WHITE,
-            14,
+        self.batch = Batch()
+        self._score_label = BoundLabel(
+            "Score: {}", 0, 20, SCREEN_HEIGHT - 30, arcade.color.WHITE, 14, batch=self.batch
         )
-        self._lives_text = arcade.Text(
-            "Lives: 3",
-            20,
-            SCREEN_HEIGHT - 50,
-            arcade.color.WHITE,
-            14,
+        self._lives_label = BoundLabel(
+            "Lives: {}", 3, 20, SCREEN_HEIGHT - 50, arcade.color.WHITE, 14, batch=self.batch
         )
-        self._time_text = arcade.Text(
-            "Time: 0",
+        # The timer shows whole seconds, so the fraction is dropped before binding
+        self._time_label = BoundLabel(
+            "Time: {}",
+            0,
             SCREEN_WIDTH - 140,
             SCREEN_HEIGHT - 30,
             arcade.color.WHITE,
             14,
+            batch=self.batch,
         )
+        self._status_label = BoundLabel(
+            "{}",
+            "",
+            SCREEN_WIDTH / 2,
+            SCREEN_HEIGHT - 80,
+            arcade.color.GOLD,
+            16,
+            batch=self.batch,
+            anchor_x="center",
+        )
+        self._time_elapsed = 0.0
+
+    @property
+    def score(self) -> int:
+        return self._score_label.value
+
+    @score.setter
+    def score(self, score: int):
+        self._score_label.set(score)
+
+    @property
+    def lives(self) -> int:
+        return self._lives_label.value
+
+    @lives.setter
+    def lives(self, lives: int):
+        self._lives_label.set(lives)
+
+    @property
+    def time_elapsed(self) -> float:
+        return self._time_elapsed
+
+    @time_elapsed.setter
+    def time_elapsed(self, seconds: float):
+        self._time_elapsed = seconds
+        self._time_label.set(int(seconds))
+
+    @property
+    def status(self) -> str:
+        return self._status_label.value
+
+    @status.setter
+    def status(self, message: str):
+        self._status_label.set(message)
+        self._status_label.visible = bool(message)
+
+    @property
+    def labels(self):
+        return (self._score_label, self._lives_label, self._time_label, self._status_label)
 
     def draw(self):
-        self._score_text.text = f"Score: {self.score}"
-        self._lives_text.text = f"Lives: {self.lives}"
-        self._time_text.text = f"Time: {int(self.time_elapsed)}"
-        self._score_text.draw()
-        self._lives_text.draw()
-        self._time_text.draw()
+        self.batch.draw()
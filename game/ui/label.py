@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import Callable, Optional, Union
+
+import arcade
+from pyglet.graphics import Batch
+
+_UNSET = object()
+
+
+class BoundLabel:
+    """Text bound to a value; laid out again only when the value changes.
+
+    Assigning ``arcade.Text.text`` makes pyglet lay the glyphs out again even
+    if the string is the same, so views that refresh a label every frame pay
+    for that every frame. A BoundLabel compares the value first, then the
+    formatted string, and only touches the Text when the string differs.
+
+    ``fmt`` is a ``str.format`` template with one field (``"Score: {}"``)
+    or a callable taking the value. Labels that share a ``batch`` are drawn
+    together with ``batch.draw()``.
+    """
+
+    def __init__(
+        self,
+        fmt: Union[str, Callable[[object], str]],
+        value=_UNSET,
+        x: float = 0,
+        y: float = 0,
+        color: arcade.Color = arcade.color.WHITE,
+        font_size: float = 14,
+        batch: Optional[Batch] = None,
+        **text_kwargs,
+    ):
+        self._format = fmt.format if isinstance(fmt, str) else fmt
+        self._value = _UNSET
+        self.layouts = 0
+        self.text = arcade.Text("", x, y, color, font_size, batch=batch, **text_kwargs)
+        if value is not _UNSET:
+            self.set(value)
+
+    @property
+    def value(self):
+        return None if self._value is _UNSET else self._value
+
+    @value.setter
+    def value(self, value):
+        self.set(value)
+
+    @property
+    def visible(self) -> bool:
+        return self.text.visible
+
+    @visible.setter
+    def visible(self, visible: bool):
+        if self.text.visible != visible:
+            self.text.visible = visible
+
+    def set(self, value) -> bool:
+        """Bind ``value``; returns True if the label had to be laid out again."""
+        if value == self._value:
+            return False
+        self._value = value
+        string = self._format(value)
+        if string == self.text.text:
+            return False
+        self.text.text = string
+        self.layouts += 1
+        return True
+
+    def draw(self):
+        """Draw this label alone (labels in a batch are drawn by the batch)."""
+        self.text.draw()
@@ -0,0 +1,274 @@
+"""
+Scrollable, virtualized list of levels.
+
+Only the rows that fit in the list area (plus one) exist as widgets. When
+the list scrolls, rows are moved, and a row is re-bound to a different
+level only when it scrolls out of the list, so a thousand levels cost
+the same per frame as five. Scrolling eases towards its target, so wheel
+and key presses glide instead of jumping.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import arcade
+
+from game.ui.button import Button
+from game.ui.label import BoundLabel
+from game.ui.shape_batch import UIBatch
+
+# Fraction of the remaining scroll distance covered per second (exponential ease)
+SCROLL_EASE = 14.0
+SCROLLBAR_WIDTH = 6
+
+_PYTHON_TITLES = {1: "EASY", 2: "MEDIUM", 3: "HARD"}
+
+
+@dataclass(frozen=True)
+class LevelEntry:
+    level_id: int
+    title: str
+    best_score: int = 0
+    best_time: Optional[int] = None
+    completed: bool = False
+
+    def describe(self) -> str:
+        parts = [f"Best: {self.best_score}"]
+        if self.best_time is not None:
+            minutes, seconds = divmod(self.best_time, 60)
+            parts.append(f"Time: {minutes}:{seconds:02d}")
+        if self.completed:
+            parts.append("Completed")
+        return "   ".join(parts)
+
+
+def level_entries(registry, data: Dict) -> List[LevelEntry]:
+    """One entry per level in ``registry``, with progress from save ``data``."""
+    high_scores = data.get("high_scores", {})
+    best_times = data.get("best_times", {})
+    completed = set(data.get("levels_completed", []))
+    entries = []
+    for level_id in registry.level_ids():
+        info = registry.info(level_id)
+        if info is None or info.source == "python":
+            title = _PYTHON_TITLES.get(level_id, "")
+        else:
+            title = Path(info.source).stem.replace("_", " ").upper()
+        key = f"level_{level_id}"
+        entries.append(
+            LevelEntry(
+                level_id=level_id,
+                title=title,
+                best_score=high_scores.get(key, 0),
+                best_time=best_times.get(key),
+                completed=level_id in completed,
+            )
+        )
+    return entries
+
+
+class _Row:
+    def __init__(self, level_list: "LevelList", thumbnails: arcade.SpriteList):
+        ui = level_list.ui
+        width = level_list.width
+        height = level_list.row_height - 10
+        self.index: Optional[int] = None
+        self.button = Button(
+            level_list.center_x,
+            0,
+            width,
+            height,
+            "",
+            color=(40, 80, 120),
+            hover_color=(60, 120, 180),
+            click_color=(20, 40, 80),
+            batch=ui,
+        )
+        self._text_x = level_list.left + 20 + level_list.thumbnail_width + 16
+        self.title = BoundLabel(
+            lambda entry: f"LEVEL {entry.level_id}" + (f" - {entry.title}" if entry.title else ""),
+            x=self._text_x,
+            font_size=18,
+            batch=ui.text,
+            bold=True,
+            anchor_y="center",
+        )
+        self.detail = BoundLabel(
+            LevelEntry.describe,
+            x=self._text_x,
+            color=arcade.color.LIGHT_GRAY,
+            font_size=12,
+            batch=ui.text,
+            anchor_y="center",
+        )
+        self.thumbnail = arcade.Sprite()
+        self.thumbnail.visible = False
+        self._thumbnail_x = level_list.left + 20 + level_list.thumbnail_width / 2
+        thumbnails.append(self.thumbnail)
+
+    def bind(self, index: Optional[int], entry: Optional[LevelEntry]):
+        self.index = index
+        visible = entry is not None
+        self.button.visible = visible
+        self.title.visible = visible
+        self.detail.visible = visible
+        self.thumbnail.visible = False
+        if visible:
+            self.title.set(entry)
+            self.detail.set(entry)
+
+    def move_to(self, y: float):
+        self.button.move_to(self.button.x, y)
+        self.title.text.position = (self._text_x, y + 10)
+        self.detail.text.position = (self._text_x, y - 14)
+        self.thumbnail.position = (self._thumbnail_x, y)
+
+
+class LevelList:
+    def __init__(
+        self,
+        entries: List[LevelEntry],
+        center_x: float,
+        top: float,
+        width: float,
+        height: float,
+        row_height: float = 80,
+        thumbnails=None,
+        thumbnail_width: float = 96,
+    ):
+        self.entries = entries
+        self.center_x = center_x
+        self.left = center_x - width / 2
+        self.top = top
+        self.bottom = top - height
+        self.width = width
+        self.height = height
+        self.row_height = row_height
+        self.thumbnails = thumbnails
+        self.thumbnail_width = thumbnail_width if thumbnails is not None else 0
+
+        self.scroll = 0.0
+        self.scroll_target = 0.0
+        self.ui = UIBatch()
+        self._thumbnail_sprites = arcade.SpriteList()
+        row_count = min(len(entries), math.ceil(height / row_height) + 1)
+        self.rows = [_Row(self, self._thumbnail_sprites) for _ in range(row_count)]
+
+        right = self.left + width + 4
+        self._track_shape = self.ui.shapes.add_rect(
+            right, right + SCROLLBAR_WIDTH, self.bottom, top, (30, 40, 55)
+        )
+        self._thumb_shape = self.ui.shapes.add_rect(
+            right, right + SCROLLBAR_WIDTH, self.bottom, top, (90, 140, 200)
+        )
+        scrollable = self.max_scroll > 0
+        self.ui.shapes.set_visible(self._track_shape, scrollable)
+        self.ui.shapes.set_visible(self._thumb_shape, scrollable)
+        self._layout()
+
+    @property
+    def max_scroll(self) -> float:
+        return max(0.0, len(self.entries) * self.row_height - self.height)
+
+    def visible_indices(self) -> range:
+        first = int(self.scroll // self.row_height)
+        last = min(len(self.entries), math.ceil((self.scroll + self.height) / self.row_height))
+        return range(first, last)
+
+    def scroll_by(self, pixels: float):
+        self.scroll_target = min(self.max_scroll, max(0.0, self.scroll_target + pixels))
+
+    def scroll_to(self, index: int):
+        """Scroll the least distance that shows entry ``index`` whole."""
+        row_top = index * self.row_height
+        if row_top < self.scroll_target:
+            self.scroll_by(row_top - self.scroll_target)
+        elif row_top + self.row_height > self.scroll_target + self.height:
+            self.scroll_by(row_top + self.row_height - self.height - self.scroll_target)
+
+    def update(self, delta_time: float):
+        if self.scroll != self.scroll_target:
+            step = 1.0 - math.exp(-SCROLL_EASE * delta_time)
+            self.scroll += (self.scroll_target - self.scroll) * step
+            if abs(self.scroll_target - self.scroll) < 0.5:
+                self.scroll = self.scroll_target
+            self._layout()
+        self._update_thumbnails()
+
+    def _layout(self):
+        first = int(self.scroll // self.row_height)
+        count = len(self.rows)
+        for index in range(first, first + count):
+            # Rows are recycled round-robin: crossing a row boundary re-binds one row
+            row = self.rows[index % count]
+            if row.index != index:
+                entry = self.entries[index] if index < len(self.entries) else None
+                row.bind(index, entry)
+            row.move_to(self.top - (index + 0.5) * self.row_height + self.scroll)
+        if self.max_scroll > 0:
+            thumb = max(20.0, self.height * self.height / (len(self.entries) * self.row_height))
+            thumb_top = self.top - (self.height - thumb) * self.scroll / self.max_scroll
+            right = self.left + self.width + 4
+            self.ui.shapes.set_rect(
+                self._thumb_shape, right, right + SCROLLBAR_WIDTH, thumb_top - thumb, thumb_top
+            )
+
+    def _update_thumbnails(self):
+        if self.thumbnails is None:
+            return
+        for row in self.rows:
+            if row.index is None or row.index >= len(self.entries) or row.thumbnail.visible:
+                continue
+            texture = self.thumbnails.request(self.entries[row.index].level_id)
+            if texture is not None:
+                row.thumbnail.texture = texture
+                row.thumbnail.visible = True
+        self.thumbnails.retain(
+            self.entries[row.index].level_id
+            for row in self.rows
+            if row.index is not None and row.index < len(self.entries)
+        )
+
+    def contains(self, x: float, y: float) -> bool:
+        return self.left <= x <= self.left + self.width and self.bottom <= y <= self.top
+
+    def on_mouse_motion(self, x: float, y: float):
+        # Rows half scrolled out are clipped; the hidden part must not hover
+        inside = self.contains(x, y)
+        for row in self.rows:
+            if inside or row.button.is_hovered:
+                row.button.check_mouse_hover(x, y if inside else math.inf)
+
+    def on_mouse_press(self, x: float, y: float) -> Optional[LevelEntry]:
+        """Return the entry whose row was clicked, if any."""
+        if not self.contains(x, y):
+            return None
+        for row in self.rows:
+            if row.button.check_mouse_press(x, y):
+                return self.entries[row.index]
+        return None
+
+    def on_mouse_release(self, x: float, y: float):
+        for row in self.rows:
+            row.button.check_mouse_release(x, y)
+
+    def draw(self):
+        ctx = arcade.get_window().ctx
+        ctx.scissor = (
+            int(self.left),
+            int(self.bottom),
+            int(self.width) + 4 + SCROLLBAR_WIDTH,
+            int(self.height),
+        )
+        # Thumbnails sit on the row buttons, under the row text
+        self.ui.shapes.draw()
+        self._thumbnail_sprites.draw()
+        self.ui.text.draw()
+        ctx.scissor = None
+
+    def release(self):
+        self.ui.release()
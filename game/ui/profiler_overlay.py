@@ -0,0 +1,83 @@
+import arcade
+
+from game.config import SCREEN_HEIGHT, TARGET_FPS
+from game.systems.profiler import FRAME, FrameProfiler
+
+
+class ProfilerOverlay:
+    """Frame-time graph plus p50/p95/p99 per section, drawn in HUD space."""
+
+    def __init__(
+        self,
+        profiler: FrameProfiler,
+        x: float = 10,
+        top: float = SCREEN_HEIGHT - 70,
+        width: float = 420,
+        graph_height: float = 80,
+        refresh_interval: float = 0.5,
+    ):
+        self.profiler = profiler
+        self.x = x
+        self.top = top
+        self.width = width
+        self.graph_height = graph_height
+        # Percentiles sort the whole window, so the table is not rebuilt every frame
+        self.refresh_interval = refresh_interval
+        self._since_refresh = refresh_interval
+        self._text = arcade.Text(
+            "",
+            x + 6,
+            top - graph_height - 8,
+            arcade.color.WHITE,
+            10,
+            width=int(width - 12),
+            multiline=True,
+            anchor_y="top",
+            font_name=("Consolas", "Courier New", "monospace"),
+        )
+
+    def update(self, delta_time: float):
+        self._since_refresh += delta_time
+        if self._since_refresh < self.refresh_interval:
+            return
+        self._since_refresh = 0.0
+        profiler = self.profiler
+        lines = [f"{'section':<24}{'p50':>8}{'p95':>8}{'p99':>8}  ms"]
+        for name in (FRAME, *profiler.section_names()):
+            stats = profiler.percentiles(name)
+            lines.append(
+                f"{name:<24}{stats['p50'] * 1000:>8.2f}"
+                f"{stats['p95'] * 1000:>8.2f}{stats['p99'] * 1000:>8.2f}"
+            )
+        for name in profiler.counter_names():
+            stats = profiler.percentiles(name)
+            lines.append(
+                f"{name:<24}{stats['p50']:>8.0f}{stats['p95']:>8.0f}{stats['p99']:>8.0f}"
+            )
+        self._text.text = "\n".join(lines)
+
+    def draw(self):
+        graph_bottom = self.top - self.graph_height
+        bottom = graph_bottom - self._text.content_height - 16
+        arcade.draw_lrbt_rectangle_filled(
+            self.x, self.x + self.width, bottom, self.top, (0, 0, 0, 180)
+        )
+
+        # Graph scale: the frame budget sits at half height
+        budget = 1 / TARGET_FPS
+        scale = self.graph_height / (2 * budget)
+        budget_y = graph_bottom + budget * scale
+        arcade.draw_line(
+            self.x, budget_y, self.x + self.width, budget_y, arcade.color.DARK_GREEN, 1
+        )
+
+        times = self.profiler.frame_times()
+        if len(times) > 1:
+            step = self.width / (self.profiler.window - 1)
+            start_x = self.x + self.width - step * (len(times) - 1)
+            points = [
+                (start_x + i * step, graph_bottom + min(t * scale, self.graph_height))
+                for i, t in enumerate(times)
+            ]
+            arcade.draw_line_strip(points, arcade.color.YELLOW, 1)
+        self._text.draw()
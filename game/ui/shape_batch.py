@@ -0,0 +1,217 @@
+"""
+Retained rectangles for menu widgets.
+
+Immediate-mode ``draw_lrbt_rectangle_*`` calls cost a draw call (and a
+buffer upload) each, twice per button per frame. A ShapeBatch keeps every
+rectangle a screen needs in one vertex array instead: widgets add their
+rectangles once and change a shape's colour or rectangle only when their
+state changes. Drawing uploads the array if something changed and renders
+all shapes in one call, in the order they were added.
+
+Outlines are four thin quads, so fills and outlines share the batch.
+GL objects are created on the first draw, so shapes can be built and
+edited without a window. Every batch shares one shader program per GL
+context; ``release`` frees a batch's own buffers when its screen goes away.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+import arcade
+import numpy as np
+from pyglet.graphics import Batch
+
+from game.systems.shaders import shared_program
+
+
+# x, y, r, g, b, a
+_VERTEX_FLOATS = 6
+
+_VERTEX_SHADER = """
+#version 330
+
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+in vec2 in_vert;
+in vec4 in_color;
+out vec4 v_color;
+
+void main() {
+    gl_Position = window.projection * window.view * vec4(in_vert, 0.0, 1.0);
+    v_color = in_color;
+}
+"""
+
+_FRAGMENT_SHADER = """
+#version 330
+
+in vec4 v_color;
+out vec4 fragColor;
+
+void main() {
+    fragColor = v_color;
+}
+"""
+
+
+def _normalized(color: arcade.Color) -> Tuple[float, float, float, float]:
+    alpha = color[3] if len(color) >= 4 else 255
+    return (color[0] / 255, color[1] / 255, color[2] / 255, alpha / 255)
+
+
+class _Shape:
+    __slots__ = ("start", "quads", "border_width", "color", "visible")
+
+    def __init__(self, start: int, quads: int, border_width: Optional[float], color):
+        self.start = start
+        self.quads = quads
+        self.border_width = border_width
+        self.color = color
+        self.visible = True
+
+
+class ShapeBatch:
+    def __init__(self, capacity: int = 64):
+        self._vertices = np.zeros((capacity * 4, _VERTEX_FLOATS), dtype=np.float32)
+        self._shapes: List[_Shape] = []
+        self._quads = 0
+        self._dirty = True
+        self._program = None
+        self._buffer = None
+        self._index_buffer = None
+        self._geometry = None
+        self._gl_capacity = 0
+
+    def __len__(self) -> int:
+        """Number of shapes (an outline counts once)."""
+        return len(self._shapes)
+
+    @property
+    def quad_count(self) -> int:
+        return self._quads
+
+    def add_rect(self, left, right, bottom, top, color: arcade.Color) -> int:
+        """Add a filled rectangle; returns its shape id."""
+        return self._add(1, None, (left, right, bottom, top), color)
+
+    def add_outline(self, left, right, bottom, top, color: arcade.Color, border_width=2) -> int:
+        """Add a rectangle outline centred on the edges; returns its shape id."""
+        return self._add(4, border_width, (left, right, bottom, top), color)
+
+    def set_color(self, shape: int, color: arcade.Color):
+        entry = self._shapes[shape]
+        entry.color = color
+        if entry.visible:
+            self._write_color(entry, _normalized(color))
+
+    def set_rect(self, shape: int, left, right, bottom, top):
+        self._write_rect(self._shapes[shape], (left, right, bottom, top))
+
+    def set_visible(self, shape: int, visible: bool):
+        entry = self._shapes[shape]
+        if entry.visible == visible:
+            return
+        entry.visible = visible
+        self._write_color(entry, _normalized(entry.color) if visible else (0, 0, 0, 0))
+
+    def vertices(self, shape: int) -> np.ndarray:
+        """The (x, y, r, g, b, a) rows of ``shape``, four per quad."""
+        entry = self._shapes[shape]
+        return self._vertices[entry.start * 4:(entry.start + entry.quads) * 4]
+
+    def release(self):
+        """Free the GL buffers; the next draw creates them again."""
+        if self._buffer is not None:
+            self._buffer.delete()
+            self._index_buffer.delete()
+        # The geometry's vertex arrays go with it once unreferenced
+        self._geometry = self._buffer = self._index_buffer = None
+        self._gl_capacity = 0
+        self._dirty = True
+
+    def draw(self):
+        if self._quads == 0:
+            return
+        if self._geometry is None or self._gl_capacity < self._quads:
+            self._create_gl_objects()
+        if self._dirty:
+            self._buffer.write(self._vertices[:self._quads * 4].tobytes())
+            self._dirty = False
+        ctx = self._program.ctx
+        with ctx.enabled(ctx.BLEND):
+            self._geometry.render(self._program, vertices=self._quads * 6)
+
+    def _add(self, quads: int, border_width, rect, color) -> int:
+        needed = (self._quads + quads) * 4
+        if needed > len(self._vertices):
+            grown = np.zeros((max(needed, len(self._vertices) * 2), _VERTEX_FLOATS), dtype=np.float32)
+            grown[:len(self._vertices)] = self._vertices
+            self._vertices = grown
+        entry = _Shape(self._quads, quads, border_width, color)
+        self._quads += quads
+        self._shapes.append(entry)
+        self._write_rect(entry, rect)
+        self._write_color(entry, _normalized(color))
+        return len(self._shapes) - 1
+
+    def _write_rect(self, entry: _Shape, rect):
+        left, right, bottom, top = rect
+        if entry.border_width is None:
+            quads = [rect]
+        else:
+            half = entry.border_width / 2
+            quads = [
+                (left - half, left + half, bottom - half, top + half),
+                (right - half, right + half, bottom - half, top + half),
+                (left + half, right - half, bottom - half, bottom + half),
+                (left + half, right - half, top - half, top + half),
+            ]
+        rows = self._vertices[entry.start * 4:(entry.start + entry.quads) * 4]
+        for i, (l, r, b, t) in enumerate(quads):
+            rows[i * 4:i * 4 + 4, 0:2] = ((l, b), (r, b), (r, t), (l, t))
+        self._dirty = True
+
+    def _write_color(self, entry: _Shape, rgba):
+        self._vertices[entry.start * 4:(entry.start + entry.quads) * 4, 2:6] = rgba
+        self._dirty = True
+
+    def _create_gl_objects(self):
+        self.release()
+        ctx = arcade.get_window().ctx
+        self._program = shared_program(ctx, _VERTEX_SHADER, _FRAGMENT_SHADER)
+        capacity = len(self._vertices) // 4
+        corners = np.array((0, 1, 2, 0, 2, 3), dtype=np.uint32)
+        indices = (np.arange(capacity, dtype=np.uint32)[:, None] * 4 + corners).ravel()
+        self._buffer = ctx.buffer(reserve=self._vertices.nbytes)
+        self._index_buffer = ctx.buffer(data=indices.tobytes())
+        self._geometry = ctx.geometry(
+            [arcade.gl.BufferDescription(self._buffer, "2f 4f", ["in_vert", "in_color"])],
+            index_buffer=self._index_buffer,
+            index_element_size=4,
+            mode=ctx.TRIANGLES,
+        )
+        self._gl_capacity = capacity
+        self._dirty = True
+
+
+class UIBatch:
+    """Every widget rectangle and label of one screen: two draw calls in all.
+
+    Widgets given a UIBatch put their shapes in ``shapes`` and their text in
+    ``text``; the screen then draws the batch instead of each widget.
+    """
+
+    def __init__(self):
+        self.shapes = ShapeBatch()
+        self.text = Batch()
+
+    def draw(self):
+        self.shapes.draw()
+        self.text.draw()
+
+    def release(self):
+        self.shapes.release()
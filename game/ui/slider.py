@@ -1,8 +1,17 @@
+from typing import Optional
+
 import arcade
 
+from game.ui.label import BoundLabel
+from game.ui.shape_batch import UIBatch
+
 
 class Slider:
-    """Interactive slider for adjusting values."""
+    """Interactive slider for adjusting values.
+
+    Bar, fill and handle are shapes in a UIBatch (see Button); setting
+    ``value`` moves them and updates the value text.
+    """
 
     def __init__(
         self,
@@ -16,6 +25,7 @@ class Slider:
         label: str = "",
         bar_color: tuple[int, int, int] = arcade.color.GRAY,
         handle_color: tuple[int, int, int] = arcade.color.WHITE,
+        batch: Optional[UIBatch] = None,
     ):
         self.x = x
         self.y = y
@@ -23,7 +33,7 @@ class Slider:
         self.height = height
         self.min_value = min_value
         self.max_value = max_value
-        self.value = initial_value
+        self._value = initial_value
         self.label = label
         self.bar_color = bar_color
         self.handle_color = handle_color
@@ -32,6 +42,16 @@ class Slider:
         self.handle_width = 12
         self.handle_height = height + 10
 
+        self._owns_batch = batch is None
+        self.batch = batch or UIBatch()
+        shapes = self.batch.shapes
+        bar = self._bar_rect()
+        self._bar_shape = shapes.add_rect(*bar, bar_color)
+        self._fill_shape = shapes.add_rect(*bar, arcade.color.GREEN)
+        self._bar_outline_shape = shapes.add_outline(*bar, arcade.color.WHITE, 2)
+        self._handle_shape = shapes.add_rect(*bar, handle_color)
+        self._handle_outline_shape = shapes.add_outline(*bar, arcade.color.BLACK, 2)
+
         self._label_text = arcade.Text(
             label,
             x - width / 2 - 10,
@@ -40,22 +60,63 @@ class Slider:
             14,
             anchor_x="right",
             anchor_y="center",
+            batch=self.batch.text,
         )
 
-        self._value_text = arcade.Text(
-            self._format_value(),
+        # Laid out again only when the shown percentage changes
+        self._value_text = BoundLabel(
+            self._format_value,
+            self.value,
             x + width / 2 + 10,
             y,
             arcade.color.WHITE,
             14,
             anchor_x="left",
             anchor_y="center",
+            batch=self.batch.text,
+        )
+        self._sync_shapes()
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    @value.setter
+    def value(self, value: float):
+        if value == self._value:
+            return
+        self._value = value
+        self._value_text.set(value)
+        self._sync_shapes()
+
+    def _bar_rect(self):
+        return (
+            self.x - self.width / 2,
+            self.x + self.width / 2,
+            self.y - self.height / 2,
+            self.y + self.height / 2,
         )
 
-    def _format_value(self) -> str:
+    def _sync_shapes(self):
+        """Move the fill and handle to the current value."""
+        shapes = self.batch.shapes
+        left, right, bottom, top = self._bar_rect()
+        handle_x = self._get_handle_x()
+        shapes.set_rect(self._fill_shape, left, handle_x, bottom, top)
+        shapes.set_visible(self._fill_shape, handle_x > left)
+        handle = (
+            handle_x - self.handle_width / 2,
+            handle_x + self.handle_width / 2,
+            self.y - self.handle_height / 2,
+            self.y + self.handle_height / 2,
+        )
+        shapes.set_rect(self._handle_shape, *handle)
+        shapes.set_rect(self._handle_outline_shape, *handle)
+
+    def _format_value(self, value: float) -> str:
         """Format value as percentage."""
         percentage = int(
-            ((self.value - self.min_value) / (self.max_value - self.min_value)) * 100
+            ((value - self.min_value) / (self.max_value - self.min_value)) * 100
         )
         return f"{percentage}%"
 
@@ -91,7 +152,6 @@ class Slider:
             and self.y - self.height / 2 <= mouse_y <= self.y + self.height / 2
         ):
             self.value = self._value_from_x(mouse_x)
-            self._value_text.text = self._format_value()
             self.is_dragging = True
             return True
 
@@ -105,58 +165,8 @@ class Slider:
         """Handle mouse drag."""
         if self.is_dragging:
             self.value = self._value_from_x(mouse_x)
-            self._value_text.text = self._format_value()
 
     def draw(self):
-        """Draw the slider."""
-        # Draw bar background
-        arcade.draw_lrbt_rectangle_filled(
-            self.x - self.width / 2,
-            self.x + self.width / 2,
-            self.y - self.height / 2,
-            self.y + self.height / 2,
-            self.bar_color,
-        )
-
-        # Draw filled portion
-        handle_x = self._get_handle_x()
-        filled_width = handle_x - (self.x - self.width / 2)
-        if filled_width > 0:
-            arcade.draw_lrbt_rectangle_filled(
-                self.x - self.width / 2,
-                self.x - self.width / 2 + filled_width,
-                self.y - self.height / 2,
-                self.y + self.height / 2,
-                arcade.color.GREEN,
-            )
-
-        # Draw bar outline
-        arcade.draw_lrbt_rectangle_outline(
-            self.x - self.width / 2,
-            self.x + self.width / 2,
-            self.y - self.height / 2,
-            self.y + self.height / 2,
-            arcade.color.WHITE,
-            2,
-        )
-
-        # Draw handle
-        arcade.draw_lrbt_rectangle_filled(
-            handle_x - self.handle_width / 2,
-            handle_x + self.handle_width / 2,
-            self.y - self.handle_height / 2,
-            self.y + self.handle_height / 2,
-            self.handle_color,
-        )
-        arcade.draw_lrbt_rectangle_outline(
-            handle_x - self.handle_width / 2,
-            handle_x + self.handle_width / 2,
-            self.y - self.handle_height / 2,
-            self.y + self.handle_height / 2,
-            arcade.color.BLACK,
-            2,
-        )
-
-        # Draw label and value
-        self._label_text.draw()
-        self._value_text.draw()
+        """Draw the slider when it has its own batch."""
+        if self._owns_batch:
+            self.batch.draw()
@@ -1,23 +1,76 @@
+import argparse
+import sys
+import time
+
 import arcade
 
-from game.config import SCREEN_HEIGHT, SCREEN_TITLE, SCREEN_WIDTH
+from game.config import RENDER_FPS, SCREEN_HEIGHT, SCREEN_TITLE, SCREEN_WIDTH
 from game.state_manager import StateManager
 
 
 class PhysicsPlayWindow(arcade.Window):
     def __init__(self):
-        super().__init__(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, center_window=True)
+        super().__init__(
+            SCREEN_WIDTH,
+            SCREEN_HEIGHT,
+            SCREEN_TITLE,
+            center_window=True,
+            update_rate=1 / RENDER_FPS,
+            draw_rate=1 / RENDER_FPS,
+        )
         self.state_manager = StateManager(self)
 
     def setup(self):
+        # Shows a loading screen until the menu's assets are decoded
         self.state_manager.show_menu()
 
+    def on_update(self, delta_time: float):
+        # Runs after the current view's on_update
+        self.state_manager.update()
+
+    def on_close(self):
+        # Otherwise exit waits for every queued asset to finish decoding
+        self.state_manager.shutdown()
+        super().on_close()
+
+
+def _report_startup(window: PhysicsPlayWindow, started: float):
+    """Print time to the first frame, to the menu and to every asset decoded, then quit."""
+    from game.states.menu_state import MenuView
+
+    marks = {}
+
+    def on_draw():
+        now = time.perf_counter() - started
+        marks.setdefault("first frame", now)
+        if isinstance(window.current_view, MenuView):
+            marks.setdefault("menu", now)
+        if "menu" in marks and window.state_manager.assets.progress() >= 1.0:
+            marks["all assets"] = now
+            for name, seconds in marks.items():
+                print(f"{name:>12}: {seconds * 1000:8.1f} ms")
+            arcade.exit()
+
+    window.push_handlers(on_draw=on_draw)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play System Override.")
+    parser.add_argument(
+        "--startup-bench",
+        action="store_true",
+        help="print time to first frame and to the menu, then exit",
+    )
+    args = parser.parse_args(argv)
 
-def main():
+    started = time.perf_counter()
     window = PhysicsPlayWindow()
     window.setup()
+    if args.startup_bench:
+        _report_startup(window, started)
     arcade.run()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,45 @@
+import arcade
+import pytest
+
+from game.levels import level_cache
+from game.levels.base import LevelSpec, PlatformSpec
+
+
+@pytest.fixture(autouse=True)
+def level_cache_dir(tmp_path, monkeypatch):
+    """Keep compiled levels out of the real data/ folder."""
+    folder = tmp_path / "level_cache"
+    monkeypatch.setattr(level_cache, "LEVEL_CACHE_DIR", str(folder))
+    return folder
+
+
+@pytest.fixture
+def window():
+    try:
+        window = arcade.Window(100, 100, "test", visible=False)
+    except Exception as exc:  # pragma: no cover - depends on environment
+        pytest.skip(f"Could not create Arcade window: {exc}")
+    yield window
+    window.close()
+
+
+@pytest.fixture
+def floor_spec():
+    """Factory for a small level: a 1200px floor, spawn at (100, 120), end at x=900.
+
+    Positional platforms are added on top of the floor; keyword arguments
+    set LevelSpec fields.
+    """
+
+    def make(*platforms, **fields):
+        spec = LevelSpec(
+            level_id=99,
+            spawn_point=(100, 120),
+            platforms=[PlatformSpec(600, 40, 1200, 40, arcade.color.GRAY), *platforms],
+            end_x=900,
+        )
+        for key, value in fields.items():
+            setattr(spec, key, value)
+        return spec
+
+    return make
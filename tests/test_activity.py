@@ -0,0 +1,103 @@
+import arcade
+import pytest
+
+from game.levels.base import EnemySpec, LevelSpec, MovingPlatformSpec, PlatformSpec
+from game.systems.activity import ActivityRegion
+from game.systems.motion import ping_pong
+from game.systems.simulation import LevelSimulation, PlayerInput
+
+
+def _stepped(position, velocity, low, high, ticks):
+    for _ in range(ticks):
+        position += velocity
+        if position >= high:
+            position, velocity = 2 * high - position, -velocity
+        elif position <= low:
+            position, velocity = 2 * low - position, -velocity
+    return position, velocity
+
+
+@pytest.mark.parametrize("ticks", [0, 1, 7, 50, 333])
+@pytest.mark.parametrize("velocity", [2.0, -3.0])
+def test_ping_pong_matches_stepping(ticks, velocity):
+    expected = _stepped(130.0, velocity, 100.0, 200.0, ticks)
+    assert ping_pong(130.0, velocity, 100.0, 200.0, ticks) == pytest.approx(expected)
+
+
+def _wide_spec():
+    return LevelSpec(
+        level_id=99,
+        spawn_point=(100, 120),
+        platforms=[PlatformSpec(5000, 40, 10000, 40, arcade.color.GRAY)],
+        moving_platforms=[
+            MovingPlatformSpec(
+                8000, 300, 128, 24, arcade.color.GRAY,
+                change_x=2, boundary_left=7800, boundary_right=8200,
+            )
+        ],
+        enemies=[
+            EnemySpec("patrol", 300, 74, {"left_bound": 240, "right_bound": 360}),
+            # Bounds off the 4px-per-tick grid, so turning overshoots them
+            EnemySpec("patrol", 9000, 74, {"left_bound": 8901, "right_bound": 9099}),
+        ],
+        end_x=9900,
+    )
+
+
+def test_far_movers_sleep_and_stay_put():
+    sim = LevelSimulation(spec=_wide_spec())
+    near, far = list(sim.enemy_list)
+    platform = sim.moving_platform_list[0]
+    far_x, platform_x = far.center_x, platform.center_x
+    for _ in range(45):
+        sim.step(PlayerInput())
+
+    assert list(sim.activity.awake_enemies) == [near]
+    assert len(sim.activity.active_platforms) == 0
+    assert sim.activity.is_asleep(far) and sim.activity.is_asleep(platform)
+    assert (far.center_x, platform.center_x) == (far_x, platform_x)
+    assert near.center_x != 300
+
+
+def test_woken_patrol_enemy_matches_one_that_never_slept():
+    sim = LevelSimulation(spec=_wide_spec())
+    awake = LevelSimulation(spec=_wide_spec())
+    far, far_awake = sim.enemy_list[1], awake.enemy_list[1]
+    everything = (0, 10000, 0, 720)
+    for _ in range(101):
+        sim.step(PlayerInput())
+        awake.view_bounds = everything
+        awake.step(PlayerInput())
+    assert sim.activity.is_asleep(far)
+    assert not awake.activity.is_asleep(far_awake)
+
+    sim.view_bounds = awake.view_bounds = (8500, 9780, 0, 720)
+    sim.step(PlayerInput())
+    awake.step(PlayerInput())
+    assert far in sim.activity.awake_enemies
+    assert (far.center_x, far.change_x) == (far_awake.center_x, far_awake.change_x)
+
+
+class _Mover:
+    can_sleep = True
+
+    def __init__(self, x):
+        self.x = x
+
+    def reach(self):
+        return (self.x, self.x + 10, 0, 10)
+
+    def advance_asleep(self, ticks, delta_time):
+        pass
+
+
+def test_movers_woken_together_wake_in_track_order():
+    movers = [_Mover(5000 + 20 * i) for i in range(50)]
+    region = ActivityRegion(margin=0, hysteresis=0)
+    region.track(enemies=movers)
+    region.update((0, 100, 0, 100), tick=1, delta_time=1 / 60)
+    assert not region.awake_enemies
+
+    woken = region.update((4900, 6100, 0, 100), tick=2, delta_time=1 / 60)
+    assert woken == movers
+    assert list(region.awake_enemies) == movers
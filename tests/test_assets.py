@@ -0,0 +1,48 @@
+import time
+
+from PIL import Image
+
+from game.systems.assets import KIND_IMAGE, KIND_SOUND, AssetManager, asset_key, build_manifest
+
+
+def _wait_for(manager, paths, timeout=10.0):
+    deadline = time.perf_counter() + timeout
+    while not manager.ready(paths):
+        assert time.perf_counter() < deadline, "assets did not finish decoding"
+        time.sleep(0.01)
+
+
+def test_manifest_lists_every_image_and_sound():
+    manifest = build_manifest()
+    assert manifest["assets/audio/coin.wav"].kind == KIND_SOUND
+    assert manifest["assets/backgrounds/menu_background.jpg"].kind == KIND_IMAGE
+    assert "assets/player/anim/idle/0.png" in manifest
+    assert not any(key.endswith(".gitkeep") for key in manifest)
+    assert all(entry.size > 0 for entry in manifest.values())
+
+
+def test_assets_decode_in_the_background_with_progress(tmp_path):
+    for name in ("a", "b"):
+        Image.new("RGBA", (8, 8), (255, 0, 0, 255)).save(tmp_path / f"{name}.png")
+    (tmp_path / "broken.png").write_bytes(b"not an image")
+    manager = AssetManager(build_manifest(str(tmp_path)))
+    paths = [tmp_path / "a.png", tmp_path / "b.png", tmp_path / "broken.png"]
+
+    assert manager.progress(paths) == 0.0
+    assert manager.get(paths[0]) is None
+    manager.start()
+    _wait_for(manager, paths)
+
+    assert manager.progress(paths) == 1.0
+    assert manager.get(paths[0]).size == (8, 8)
+    # A broken file is done too, so a loading screen never hangs on it
+    assert manager.get(paths[2]) is None
+    assert asset_key(paths[2]) in manager.errors
+    manager.shutdown()
+
+
+def test_wait_decodes_assets_nothing_queued(tmp_path):
+    Image.new("RGBA", (4, 2)).save(tmp_path / "late.png")
+    manager = AssetManager(build_manifest(str(tmp_path)))
+    assert manager.wait(tmp_path / "late.png").size == (4, 2)
+    assert manager.ready([tmp_path / "late.png"])
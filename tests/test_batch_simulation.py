@@ -0,0 +1,61 @@
+import arcade
+import numpy as np
+
+from game.levels.base import CoinSpec, HazardSpec, PlatformSpec
+from game.systems.batch_simulation import (
+    BatchSimulation,
+    RandomPolicy,
+    ScriptedPolicy,
+    playtest,
+)
+from game.systems.simulation import LevelSimulation, PlayerInput
+
+
+def test_batch_tracks_level_simulation_for_a_jump_script(floor_spec):
+    spec = floor_spec(PlatformSpec(450, 100, 60, 80, arcade.color.GRAY))
+    policy = ScriptedPolicy.run_and_jump()
+    sim = LevelSimulation(spec=spec)
+    batch = BatchSimulation(spec, 4, seed=0)
+
+    for tick in range(120):
+        sim.step(policy.script[tick % len(policy.script)])
+        batch.step(policy(batch, tick))
+        if sim.finished:
+            break
+        assert np.allclose(batch.x, sim.player.center_x, atol=1.0)
+        assert np.allclose(batch.y, sim.player.center_y, atol=1.0)
+
+
+def test_batch_instances_are_independent(floor_spec):
+    batch = BatchSimulation(floor_spec(coins=[CoinSpec(400, 90)]), 2)
+    right = np.array([False, True])
+    idle = np.zeros(2, dtype=bool)
+    for _ in range(300):
+        batch.step((idle, right, idle, idle))
+
+    assert list(batch.won) == [False, True]
+    assert list(batch.score) == [0, batch.final_score[1]]
+    assert batch.final_score[1] > 0
+    assert batch.x[0] == 100
+
+
+def test_batch_requires_all_coins_and_counts_deaths(floor_spec):
+    spec = floor_spec(coins=[CoinSpec(50, 300)], requires_all_coins=True)
+    report = playtest(spec, ScriptedPolicy([PlayerInput(right=True)]), runs=3, max_time=5)
+    assert report.completed == 0
+    assert report.par_time is None
+
+    spec = floor_spec(hazards=[HazardSpec(300, 70)])
+    batch = BatchSimulation(spec, 3, lives=2)
+    batch.run(ScriptedPolicy([PlayerInput(right=True)]), max_ticks=600)
+    assert batch.all_finished
+    assert not batch.won.any()
+    assert list(batch.deaths) == [2, 2, 2]
+
+
+def test_playtest_reports_par_time(floor_spec):
+    report = playtest(floor_spec(), RandomPolicy(seed=3, right_bias=0.9), runs=50, max_time=20)
+
+    assert report.runs == 50
+    assert 0 < report.completed <= 50
+    assert report.par_time >= report.best_time > 0
@@ -0,0 +1,38 @@
+import arcade
+
+from game.entities.enemy import PatrolEnemy
+from game.entities.platform import Platform
+from game.systems.enemy_physics import EnemyPhysics
+from game.systems.spatial import SpatialHash
+
+
+def _make_level():
+    walls = arcade.SpriteList()
+    ground = Platform(800, 40)
+    ground.center_x, ground.center_y = 400, 20
+    walls.append(ground)
+    enemies = arcade.SpriteList()
+    enemy = PatrolEnemy(left_bound=200, right_bound=500)
+    enemy.center_x, enemy.center_y = 300, 120
+    enemies.append(enemy)
+    return walls, enemies, enemy
+
+
+def test_shared_physics_matches_platformer_engine():
+    walls, enemies, enemy = _make_level()
+    engine = arcade.PhysicsEnginePlatformer(enemy, walls=walls, gravity_constant=1.0)
+
+    ref_walls, ref_enemies, shared_enemy = _make_level()
+    physics = EnemyPhysics(
+        ref_enemies, obstacles=[SpatialHash.from_sprites(ref_walls)], gravity_constant=1.0
+    )
+
+    for _ in range(240):
+        enemies.update()
+        engine.update()
+        ref_enemies.update()
+        physics.update()
+        assert abs(enemy.center_x - shared_enemy.center_x) < 0.01
+        assert abs(enemy.bottom - shared_enemy.bottom) <= 0.25
+
+    assert abs(shared_enemy.bottom - 40) <= 0.25
@@ -0,0 +1,34 @@
+from game.ui.hud import HUD
+from game.ui.label import BoundLabel
+
+
+def test_bound_label_lays_out_only_on_change(window):
+    label = BoundLabel("Score: {}", 0)
+    assert label.text.text == "Score: 0"
+    assert label.layouts == 1
+
+    assert not label.set(0)
+    assert label.set(10)
+    assert label.text.text == "Score: 10"
+    assert label.layouts == 2
+
+
+def test_bound_label_skips_values_that_format_the_same(window):
+    label = BoundLabel(lambda value: f"{int(value * 100)}%", 0.5)
+    label.set(0.501)
+    label.set(0.502)
+    assert label.text.text == "50%"
+    assert label.layouts == 1
+
+
+def test_hud_frames_without_changes_do_no_layout(window):
+    hud = HUD()
+    hud.score = 5
+    hud.time_elapsed = 1.2
+    before = sum(label.layouts for label in hud.labels)
+    for frame in range(30):
+        hud.score = 5
+        hud.time_elapsed = 1.2 + frame / 100
+        hud.status = ""
+        hud.draw()
+    assert sum(label.layouts for label in hud.labels) == before
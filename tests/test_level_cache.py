@@ -0,0 +1,90 @@
+import shutil
+
+from game.levels.level_cache import (
+    cache_path_for,
+    compile_level,
+    decode_level,
+    encode_level,
+    load_compiled_level,
+    load_level,
+    source_hash,
+)
+from game.levels.tmx_loader import load_tmx_level
+
+
+def test_compiled_level_round_trips_spec(tmp_path, level_cache_dir):
+    tmx_file = tmp_path / "example_level.tmx"
+    shutil.copy("levels/tmx/example_level.tmx", tmx_file)
+
+    expected = load_tmx_level(str(tmx_file))
+    assert load_compiled_level(str(tmx_file)) is None
+
+    compile_level(str(tmx_file))
+    assert cache_path_for(str(tmx_file)).parent == level_cache_dir
+    assert cache_path_for(str(tmx_file)).exists()
+    cached = load_compiled_level(str(tmx_file))
+
+    assert cached.level_id == expected.level_id
+    assert cached.spawn_point == expected.spawn_point
+    assert cached.platforms == expected.platforms
+    assert cached.moving_platforms == expected.moving_platforms
+    assert cached.coins == expected.coins
+    assert cached.hazards == expected.hazards
+    assert cached.enemies == expected.enemies
+    assert cached.time_limit == expected.time_limit
+    assert cached.requires_all_coins == expected.requires_all_coins
+
+
+def test_compiling_removes_older_caches_of_the_same_map(tmp_path, level_cache_dir):
+    for folder in ("old", "new"):
+        (tmp_path / folder).mkdir()
+        shutil.copy("levels/tmx/example_level.tmx", tmp_path / folder / "example_level.tmx")
+        compile_level(str(tmp_path / folder / "example_level.tmx"))
+    other = level_cache_dir / "example_level-extra-0123456789ab.lvlc"
+    other.write_bytes(b"")
+    compile_level(str(tmp_path / "new" / "example_level.tmx"))
+
+    newest = cache_path_for(str(tmp_path / "new" / "example_level.tmx"))
+    assert sorted(level_cache_dir.iterdir()) == sorted([newest, other])
+
+
+def test_stale_cache_is_recompiled(tmp_path):
+    tmx_file = tmp_path / "example_level.tmx"
+    shutil.copy("levels/tmx/example_level.tmx", tmx_file)
+    assert load_level(str(tmx_file)).level_id == 4
+
+    source = tmx_file.read_text(encoding="utf-8")
+    tmx_file.write_text(source.replace('value="4"', 'value="9"', 1), encoding="utf-8")
+
+    assert load_compiled_level(str(tmx_file)) is None
+    assert load_level(str(tmx_file)).level_id == 9
+
+
+def test_source_hash_covers_tilesets_and_images(tmp_path):
+    image = tmp_path / "tiles.png"
+    image.write_bytes(b"png")
+    tsx_file = tmp_path / "tiles.tsx"
+    tsx_file.write_text(
+        '<tileset name="tiles"><image source="tiles.png" width="16" height="16"/></tileset>',
+        encoding="utf-8",
+    )
+    tmx_file = tmp_path / "level.tmx"
+    tmx_file.write_text(
+        '<map><tileset firstgid="1" source="tiles.tsx"/><layer name="Ground"/></map>',
+        encoding="utf-8",
+    )
+    original = source_hash(str(tmx_file))
+
+    tsx_file.write_text(tsx_file.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    edited_tileset = source_hash(str(tmx_file))
+    assert edited_tileset != original
+
+    image.write_bytes(b"a bigger png")
+    assert source_hash(str(tmx_file)) != edited_tileset
+
+
+def test_decode_rejects_other_versions():
+    spec = load_tmx_level("levels/tmx/example_level.tmx")
+    data = bytearray(encode_level(spec, b"\0" * 32))
+    data[4] += 1
+    assert decode_level(bytes(data)) is None
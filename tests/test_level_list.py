@@ -0,0 +1,65 @@
+from game.levels import LevelInfo, level_registry
+from game.systems.thumbnails import ThumbnailCache, render_thumbnail
+from game.ui.level_list import LevelEntry, LevelList, level_entries
+
+
+class FakeRegistry:
+    def __init__(self, count):
+        self.count = count
+
+    def level_ids(self):
+        return list(range(1, self.count + 1))
+
+    def info(self, level_id):
+        if level_id <= 3:
+            return LevelInfo(level_id=level_id, source="python")
+        return LevelInfo(level_id=level_id, source=f"levels/tmx/cave_run_{level_id}.tmx")
+
+
+def test_level_entries_cover_every_level_with_progress():
+    data = {
+        "high_scores": {"level_2": 40, "level_7": 90},
+        "best_times": {"level_7": 75},
+        "levels_completed": [7],
+    }
+    entries = level_entries(FakeRegistry(1000), data)
+
+    assert len(entries) == 1000
+    assert entries[1].title == "MEDIUM"
+    assert entries[1].best_score == 40
+    assert entries[6].title == "CAVE RUN 7"
+    assert entries[6].describe() == "Best: 90   Time: 1:15   Completed"
+    assert entries[999].describe() == "Best: 0"
+
+
+def test_render_thumbnail_draws_level_layout():
+    image = render_thumbnail(level_registry.get(1), (96, 54))
+    assert image.size == (96, 54)
+    assert len(image.getcolors(96 * 54)) > 2
+
+
+def test_thumbnails_are_cached_on_disk(tmp_path):
+    cache = ThumbnailCache(folder=str(tmp_path))
+    path = cache.path(1)
+    first = cache._produce(1, path)
+    assert path.exists()
+    second = cache._produce(1, path)
+    assert second.tobytes() == first.tobytes()
+    cache.shutdown()
+
+
+def test_level_list_keeps_only_visible_rows(window):
+    entries = [LevelEntry(level_id=i, title="") for i in range(1, 1001)]
+    level_list = LevelList(entries, center_x=50, top=400, width=80, height=400, row_height=80)
+
+    assert len(level_list.rows) == 6
+    level_list.scroll_by(80 * 500)
+    for _ in range(200):
+        level_list.update(1 / 60)
+    assert level_list.scroll == level_list.scroll_target == 80 * 500
+    assert list(level_list.visible_indices()) == list(range(500, 505))
+    bound = sorted(row.index for row in level_list.rows)
+    assert bound == list(range(500, 506))
+
+    level_list.scroll_by(10**9)
+    assert level_list.scroll_target == level_list.max_scroll == 80 * 1000 - 400
@@ -0,0 +1,55 @@
+import os
+
+from game.levels.base import LevelSpec
+from game.levels.registry import LevelRegistry
+
+
+def test_registry_builds_python_levels_once(tmp_path):
+    calls = []
+
+    def build():
+        calls.append(1)
+        return LevelSpec(level_id=1, spawn_point=(0, 0), time_limit=30.0)
+
+    registry = LevelRegistry(tmx_folder=str(tmp_path), python_levels={1: build})
+
+    assert registry.level_ids() == [1]
+    assert calls == []
+    assert registry.get(1) is registry.get(1)
+    assert len(calls) == 1
+    assert registry.info(1).time_limit == 30.0
+    assert registry.get(2) is None
+
+
+def test_registry_load_does_not_cache(tmp_path):
+    tmx_file = tmp_path / "example_level.tmx"
+    tmx_file.write_text(
+        open("levels/tmx/example_level.tmx", encoding="utf-8").read(), encoding="utf-8"
+    )
+    registry = LevelRegistry(tmx_folder=str(tmp_path), python_levels={})
+
+    first = registry.load(4)
+    assert first is not None and first.level_id == 4
+    assert registry.load(4) is not first
+    assert registry.get(4) is not first
+    assert registry.load(4) is registry.get(4)
+
+
+def test_registry_reloads_tmx_only_when_changed(tmp_path):
+    source = open("levels/tmx/example_level.tmx", encoding="utf-8").read()
+    tmx_file = tmp_path / "example_level.tmx"
+    tmx_file.write_text(source, encoding="utf-8")
+
+    registry = LevelRegistry(tmx_folder=str(tmp_path), python_levels={})
+    assert registry.level_ids() == [4]
+    first = registry.get(4)
+    assert first is not None
+    assert registry.get(4) is first
+
+    tmx_file.write_text(source.replace('value="4"', 'value="7"', 1), encoding="utf-8")
+    stat = tmx_file.stat()
+    os.utime(tmx_file, (stat.st_atime, stat.st_mtime + 5))
+
+    assert registry.level_ids() == [7]
+    assert registry.max_level_id() == 7
+    assert registry.get(4) is None
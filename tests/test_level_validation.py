@@ -0,0 +1,74 @@
+import arcade
+import pytest
+
+from game.config import PLAYER_JUMP_SPEED
+from game.levels.base import CoinSpec, PlatformSpec
+from game.systems.level_validation import (
+    ReachabilitySearch,
+    _box,
+    horizontal_reach,
+    jump_arc,
+    validate_level,
+    validate_levels,
+)
+from game.systems.simulation import LevelSimulation
+
+
+def test_jump_arc_peaks_above_plain_jump_speed():
+    arc = jump_arc(gravity=1.0, depth=100)
+    apex = max(arc)
+
+    assert apex > PLAYER_JUMP_SPEED * PLAYER_JUMP_SPEED / 2
+    assert arc[-1] <= -100
+    assert horizontal_reach(arc, apex + 1) is None
+    assert horizontal_reach(arc, 0) > horizontal_reach(arc, apex / 2)
+
+
+def test_search_finds_reachable_ledge_and_rejects_too_high_one(floor_spec):
+    sim = LevelSimulation(spec=floor_spec(
+        PlatformSpec(400, 120, 100, 20, arcade.color.GRAY),
+        PlatformSpec(800, 1000, 100, 20, arcade.color.GRAY),
+        coins=[CoinSpec(400, 170), CoinSpec(800, 1050)],
+    ))
+    search = ReachabilitySearch(sim)
+
+    assert sorted(search.reachable) == [0, 1]
+    reachable, unreachable = (_box(coin) for coin in sim.coin_list)
+    assert search.can_touch(reachable)
+    assert not search.can_touch(unreachable)
+
+
+def test_jump_arc_rejects_gravity_that_never_lands():
+    for gravity in (0.0, -1.0, float("nan")):
+        with pytest.raises(ValueError):
+            jump_arc(gravity=gravity, depth=100)
+
+
+def test_validate_level_reports_zero_gravity(tmp_path):
+    tmx_file = tmp_path / "floating.tmx"
+    source = open("levels/tmx/example_level.tmx", encoding="utf-8").read()
+    gravity = 'name="gravity" type="float" value='
+    tmx_file.write_text(source.replace(gravity + '"1"', gravity + '"0"'), encoding="utf-8")
+    report = validate_level(str(tmx_file))
+
+    assert report.loaded
+    assert "gravity" in report.error
+    assert not report.ok
+
+
+def test_validate_level_reports_missing_file(tmp_path):
+    report = validate_level(str(tmp_path / "missing.tmx"))
+
+    assert not report.loaded
+    assert "not found" in report.error
+    assert not report.ok
+
+
+def test_validate_levels_keeps_input_order(tmp_path):
+    paths = ["levels/tmx/example_level.tmx", str(tmp_path / "missing.tmx")]
+    reports = validate_levels(paths, jobs=2)
+
+    assert [report.path for report in reports] == paths
+    assert reports[0].loaded and reports[0].level_id == 4
+    assert reports[0].coins == 3
+    assert not reports[1].loaded
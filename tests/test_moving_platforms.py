@@ -0,0 +1,68 @@
+import arcade
+import pytest
+
+from game.levels.base import LevelSpec, MovingPlatformSpec, PlatformSpec, platform_path
+from game.systems.motion import WaypointPath
+from game.systems.simulation import LevelSimulation, PlayerInput
+
+
+def test_waypoint_path_goes_out_and_back_at_constant_speed():
+    path = WaypointPath([(0, 0), (30, 0), (30, 40)], speed=10)
+
+    assert path.position(0) == (0, 0)
+    assert path.position(3) == pytest.approx((30, 0))
+    assert path.position(5) == pytest.approx((30, 20))
+    assert path.position(7) == pytest.approx((30, 40))
+    assert path.position(9) == pytest.approx((30, 20))
+    assert path.position(14) == pytest.approx((0, 0))
+    assert path.bounds() == (0, 30, 0, 40)
+
+
+def test_waypoint_loop_returns_to_the_start():
+    path = WaypointPath([(0, 0), (30, 0), (30, 40)], speed=10, loop=True)
+    assert path.position(9.5) == pytest.approx((15, 20))
+    assert path.position(12) == pytest.approx((0, 0))
+
+
+def test_platform_path_bounces_the_platform_edges_off_its_boundaries():
+    spec = MovingPlatformSpec(
+        220, 100, 60, 16, arcade.color.GRAY,
+        change_x=4, boundary_left=180, boundary_right=260,
+    )
+    path = platform_path(spec)
+    # The centre stays within boundary +- half the width
+    assert path.bounds() == (210, 230, 100, 100)
+    assert path.position(0) == (220, 100)
+    assert path.position(6) == (216, 100)
+
+
+@pytest.mark.parametrize(
+    "motion",
+    [
+        {"change_x": 3, "boundary_left": 300, "boundary_right": 700},
+        {"change_y": 2, "boundary_bottom": 100, "boundary_top": 400},
+    ],
+)
+def test_rider_moves_exactly_with_its_platform(motion):
+    spec = LevelSpec(
+        level_id=99,
+        spawn_point=(500, 260),
+        platforms=[PlatformSpec(5000, -1000, 100, 40, arcade.color.GRAY)],
+        moving_platforms=[MovingPlatformSpec(500, 200, 160, 24, arcade.color.GRAY, **motion)],
+        end_x=9000,
+    )
+    sim = LevelSimulation(spec=spec)
+    platform = sim.moving_platform_list[0]
+    for _ in range(40):
+        sim.step(PlayerInput())
+    assert sim.rider_platform is platform
+    offset = sim.player.center_x - platform.center_x
+
+    # Long enough to turn around at both ends several times
+    for _ in range(600):
+        sim.step(PlayerInput())
+        assert sim.player.center_x - platform.center_x == pytest.approx(offset)
+        assert sim.player.bottom == pytest.approx(platform.top)
+
+    sim.step(PlayerInput(jump_pressed=True, jump_held=True))
+    assert sim.rider_platform is None
@@ -1,32 +1,61 @@
-from game.systems.particles import ParticleManager
+import arcade
+import numpy as np
 
+from game.systems.particles import ParticleSystem
 
-class DummyEmitter:
-    def __init__(self):
-        self.update_calls = 0
-        self.draw_calls = 0
 
-    def update(self):
-        self.update_calls += 1
+def test_emit_burst_fills_pool_rows():
+    particles = ParticleSystem(capacity=32, seed=1)
+    emitted = particles.emit_burst(
+        (100, 50), arcade.color.GOLD, count=6, speed_range=(40, 120), size_range=(3, 6)
+    )
 
-    def draw(self):
-        self.draw_calls += 1
+    assert emitted == 6
+    assert len(particles) == 6
+    assert np.all(particles.position[:6] == (100, 50))
+    speed = np.hypot(*particles.velocity[:6].T)
+    assert np.all((speed >= 40 - 1e-3) & (speed <= 120 + 1e-3))
+    assert np.all((particles.size[:6] >= 3) & (particles.size[:6] <= 6))
+    assert np.allclose(particles.color[0], (255 / 255, 215 / 255, 0, 1))
 
 
-def test_particle_manager_update_and_draw():
-    manager = ParticleManager()
-    emitter = DummyEmitter()
-    manager.emitters.append(emitter)
+def test_burst_is_truncated_when_pool_is_full():
+    particles = ParticleSystem(capacity=10, seed=1)
+    assert particles.emit_burst((0, 0), arcade.color.RED, count=8) == 8
+    assert particles.emit_burst((0, 0), arcade.color.RED, count=8) == 2
+    assert particles.emit_burst((0, 0), arcade.color.RED, count=8) == 0
+    assert len(particles) == 10
 
-    manager.update(1 / 60)
-    manager.draw()
 
-    assert emitter.update_calls == 1
-    assert emitter.draw_calls == 1
+def test_update_moves_and_compacts_expired_particles():
+    particles = ParticleSystem(capacity=16, seed=1)
+    particles.emit_burst((0, 0), arcade.color.RED, count=4, lifetime_range=(0.1, 0.1))
+    particles.emit_burst((50, 50), arcade.color.BLUE, count=3, lifetime_range=(1.0, 1.0))
+    velocity = particles.velocity[4:7].copy()
 
+    particles.update(0.2)
 
-def test_particle_manager_clear():
-    manager = ParticleManager()
-    manager.emitters.append(DummyEmitter())
-    manager.clear()
-    assert manager.emitters == []
+    assert len(particles) == 3
+    assert np.allclose(particles.position[:3], (50, 50) + velocity * 0.2, atol=1e-3)
+    assert np.allclose(particles.color[:3, 2], 1.0)
+
+
+def test_clear_empties_the_pool():
+    particles = ParticleSystem(capacity=16, seed=1)
+    particles.emit_burst((0, 0), arcade.color.RED, count=5)
+    particles.clear()
+    particles.update(1 / 60)
+    assert len(particles) == 0
+
+
+def test_systems_share_one_program_and_release_buffers(window):
+    first, second = ParticleSystem(capacity=8), ParticleSystem(capacity=8)
+    for particles in (first, second):
+        particles.emit_burst((10, 10), arcade.color.GOLD, count=2)
+        particles.draw()
+    assert first._program is second._program
+
+    first.release()
+    assert first._buffer is None and first._geometry is None
+    first.draw()
+    assert first._buffer is not None
@@ -19,3 +19,21 @@ def test_player_update_moves_and_sets_direction():
     assert player.center_x > 100
     assert player.face_direction == FaceDirection.RIGHT
     assert player.is_walking is True
+
+
+def test_players_share_preloaded_mirrored_frames():
+    first = Player()
+    second = Player()
+    assert first.animations is second.animations
+    assert first.walking_textures is second.walking_textures
+
+    left = first.animations.clip("walking", FaceDirection.LEFT)
+    assert len(left) == len(first.walking_textures)
+
+    first.face_direction = FaceDirection.LEFT
+    first.is_walking = True
+    seen = set()
+    for _ in range(len(left)):
+        first.update_animation(first.frame_duration)
+        seen.add(id(first.texture))
+    assert seen == {id(texture) for texture in left}
@@ -0,0 +1,27 @@
+import threading
+
+from game.levels.base import LevelSpec
+from game.levels.registry import LevelRegistry
+from game.systems.prefetch import LevelPrefetcher
+
+
+def test_prefetch_loads_on_worker_thread(tmp_path):
+    threads = []
+
+    def build():
+        threads.append(threading.current_thread())
+        return LevelSpec(level_id=2, spawn_point=(0, 0))
+
+    registry = LevelRegistry(tmx_folder=str(tmp_path), python_levels={2: build})
+    prefetcher = LevelPrefetcher(registry)
+    try:
+        assert prefetcher.prefetch(2) is True
+        assert prefetcher.prefetch(5) is False
+        spec = prefetcher.get(2)
+        assert spec.level_id == 2
+        assert threads and threads[0] is not threading.main_thread()
+        # Already cached: no second build
+        assert prefetcher.get(2) is spec
+        assert len(threads) == 1
+    finally:
+        prefetcher.shutdown()
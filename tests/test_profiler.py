@@ -0,0 +1,63 @@
+import json
+
+from game.systems.profiler import FRAME, FrameProfiler, percentile
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = FrameProfiler()
+    for _ in range(3):
+        profiler.next_frame()
+        with profiler.section("update"):
+            pass
+
+    assert profiler.frame_times() == []
+    assert profiler.section_names() == []
+    assert profiler.section("a") is profiler.section("b")
+
+
+def test_sections_add_up_within_a_frame():
+    profiler = FrameProfiler(enabled=True)
+    profiler.next_frame()
+    for _ in range(2):
+        with profiler.section("sim"):
+            pass
+    with profiler.section("draw"):
+        pass
+    profiler.next_frame()
+
+    assert profiler.section_names() == ["sim", "draw"]
+    assert len(profiler.frame_times()) == 1
+    frame = profiler._recent[0]
+    assert frame[FRAME] >= frame["sim"] + frame["draw"] > 0
+
+
+def test_percentiles_use_the_rolling_window():
+    assert percentile([], 0.5) == 0.0
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 0.50) == 50.0
+    assert percentile(values, 0.95) == 95.0
+    assert percentile(values, 0.99) == 99.0
+
+    profiler = FrameProfiler(enabled=True, window=4)
+    for _ in range(10):
+        profiler.next_frame()
+    assert len(profiler.frame_times()) == 4
+    assert set(profiler.percentiles()) == {"p50", "p95", "p99"}
+
+
+def test_toggle_does_not_count_disabled_time_and_dump_writes_session(tmp_path):
+    profiler = FrameProfiler(enabled=True, window=2)
+    for _ in range(4):
+        profiler.next_frame()
+        with profiler.section("sim"):
+            pass
+    profiler.toggle()
+    profiler.next_frame()
+    profiler.toggle()
+    profiler.next_frame()
+
+    path = profiler.dump(str(tmp_path / "out" / "session.json"))
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["sections"] == [FRAME, "sim"]
+    assert len(data["frames"]) == 3
+    assert all(len(frame) == 2 for frame in data["frames"])
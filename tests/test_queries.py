@@ -0,0 +1,49 @@
+import arcade
+
+from game.entities.platform import Platform
+from game.systems.queries import ground_probe, offset_rect, overlap_aabb, sweep
+from game.systems.spatial import SpatialHash
+
+
+def _block(x, y, width=100, height=20):
+    block = Platform(width, height)
+    block.position = (x, y)
+    return block
+
+
+def _layers():
+    floor = _block(100, 10)
+    ceiling = _block(100, 110)
+    ledge = _block(300, 40)
+    return floor, ceiling, ledge, (SpatialHash.from_sprites([floor, ceiling]), SpatialHash.from_sprites([ledge]))
+
+
+def test_overlap_aabb_ignores_touching_edges():
+    floor, ceiling, _, layers = _layers()
+    # Sits exactly on the floor and under the ceiling
+    rect = (90, 110, 20, 100)
+    assert overlap_aabb(rect, layers) == []
+    assert overlap_aabb(offset_rect(rect, dy=-1), layers) == [floor]
+    assert overlap_aabb((250, 260, 0, 200), layers)[0].center_x == 300
+
+
+def test_sweep_stops_at_the_first_obstacle():
+    _, _, _, layers = _layers()
+    rect = (90, 110, 40, 80)
+    assert sweep(rect, 50, layers) == 20
+    assert sweep(rect, 10, layers) == 10
+    assert sweep(rect, -50, layers) == -20
+    assert sweep((400, 410, 40, 80), -100, layers) == -100
+
+
+def test_ground_probe_finds_the_highest_surface_without_moving_the_sprite():
+    floor, _, ledge, layers = _layers()
+    sprite = arcade.SpriteSolidColor(20, 40, color=arcade.color.WHITE)
+    sprite.position = (245, 72)
+
+    assert ground_probe(sprite, layers) is ledge
+    assert sprite.position == (245, 72)
+    sprite.center_x = 100
+    assert ground_probe(sprite, layers) is None
+    sprite.center_y = 42
+    assert ground_probe(sprite, layers) is floor
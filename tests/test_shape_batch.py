@@ -0,0 +1,76 @@
+import pytest
+
+from game.ui.button import Button
+from game.ui.shape_batch import ShapeBatch, UIBatch
+from game.ui.slider import Slider
+
+
+def test_rects_and_outlines_share_one_vertex_array():
+    shapes = ShapeBatch(capacity=1)
+    fill = shapes.add_rect(0, 10, 0, 20, (255, 0, 0))
+    outline = shapes.add_outline(0, 10, 0, 20, (0, 0, 255, 128), border_width=2)
+
+    assert len(shapes) == 2
+    assert shapes.quad_count == 5
+    assert shapes.vertices(fill)[:, 0:2].tolist() == [[0, 0], [10, 0], [10, 20], [0, 20]]
+    left_edge = shapes.vertices(outline)[0:4, 0:2]
+    assert left_edge.tolist() == [[-1, -1], [1, -1], [1, 21], [-1, 21]]
+    assert shapes.vertices(outline)[:, 5] == pytest.approx(128 / 255)
+
+
+def test_color_rect_and_visibility_edit_in_place():
+    shapes = ShapeBatch()
+    first = shapes.add_rect(0, 10, 0, 10, (255, 0, 0))
+    second = shapes.add_rect(20, 30, 0, 10, (0, 255, 0))
+
+    shapes.set_color(second, (0, 0, 255))
+    shapes.set_rect(first, 5, 15, 5, 15)
+    assert shapes.vertices(second)[0, 2:6].tolist() == [0, 0, 1, 1]
+    assert shapes.vertices(first)[0, 0:2].tolist() == [5, 5]
+
+    shapes.set_visible(second, False)
+    assert shapes.vertices(second)[0, 5] == 0
+    shapes.set_visible(second, True)
+    assert shapes.vertices(second)[0, 2:6].tolist() == [0, 0, 1, 1]
+
+
+def test_button_recolours_only_on_state_change(window):
+    ui = UIBatch()
+    button = Button(50, 50, 40, 20, "OK", color=(40, 80, 120), hover_color=(60, 120, 180), batch=ui)
+    fill = ui.shapes.vertices(button._fill_shape)
+    assert fill[0, 2] == pytest.approx(40 / 255)
+
+    button.check_mouse_hover(50, 50)
+    assert fill[0, 2] == pytest.approx(60 / 255)
+    button.enabled = False
+    assert fill[0, 2] == pytest.approx(20 / 255)
+
+    button.move_to(10, 10)
+    assert fill[0, 0:2].tolist() == [-10, 0]
+    ui.draw()
+
+
+def test_batches_share_one_program_and_release_buffers(window):
+    first, second = ShapeBatch(), ShapeBatch()
+    first.add_rect(0, 10, 0, 10, (255, 0, 0))
+    second.add_rect(0, 10, 0, 10, (0, 255, 0))
+    first.draw()
+    second.draw()
+    assert first._program is second._program
+
+    first.release()
+    assert first._buffer is None and first._geometry is None
+    first.draw()
+    assert first._buffer is not None
+
+
+def test_slider_value_moves_handle(window):
+    ui = UIBatch()
+    slider = Slider(50, 50, 100, 10, initial_value=0.0, batch=ui)
+    assert ui.shapes.vertices(slider._fill_shape)[0, 5] == 0
+
+    slider.value = 0.5
+    handle = ui.shapes.vertices(slider._handle_shape)
+    assert handle[0, 0] == pytest.approx(50 - slider.handle_width / 2)
+    assert slider._value_text.text.text == "50%"
+    ui.draw()
@@ -0,0 +1,124 @@
+import arcade
+import pytest
+
+from game.config import PHYSICS_SUBSTEPS
+from game.levels.base import CoinSpec, HazardSpec, PlatformSpec
+from game.systems import simulation
+from game.systems.simulation import (
+    EVENT_COIN,
+    EVENT_DEATH,
+    EVENT_FINISH_BLOCKED,
+    EVENT_JUMP,
+    EVENT_LOST,
+    EVENT_WON,
+    LevelSimulation,
+    PlayerInput,
+)
+
+
+def _run(sim, inputs, max_ticks=600):
+    events = []
+    for _ in range(max_ticks):
+        if sim.finished:
+            break
+        events.extend(sim.step(inputs))
+    return events
+
+
+def test_simulation_reaches_finish_and_collects_coins(floor_spec):
+    sim = LevelSimulation(spec=floor_spec(coins=[CoinSpec(400, 90)]))
+    events = _run(sim, PlayerInput(right=True))
+
+    kinds = [event.kind for event in events]
+    assert EVENT_COIN in kinds
+    assert kinds[-1] == EVENT_WON
+    assert sim.finished and sim.won
+    assert sim.score > 0
+    assert len(sim.coin_list) == 0
+
+
+def test_simulation_blocks_finish_until_all_coins_collected(floor_spec):
+    spec = floor_spec(coins=[CoinSpec(50, 300)], requires_all_coins=True)
+    sim = LevelSimulation(spec=spec)
+    events = _run(sim, PlayerInput(right=True), max_ticks=300)
+
+    assert not sim.finished
+    assert any(event.kind == EVENT_FINISH_BLOCKED for event in events)
+
+
+def test_simulation_hazard_costs_a_life_and_respawns(floor_spec):
+    sim = LevelSimulation(spec=floor_spec(hazards=[HazardSpec(300, 70)]), lives=3)
+    events = _run(sim, PlayerInput(right=True), max_ticks=120)
+
+    deaths = [event for event in events if event.kind == EVENT_DEATH]
+    assert deaths and deaths[0].cause == "hazard"
+    assert sim.lives < 3
+
+
+def test_simulation_loses_when_out_of_lives(floor_spec):
+    sim = LevelSimulation(spec=floor_spec(hazards=[HazardSpec(300, 70)]), lives=1)
+    events = _run(sim, PlayerInput(right=True))
+
+    assert events[-1].kind == EVENT_LOST
+    assert events[-1].cause == "lives"
+    assert sim.finished and not sim.won
+    assert sim.step(PlayerInput(right=True)) == []
+
+
+def test_simulation_time_limit(floor_spec):
+    sim = LevelSimulation(spec=floor_spec(time_limit=0.5))
+    events = _run(sim, PlayerInput())
+
+    assert events[-1].kind == EVENT_LOST
+    assert events[-1].cause == "time"
+    assert 30 <= sim.ticks <= 31
+
+
+def test_simulation_jump_event_only_on_press(floor_spec):
+    sim = LevelSimulation(spec=floor_spec())
+    _run(sim, PlayerInput(), max_ticks=30)
+
+    events = sim.step(PlayerInput(jump_pressed=True, jump_held=True))
+    assert [event.kind for event in events] == [EVENT_JUMP]
+    assert sim.player.change_y > 0
+    assert sim.step(PlayerInput(jump_held=True)) == []
+
+
+def _fast_fall(spec, substeps, monkeypatch):
+    """Drop the player onto a thin ledge from just above it, too fast for one step."""
+    monkeypatch.setattr(simulation, "PHYSICS_SUBSTEPS", substeps)
+    sim = LevelSimulation(spec=spec)
+    sim.step(PlayerInput())
+    sim.player.center_y = 234
+    sim.player.change_y = -69
+    sim.step(PlayerInput())
+    return sim.player
+
+
+def test_substeps_stop_fast_falls_tunnelling(floor_spec, monkeypatch):
+    spec = floor_spec(PlatformSpec(100, 200, 200, 8, arcade.color.GRAY), spawn_point=(100, 300))
+
+    assert PHYSICS_SUBSTEPS > 1
+    assert _fast_fall(spec, 1, monkeypatch).bottom < 196
+    player = _fast_fall(spec, PHYSICS_SUBSTEPS, monkeypatch)
+    assert player.bottom == pytest.approx(204)
+    assert player.change_y == 0
+
+
+@pytest.mark.parametrize("substeps", [2, 3, 4])
+def test_substeps_keep_the_open_air_path(floor_spec, monkeypatch, substeps):
+    paths = []
+    for n in (1, substeps):
+        monkeypatch.setattr(simulation, "PHYSICS_SUBSTEPS", n)
+        sim = LevelSimulation(spec=floor_spec())
+        _run(sim, PlayerInput(), max_ticks=30)
+        path = []
+        inputs = PlayerInput(right=True, jump_pressed=True, jump_held=True)
+        for _ in range(40):
+            sim.step(inputs)
+            inputs = PlayerInput(right=True, jump_held=True)
+            path.append((sim.player.center_x, sim.player.center_y))
+        paths.append(path)
+    # The engine rounds y to 0.01 after every part, so thirds drift a little
+    drift = max(abs(a - b) for p, q in zip(*paths) for a, b in zip(p, q))
+    assert drift < 0.25
@@ -0,0 +1,26 @@
+import arcade
+
+from game.systems.snapshot import FrameSnapshot
+
+
+def test_capture_runs_draw_once_and_blits_it(window):
+    calls = []
+
+    def draw():
+        calls.append(1)
+        arcade.draw_lrbt_rectangle_filled(0, 100, 0, 100, arcade.color.RED)
+
+    snapshot = FrameSnapshot(window)
+    snapshot.capture(draw)
+    assert snapshot.captured
+
+    window.ctx.screen.use()
+    window.clear()
+    for _ in range(3):
+        snapshot.draw()
+    assert calls == [1]
+
+    pixel = window.ctx.screen.read(viewport=(50, 50, 1, 1), components=3)
+    assert tuple(pixel) == (255, 0, 0)
+    snapshot.release()
+    assert not snapshot.captured
@@ -0,0 +1,51 @@
+from game.systems.spatial import SpatialHash
+
+
+class Box:
+    def __init__(self, x, y, size=10):
+        self.center_x = x
+        self.center_y = y
+        self.size = size
+
+    @property
+    def left(self):
+        return self.center_x - self.size / 2
+
+    @property
+    def right(self):
+        return self.center_x + self.size / 2
+
+    @property
+    def bottom(self):
+        return self.center_y - self.size / 2
+
+    @property
+    def top(self):
+        return self.center_y + self.size / 2
+
+
+def test_query_returns_only_overlapping_boxes():
+    near = Box(50, 50)
+    far = Box(5000, 50)
+    wide = Box(300, 300, size=600)
+    index = SpatialHash.from_sprites([near, far, wide], cell_size=64)
+
+    found = index.query(40, 60, 40, 60)
+    assert near in found
+    assert wide in found
+    assert far not in found
+    assert len(index) == 3
+
+
+def test_move_and_remove_rebucket_objects():
+    box = Box(10, 10)
+    index = SpatialHash.from_sprites([box], cell_size=64)
+
+    box.center_x = 1000
+    index.move(box)
+    assert index.query(0, 20, 0, 20) == []
+    assert index.query(990, 1010, 0, 20) == [box]
+
+    index.remove(box)
+    assert index.query(990, 1010, 0, 20) == []
+    assert box not in index
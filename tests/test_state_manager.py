@@ -38,3 +38,13 @@ def test_state_manager_tracks_score_and_level():
 
     assert manager.last_score == 250
     assert manager.current_level == 1
+
+
+def test_state_manager_shutdown_cancels_background_work():
+    manager = StateManager(DummyWindow())
+    manager.prefetcher.prefetch(1)
+    manager.shutdown()
+
+    assert manager.assets._executor is None and not manager.assets._pending
+    assert manager.prefetcher._executor is None
+    assert manager.thumbnails._executor is None
@@ -0,0 +1,46 @@
+import arcade
+
+from game.systems.static_cache import StaticGeometryCache
+
+
+def _wall(x, y, width=200, height=40):
+    wall = arcade.SpriteSolidColor(width, height, color=arcade.color.GRAY)
+    wall.center_x = x
+    wall.center_y = y
+    return wall
+
+
+def test_only_tiles_with_geometry_are_drawn(window):
+    walls = arcade.SpriteList()
+    walls.append(_wall(100, 100))
+    walls.append(_wall(3000, 100))
+    cache = StaticGeometryCache([walls], tile_size=1024, window=window)
+
+    assert cache.occupied == {(0, 0), (2, 0)}
+    assert cache.draw((0, 1280, 0, 720)) == 1
+    assert list(cache.tiles) == [(0, 0)]
+    assert not cache.tiles[(0, 0)].dirty
+    cache.release()
+
+
+def test_invalidate_marks_tiles_dirty_and_adds_new_cells(window):
+    walls = arcade.SpriteList()
+    walls.append(_wall(100, 100))
+    cache = StaticGeometryCache([walls], tile_size=1024, window=window)
+    cache.draw((0, 1280, 0, 720))
+
+    cache.invalidate((1500, 1600, 100, 140))
+    assert (1, 0) in cache.occupied
+    assert not cache.tiles[(0, 0)].dirty
+
+    cache.invalidate()
+    assert cache.tiles[(0, 0)].dirty
+    cache.release()
+
+
+def test_caches_share_one_program(window):
+    walls = arcade.SpriteList()
+    walls.append(_wall(100, 100))
+    first = StaticGeometryCache([walls], window=window)
+    second = StaticGeometryCache([walls], window=window)
+    assert first._program is second._program
@@ -0,0 +1,36 @@
+import arcade
+import pytest
+
+from game.entities.coin import Coin
+from game.entities.enemy import JumpingEnemy, PatrolEnemy
+from game.systems.textures import SHAPE_SOFT_SQUARE, TextureRegistry, texture_registry
+
+
+def test_registry_returns_one_texture_per_key():
+    registry = TextureRegistry()
+    gold = registry.soft_circle(18, arcade.color.GOLD)
+
+    assert registry.soft_circle(18, arcade.color.GOLD) is gold
+    assert registry.soft_circle(18, (*arcade.color.GOLD[:3], 128)) is gold
+    assert registry.soft_circle(20, arcade.color.GOLD) is not gold
+    assert registry.soft_square(18, arcade.color.GOLD) is not gold
+    assert len(registry) == 3
+
+    with pytest.raises(ValueError):
+        registry.get("hexagon", 18, arcade.color.GOLD)
+
+
+def test_entities_share_textures():
+    coins = [Coin() for _ in range(5)]
+    assert len({id(coin.texture) for coin in coins}) == 1
+
+    patrol = PatrolEnemy(0, 100)
+    assert PatrolEnemy(0, 100).texture is patrol.texture
+    assert JumpingEnemy().texture is not patrol.texture
+    assert patrol.texture is texture_registry.get(SHAPE_SOFT_SQUARE, 28, arcade.color.ORANGE_RED)
+
+
+def test_preload_makes_entity_textures():
+    registry = TextureRegistry()
+    registry.preload()
+    assert len(registry) == 7
@@ -0,0 +1,69 @@
+import arcade
+
+from game.levels.level_cache import build_tile_layers
+from game.systems.profiler import FrameProfiler
+from game.systems.tile_chunks import ChunkedLayer
+
+
+def _tiles(columns, rows, size=32):
+    sprites = []
+    for column in range(columns):
+        for row in range(rows):
+            sprite = arcade.SpriteSolidColor(size, size, color=arcade.color.GRAY)
+            sprite.center_x = column * size + size / 2
+            sprite.center_y = row * size + size / 2
+            sprites.append(sprite)
+    return sprites
+
+
+def test_tiles_are_filed_into_chunks():
+    layer = ChunkedLayer(_tiles(64, 4), chunk_size=512)
+
+    assert len(layer) == 256
+    assert sorted(layer.chunks) == [(0, 0), (1, 0), (2, 0), (3, 0)]
+    assert sum(len(chunk) for chunk in layer.chunks.values()) == 256
+    assert layer.margin == 16
+
+
+def test_only_chunks_in_view_are_visible():
+    layer = ChunkedLayer(_tiles(256, 4), chunk_size=512)
+
+    visible = layer.visible_chunks(600, 1200, 0, 720)
+    assert visible == [layer.chunks[(1, 0)], layer.chunks[(2, 0)]]
+    # The margin keeps the chunk whose edge tiles poke into view
+    assert layer.chunks[(0, 0)] in layer.visible_chunks(520, 1000, 0, 720)
+    assert layer.visible_chunks(-5000, -4000, 0, 720) == []
+    assert len(layer.visible_chunks(-1e6, 1e6, -1e6, 1e6)) == len(layer.chunks)
+
+
+def test_invisible_layer_draws_nothing():
+    layer = ChunkedLayer(_tiles(4, 4), visible=False)
+    profiler = FrameProfiler(enabled=True)
+    assert layer.draw((0, 1000, 0, 1000), profiler) == 0
+    assert profiler.counter_names() == []
+
+
+def test_cached_tile_layers_are_chunked():
+    tileset = {
+        "firstgid": 1,
+        "image": "assets/player/anim/idle/0.png",
+        "tile_width": 32,
+        "tile_height": 32,
+        "columns": 1,
+        "spacing": 0,
+        "margin": 0,
+    }
+    ground = {
+        "name": "Ground",
+        "width": 40,
+        "height": 2,
+        "opacity": 1.0,
+        "visible": True,
+        "gids": [0] * 40 + [1] * 40,
+    }
+    layers = build_tile_layers([tileset], [ground])
+
+    layer = layers["Ground"]
+    assert isinstance(layer, ChunkedLayer)
+    assert len(layer) == 40
+    assert sorted(layer.chunks) == [(0, 0), (1, 0), (2, 0)]
@@ -0,0 +1,29 @@
+from game.levels.tmx_loader import merge_solid_tiles
+
+
+def test_merge_solid_block_into_one_rect():
+    width, height = 100, 30
+    gids = [1] * (width * height)
+    assert merge_solid_tiles(gids, width, height) == [(0, 0, 100, 30)]
+
+
+def test_merge_covers_every_solid_cell_exactly_once():
+    rows = [
+        "##..##",
+        "##..##",
+        "######",
+        "......",
+        ".###..",
+    ]
+    width, height = len(rows[0]), len(rows)
+    gids = [1 if cell == "#" else 0 for row in rows for cell in row]
+
+    rects = merge_solid_tiles(gids, width, height)
+
+    covered = [0] * (width * height)
+    for column, row, w, h in rects:
+        for r in range(row, row + h):
+            for c in range(column, column + w):
+                covered[r * width + c] += 1
+    assert covered == gids
+    assert len(rects) == 4
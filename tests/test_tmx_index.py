@@ -0,0 +1,62 @@
+from game.levels.tmx_index import read_tmx_header, read_tmx_properties
+
+
+def test_header_matches_example_level():
+    info = read_tmx_header("levels/tmx/example_level.tmx")
+    assert info.level_id == 4
+    assert info.time_limit == 120.0
+    assert info.requires_all_coins is False
+
+
+def test_header_parse_stops_after_properties(tmp_path):
+    tmx_file = tmp_path / "broken.tmx"
+    # Everything after <properties> is malformed; the index must not read it.
+    tmx_file.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<map version="1.10" width="10" height="5">\n'
+        " <properties>\n"
+        '  <property name="level_id" type="int" value="12"/>\n'
+        '  <property name="requires_all_coins" type="bool" value="true"/>\n'
+        " </properties>\n"
+        " <objectgroup <<< not xml\n",
+        encoding="utf-8",
+    )
+    assert read_tmx_properties(str(tmx_file)) == {
+        "level_id": 12,
+        "requires_all_coins": True,
+    }
+    info = read_tmx_header(str(tmx_file))
+    assert info.level_id == 12
+    assert info.time_limit is None
+    assert info.requires_all_coins is True
+
+
+def test_header_skips_editor_settings_before_properties(tmp_path):
+    tmx_file = tmp_path / "tiled.tmx"
+    tmx_file.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<map version="1.10" width="10" height="5">\n'
+        " <editorsettings>\n"
+        '  <export target="tiled.json" format="json"/>\n'
+        " </editorsettings>\n"
+        " <properties>\n"
+        '  <property name="level_id" type="int" value="7"/>\n'
+        " </properties>\n"
+        ' <layer id="1" name="Ground" width="10" height="5"/>\n'
+        "</map>\n",
+        encoding="utf-8",
+    )
+    assert read_tmx_header(str(tmx_file)).level_id == 7
+
+
+def test_header_without_level_id_is_not_indexed(tmp_path):
+    tmx_file = tmp_path / "anonymous.tmx"
+    tmx_file.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<map version="1.10" width="10" height="5">\n'
+        ' <layer id="1" name="Ground" width="10" height="5"/>\n'
+        "</map>\n",
+        encoding="utf-8",
+    )
+    assert read_tmx_properties(str(tmx_file)) == {}
+    assert read_tmx_header(str(tmx_file)) is None